@@ -6,6 +6,10 @@
 import streamlit as st
 from config.settings import PAGE_CONFIG
 from utils.auth import init_session_state, is_logged_in
+from utils.startup import start_warm_up
+
+# 서버 시작 워밍업 (scripts.serve로 실행했다면 이미 시작되어 있음)
+start_warm_up()
 
 # 페이지 설정
 st.set_page_config(**PAGE_CONFIG)
@@ -0,0 +1,4 @@
+"""
+Benchmarks 패키지
+캠퍼스링크 - 성능 측정 스크립트
+"""
@@ -0,0 +1,113 @@
+"""
+피드 렌더링 벤치마크
+게시글마다 st.markdown을 호출하던 기존 방식과 템플릿 한 번 렌더링 방식 비교
+(HTML 생성 + st.markdown 호출 비용 포함, Streamlit 런타임 밖에서 실행)
+
+실행:
+    python -m benchmarks.bench_feed_render [--posts 15] [--repeat 200]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+
+import streamlit as st
+from components.post_card import render_post_list, render_post_list_html
+from utils.formatting import format_time_ago
+
+
+def make_posts(count: int) -> list:
+    """벤치마크용 피드 게시글 생성"""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": 1000 + i,
+            "title": f"게시글 제목 {i} <b>태그</b> & 특수문자",
+            "excerpt": ("본문 미리보기 내용입니다. " * 10)[:150] + "…",
+            "created_at": (now - timedelta(hours=i * 7)).isoformat(),
+            "comment_count": i % 13,
+            "view_count": i * 17,
+            "users": {"nickname": f"닉네임{i}"},
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_render(posts: list) -> list:
+    """기존 방식 - 게시글마다 f-string으로 HTML을 만들어 st.markdown 1회씩 호출 (이스케이프 없음)"""
+    blocks = []
+    for post in posts:
+        time_str = format_time_ago(post['created_at'])
+        author_nickname = post.get('users', {}).get('nickname', '익명') if post.get('users') else '익명'
+        comment_count = post.get('comment_count', 0)
+        view_count = post.get('view_count', 0)
+        blocks.append(f"""
+            <a href="?page=view_post&id={post['id']}" target="_self" style="text-decoration: none; color: inherit;">
+                <div class="post-item">
+                    <div class="post-header">
+                        <div class="profile-image"></div>
+                        <div class="post-meta">
+                            <div class="post-nickname">{author_nickname}</div>
+                            <div class="post-time">{time_str}</div>
+                        </div>
+                        <div class="more-icon">
+                            <svg width="20" height="20" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+                                <circle cx="12" cy="12" r="2" fill="currentColor"/>
+                                <circle cx="12" cy="5" r="2" fill="currentColor"/>
+                                <circle cx="12" cy="19" r="2" fill="currentColor"/>
+                            </svg>
+                        </div>
+                    </div>
+                    <div class="post-title">{post['title']}</div>
+                    <div class="post-content">{post['excerpt']}</div>
+                    <div class="post-stats">
+                        <div class="stat-item">
+                            <svg width="20" height="20" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+                                <path d="M21 15C21 15.5304 20.7893 16.0391 20.4142 16.4142C20.0391 16.7893 19.5304 17 19 17H7L3 21V5C3 4.46957 3.21071 3.96086 3.58579 3.58579C3.96086 3.21071 4.46957 3 5 3H19C19.5304 3 20.0391 3.21071 20.4142 3.58579C20.7893 3.96086 21 4.46957 21 5V15Z" stroke="#666" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+                            </svg>
+                            <span>댓글 {comment_count}</span>
+                        </div>
+                        <div class="stat-item">
+                            <svg width="20" height="20" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+                                <path d="M1 12S5 4 12 4S23 12 23 12S19 20 12 20S1 12 1 12Z" stroke="#666" stroke-width="2"/>
+                                <circle cx="12" cy="12" r="3" stroke="#666" stroke-width="2"/>
+                            </svg>
+                            <span>조회수 {view_count}</span>
+                        </div>
+                    </div>
+                </div>
+            </a>
+            """)
+    return blocks
+
+
+def legacy_render_page(posts: list) -> None:
+    """기존 방식 - 게시글 수만큼 st.markdown 호출"""
+    for block in legacy_render(posts):
+        st.markdown(block, unsafe_allow_html=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="피드 렌더링 벤치마크")
+    parser.add_argument("--posts", type=int, default=15, help="페이지당 게시글 수")
+    parser.add_argument("--repeat", type=int, default=200, help="반복 횟수")
+    args = parser.parse_args()
+
+    posts = make_posts(args.posts)
+
+    legacy_blocks = legacy_render(posts)
+    templated_html = render_post_list_html(posts)
+
+    legacy_seconds = timeit.timeit(lambda: legacy_render_page(posts), number=args.repeat) / args.repeat
+    templated_seconds = timeit.timeit(lambda: render_post_list(posts), number=args.repeat) / args.repeat
+
+    print(f"게시글 {args.posts}개, {args.repeat}회 평균")
+    print(f"{'방식':<10}{'시간(ms)':>12}{'요소 수':>10}{'HTML(bytes)':>14}")
+    print(f"{'기존':<10}{legacy_seconds * 1000:>12.3f}{len(legacy_blocks):>10}"
+          f"{sum(len(block.encode()) for block in legacy_blocks):>14}")
+    print(f"{'템플릿':<10}{templated_seconds * 1000:>12.3f}{1:>10}{len(templated_html.encode()):>14}")
+    print(f"속도 향상: {legacy_seconds / templated_seconds:.2f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+페이지 벤치마크
+시드된 로컬 SQLite 백엔드에서 각 페이지를 AppTest로 실행하고 쿼리 수/응답 크기/HTML 크기/실행 시간을 예산과 비교
+(예산 초과 시 종료 코드 1)
+
+실행:
+    python -m benchmarks.bench_pages [--runs 5] [--page 3_home] [--update-budgets]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from scripts.seed_local_db import SEED_PASSWORD, seed_local_db
+from utils.feed_cache import get_feed_cache
+from utils.local_backend import LocalClient
+from utils.supabase_client import get_service_client, reset_supabase_client
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BUDGETS_PATH = Path(__file__).resolve().parent / "page_budgets.json"
+
+# (페이지, 로그인 필요 여부)
+PAGES = [
+    ("1_login", False),
+    ("2_signup", False),
+    ("3_home", True),
+    ("4_add_school", True),
+    ("6_view_post", True),
+    ("7_write_post", True),
+    ("8_mypage", True),
+]
+
+# 측정 항목 (예산 키)
+METRICS = ("wall_ms", "queries", "bytes_returned", "html_bytes")
+
+# --update-budgets 시 측정값에 곱하는 여유 배율 (쿼리 수는 정확히 고정)
+BUDGET_HEADROOM = {"wall_ms": 2.0, "queries": 1.0, "bytes_returned": 1.5, "html_bytes": 1.2}
+
+# 실행 시간 예산에 더하는 고정 여유 (ms) - 수십 ms짜리 페이지의 타이머/스케줄링 잡음 흡수
+# (측정값 × 2 + 20ms이므로 실행 시간이 몇 배로 늘어나는 회귀는 잡힘)
+WALL_MS_BUDGET_SLACK = 20
+
+
+class QueryMeter:
+    """
+    로컬 클라이언트의 쿼리 실행 횟수와 응답 크기 측정
+
+    세션마다 클라이언트가 따로 만들어지므로 LocalClient 클래스의 실행 메서드를 감쌉니다.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.bytes_returned = 0
+        self._lock = threading.Lock()
+        for name in ("_execute", "_execute_rpc"):
+            setattr(LocalClient, name, self._wrap(getattr(LocalClient, name)))
+
+    def _wrap(self, execute):
+        def metered(client, builder):
+            response = execute(client, builder)
+            size = len(json.dumps(response.data, ensure_ascii=False, default=str).encode())
+            # 동시 조회 스레드에서도 호출되므로 잠금 안에서 합산
+            with self._lock:
+                self.queries += 1
+                self.bytes_returned += size
+            return response
+        return metered
+
+    def reset(self) -> None:
+        self.queries = 0
+        self.bytes_returned = 0
+
+
+def setup_backend(db_path: str) -> tuple[LocalClient, QueryMeter]:
+    """시드된 로컬 DB를 Supabase 클라이언트 백엔드로 설정"""
+    os.environ["SUPABASE_BACKEND"] = "sqlite"
+    os.environ["LOCAL_DB_PATH"] = db_path
+    seed_local_db(LocalClient(db_path), users=20, schools=10, posts=1000, comments=3000)
+
+    reset_supabase_client()
+    return get_service_client(), QueryMeter()
+
+
+def login_session(client: LocalClient) -> dict:
+    """로그인 직후와 같은 session_state 값 생성"""
+    email = "user0@example.com"
+    # 전역 클라이언트에 로그인 세션이 남으면 비로그인 페이지도 세션 복원으로 로그인 상태가 되므로 별도 클라이언트 사용
+    auth_client = LocalClient(os.environ["LOCAL_DB_PATH"])
+    auth_response = auth_client.auth.sign_in_with_password({"email": email, "password": SEED_PASSWORD})
+    user_data = client.table("users").select("*").eq("email", email).execute().data[0]
+    return {
+        "logged_in": True,
+        "user": auth_response.user,
+        "access_token": auth_response.session.access_token,
+        "refresh_token": auth_response.session.refresh_token,
+        "user_data": user_data,
+    }
+
+
+def html_bytes(app: AppTest) -> int:
+    """렌더링된 마크다운/HTML 본문 크기 합계"""
+    return sum(len((element.value or "").encode()) for element in app.markdown)
+
+
+def bench_page(page: str, session: dict, query_params: dict, meter: QueryMeter, runs: int) -> dict:
+    """
+    페이지 1개 측정
+
+    쿼리 수/응답 크기/HTML 크기는 캐시를 비운 첫 실행 기준,
+    실행 시간은 첫 실행과 이후 재실행(rerun)의 중앙값입니다.
+    """
+    get_feed_cache().clear()
+    app = AppTest.from_file(str(PROJECT_ROOT / "pages" / f"{page}.py"), default_timeout=30)
+    for key, value in session.items():
+        app.session_state[key] = value
+    for key, value in query_params.items():
+        app.query_params[key] = value
+
+    timings = []
+    result = {}
+    for run in range(runs):
+        meter.reset()
+        start = time.perf_counter()
+        app.run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+        if app.exception:
+            raise RuntimeError(f"{page} 실행 중 예외: {app.exception[0].message}")
+        if run == 0:
+            result = {"queries": meter.queries, "bytes_returned": meter.bytes_returned, "html_bytes": html_bytes(app)}
+
+    result["wall_ms"] = round(statistics.median(timings), 1)
+    return result
+
+
+def check_budgets(results: dict, budgets: dict) -> list[str]:
+    """예산 초과 항목 목록"""
+    failures = []
+    for page, measured in results.items():
+        for metric in METRICS:
+            budget = budgets.get(page, {}).get(metric)
+            if budget is not None and measured[metric] > budget:
+                failures.append(f"{page}.{metric}: {measured[metric]} > 예산 {budget}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="페이지 벤치마크 (예산 초과 시 실패)")
+    parser.add_argument("--runs", type=int, default=5, help="페이지당 실행 횟수")
+    parser.add_argument("--page", action="append", help="측정할 페이지 (여러 번 지정 가능, 기본값: 전체)")
+    parser.add_argument("--update-budgets", action="store_true", help="측정값으로 예산 파일 갱신")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        client, meter = setup_backend(os.path.join(temp_dir, "bench.db"))
+        session = login_session(client)
+        user_school_ids = [
+            row["school_id"]
+            for row in client.table("user_schools").select("school_id").eq("user_id", session["user_data"]["id"]).execute().data
+        ]
+        post = client.table("posts").select("id").in_("school_id", user_school_ids).limit(1).execute().data[0]
+        page_params = {"6_view_post": {"id": str(post["id"])}}
+
+        results = {}
+        for page, needs_login in PAGES:
+            if args.page and page not in args.page:
+                continue
+            results[page] = bench_page(page, session if needs_login else {}, page_params.get(page, {}), meter, args.runs)
+
+    print(f"{'page':<16}" + "".join(f"{metric:>16}" for metric in METRICS))
+    for page, measured in results.items():
+        print(f"{page:<16}" + "".join(f"{measured[metric]:>16}" for metric in METRICS))
+
+    budgets = json.loads(BUDGETS_PATH.read_text(encoding="utf-8")) if BUDGETS_PATH.exists() else {}
+
+    if args.update_budgets:
+        for page, measured in results.items():
+            budgets[page] = {
+                metric: round(measured[metric] * BUDGET_HEADROOM[metric], 1 if metric == "wall_ms" else None)
+                for metric in METRICS
+            }
+            budgets[page]["wall_ms"] = round(budgets[page]["wall_ms"] + WALL_MS_BUDGET_SLACK, 1)
+        BUDGETS_PATH.write_text(json.dumps(budgets, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"\n예산 파일 갱신: {BUDGETS_PATH.name}")
+        return 0
+
+    failures = check_budgets(results, budgets)
+    if failures:
+        print("\n예산 초과:", file=sys.stderr)
+        for failure in failures:
+            print(f"  {failure}", file=sys.stderr)
+        return 1
+
+    print("\n모든 페이지가 예산 이내입니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
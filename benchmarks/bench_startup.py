@@ -0,0 +1,165 @@
+"""
+서버 시작 벤치마크
+새 프로세스에서 app.py 진입 경로의 임포트 시간, 워밍업 시간, 첫 실행 시간(워밍업 전/후)을 측정하여 예산과 비교
+(예산 초과 시 종료 코드 1)
+
+실행:
+    python -m benchmarks.bench_startup [--runs 5] [--update-budgets]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BUDGETS_PATH = Path(__file__).resolve().parent / "startup_budgets.json"
+
+# app.py 임포트 시점에 불러오면 안 되는 무거운 모듈 (첫 클라이언트 생성 시 불러옴)
+DEFERRED_MODULES = ("supabase", "postgrest", "supabase_auth", "gotrue", "httpx", "dotenv")
+
+# 측정 항목 (예산 키)
+METRICS = ("import_ms", "eager_modules", "warm_up_ms", "cold_run_ms", "warm_run_ms")
+
+# --update-budgets 시 측정값에 곱하는 여유 배율 (지연 임포트 위반 수는 정확히 고정)
+BUDGET_HEADROOM = {"import_ms": 3.0, "eager_modules": 1.0, "warm_up_ms": 3.0, "cold_run_ms": 3.0, "warm_run_ms": 3.0}
+
+# 시간 예산 하한 (ms) - 머신 성능 차이로 인한 오탐 방지
+MS_BUDGET_FLOOR = 100
+
+
+def probe_import() -> dict:
+    """app.py가 임포트하는 프로젝트 모듈의 임포트 시간 (streamlit 자체 임포트 시간 제외)"""
+    import streamlit  # noqa: F401
+
+    start = time.perf_counter()
+    import config.settings  # noqa: F401
+    import utils.auth  # noqa: F401
+    import utils.startup  # noqa: F401
+    elapsed = (time.perf_counter() - start) * 1000
+
+    return {
+        "import_ms": round(elapsed, 1),
+        "eager_modules": sum(module in sys.modules for module in DEFERRED_MODULES),
+    }
+
+
+def probe_boot(warm: bool) -> dict:
+    """app.py 첫 실행 시간 (warm=True면 워밍업을 먼저 끝낸 뒤 측정)"""
+    from streamlit.testing.v1 import AppTest
+    from utils.startup import warm_up
+
+    result = {}
+    if warm:
+        start = time.perf_counter()
+        timings = warm_up()
+        result["warm_up_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        failed = [name for name, elapsed in timings.items() if elapsed is None]
+        if failed:
+            raise RuntimeError(f"워밍업 단계 실패: {', '.join(failed)}")
+
+    app = AppTest.from_file(str(PROJECT_ROOT / "app.py"), default_timeout=30)
+    start = time.perf_counter()
+    app.run()
+    result["warm_run_ms" if warm else "cold_run_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+    if app.exception:
+        raise RuntimeError(f"app.py 실행 중 예외: {app.exception[0].message}")
+    return result
+
+
+def run_probe(probe: str, env: dict) -> dict:
+    """새 Python 프로세스에서 측정 1회 실행"""
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--probe", probe],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{probe} 측정 실패:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def measure(runs: int, db_path: str) -> dict:
+    """측정 항목별 중앙값 (임포트 위반 수는 최댓값)"""
+    env = {**os.environ, "SUPABASE_BACKEND": "sqlite", "LOCAL_DB_PATH": db_path}
+    env.pop("SUPABASE_INSTRUMENTATION", None)
+
+    samples = {metric: [] for metric in METRICS}
+    for _ in range(runs):
+        for probe in ("import", "cold", "warm"):
+            for metric, value in run_probe(probe, env).items():
+                samples[metric].append(value)
+
+    return {
+        metric: max(values) if metric == "eager_modules" else round(statistics.median(values), 1)
+        for metric, values in samples.items()
+    }
+
+
+def check_budgets(measured: dict, budgets: dict) -> list[str]:
+    """예산 초과 항목 목록"""
+    return [
+        f"{metric}: {measured[metric]} > 예산 {budgets[metric]}"
+        for metric in METRICS
+        if budgets.get(metric) is not None and measured[metric] > budgets[metric]
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="서버 시작 벤치마크 (예산 초과 시 실패)")
+    parser.add_argument("--runs", type=int, default=5, help="측정 반복 횟수 (매번 새 프로세스)")
+    parser.add_argument("--update-budgets", action="store_true", help="측정값으로 예산 파일 갱신")
+    parser.add_argument("--probe", choices=("import", "cold", "warm"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe:
+        result = probe_import() if args.probe == "import" else probe_boot(warm=args.probe == "warm")
+        print(json.dumps(result))
+        return 0
+
+    from scripts.seed_local_db import seed_local_db
+    from utils.local_backend import LocalClient
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "bench.db")
+        seed_local_db(LocalClient(db_path), users=5, schools=5, posts=100, comments=100)
+        measured = measure(args.runs, db_path)
+
+    for metric in METRICS:
+        print(f"{metric:<16}{measured[metric]:>12}")
+
+    if args.update_budgets:
+        budgets = {
+            metric: round(measured[metric] * BUDGET_HEADROOM[metric], 1 if metric.endswith("_ms") else None)
+            for metric in METRICS
+        }
+        for metric in METRICS:
+            if metric.endswith("_ms"):
+                budgets[metric] = max(budgets[metric], MS_BUDGET_FLOOR)
+        BUDGETS_PATH.write_text(json.dumps(budgets, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"\n예산 파일 갱신: {BUDGETS_PATH.name}")
+        return 0
+
+    budgets = json.loads(BUDGETS_PATH.read_text(encoding="utf-8")) if BUDGETS_PATH.exists() else {}
+    failures = check_budgets(measured, budgets)
+    if failures:
+        print("\n예산 초과:", file=sys.stderr)
+        for failure in failures:
+            print(f"  {failure}", file=sys.stderr)
+        return 1
+
+    print("\n시작 시간이 예산 이내입니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
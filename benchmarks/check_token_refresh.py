@@ -0,0 +1,143 @@
+"""
+토큰 갱신 회귀 확인
+로컬 SQLite 백엔드에서 로그인한 세션과 같은 쿠키로 새로고침해 복원한 세션을 함께 두고
+백그라운드 갱신을 한 번 일으킨 뒤, 리프레시 토큰이 한 번만 갱신되어 두 세션 모두 새 토큰을 쓰는지 확인
+(리프레시 토큰을 다시 쓰면 로컬 백엔드도 Supabase처럼 거절하므로 재사용이 있으면 실패, 종료 코드 1)
+
+실행:
+    python -m benchmarks.check_token_refresh
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+
+# 백그라운드 갱신을 기다리는 최대 시간 (초)
+REFRESH_WAIT_SECONDS = 10
+
+
+def page_script():
+    """로그인 상태 확인만 하는 페이지 (session_state의 login_email이 있으면 로그인)"""
+    import streamlit as st
+    from scripts.seed_local_db import SEED_PASSWORD
+    from utils.auth import is_logged_in, login_user
+
+    if not is_logged_in() and st.session_state.get("login_email"):
+        login_user(st.session_state.login_email, SEED_PASSWORD)
+
+
+def run_as(app: AppTest, session_id: str) -> None:
+    """AppTest를 지정한 Streamlit 세션 ID로 실행 (AppTest는 모든 실행에 같은 세션 ID를 사용)"""
+    from streamlit.runtime.scriptrunner import ScriptRunner
+
+    original_init = ScriptRunner.__init__
+
+    def init(self, *args, **kwargs):
+        kwargs["session_id"] = session_id
+        original_init(self, *args, **kwargs)
+
+    ScriptRunner.__init__ = init
+    try:
+        app.run()
+    finally:
+        ScriptRunner.__init__ = original_init
+
+    if app.exception:
+        raise RuntimeError(f"{session_id} 실행 중 예외: {app.exception[0].message}")
+
+
+def use_cookies(cookies: dict) -> None:
+    """st.context.cookies가 지정한 쿠키를 반환하도록 설정 (AppTest에는 브라우저 쿠키가 없음)"""
+    from streamlit.runtime.context import ContextProxy
+
+    ContextProxy.cookies = property(lambda self: cookies)
+
+
+def check(temp_dir: str) -> list[str]:
+    """문제 목록 (비어 있으면 통과)"""
+    os.environ["SUPABASE_BACKEND"] = "sqlite"
+    os.environ["LOCAL_DB_PATH"] = os.path.join(temp_dir, "check.db")
+    os.environ["SESSION_STORE_PATH"] = os.path.join(temp_dir, "sessions.db")
+
+    from config.settings import SESSION_COOKIE_NAME
+    from scripts.seed_local_db import seed_local_db
+    from utils.local_backend import ACCESS_TOKEN_TTL_SECONDS, LocalClient
+    from utils.session_store import get_session_store
+    from utils.token_refresher import get_token_refresher
+
+    db = LocalClient(os.environ["LOCAL_DB_PATH"])
+    seed_local_db(db, users=1, schools=1, posts=1, comments=1)
+    email = db.table("users").select("email").limit(1).execute().data[0]["email"]
+
+    # 로그인 직후 등록되는 토큰만 1초 뒤에 갱신되도록 설정 (갱신된 토큰은 기본 설정으로 다시 예약)
+    refresher = get_token_refresher()
+    default_ahead, default_jitter = refresher.ahead_seconds, refresher.jitter_seconds
+    refresher.ahead_seconds, refresher.jitter_seconds = ACCESS_TOKEN_TTL_SECONDS - 1, 0
+    use_cookies({})
+
+    tab = AppTest.from_function(page_script, default_timeout=30)
+    tab.session_state["login_email"] = email
+    run_as(tab, "tab")
+    refresher.ahead_seconds, refresher.jitter_seconds = default_ahead, default_jitter
+    if not tab.session_state["logged_in"]:
+        return ["로그인 실패"]
+
+    # 새로고침: 같은 쿠키로 새 Streamlit 세션에서 복원
+    store = get_session_store()
+    stored_session_id = tab.session_state["_stored_session_id"]
+    use_cookies({SESSION_COOKIE_NAME: store.sign(stored_session_id)})
+    reloaded = AppTest.from_function(page_script, default_timeout=30)
+    run_as(reloaded, "reloaded")
+    if not reloaded.session_state["logged_in"]:
+        return ["새로고침 후 복원 실패"]
+
+    first_token = tab.session_state["refresh_token"]
+    deadline = time.monotonic() + REFRESH_WAIT_SECONDS
+    while store.load(stored_session_id)["refresh_token"] == first_token:
+        if time.monotonic() > deadline:
+            return ["백그라운드 갱신이 일어나지 않음"]
+        time.sleep(0.1)
+    # 다른 세션용 갱신이 있었다면 끝날 때까지 대기
+    time.sleep(1)
+
+    run_as(tab, "tab")
+    run_as(reloaded, "reloaded")
+
+    problems = []
+    newest = store.load(stored_session_id)["refresh_token"]
+    for name, app in (("기존 탭", tab), ("새로고침한 탭", reloaded)):
+        if app.session_state["refresh_token"] != newest:
+            problems.append(f"{name}이 저장소의 새 토큰을 반영하지 않음")
+
+    revoked = db._connection().execute(
+        "SELECT revoked FROM auth_refresh_tokens WHERE token = ?", (newest,)
+    ).fetchone()
+    if revoked is None or revoked["revoked"]:
+        problems.append("저장소의 리프레시 토큰이 폐기됨 (같은 토큰을 두 번 갱신)")
+
+    tracked = [session_id for session_id in refresher._sessions if session_id in ("tab", "reloaded", stored_session_id)]
+    if tracked != [stored_session_id]:
+        problems.append(f"갱신 담당 항목이 저장소 세션 하나가 아님: {tracked}")
+
+    return problems
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        problems = check(temp_dir)
+
+    if problems:
+        print("토큰 갱신 회귀:", file=sys.stderr)
+        for problem in problems:
+            print(f"  {problem}", file=sys.stderr)
+        return 1
+
+    print("새로고침 후 백그라운드 갱신: 리프레시 토큰이 한 번만 갱신되었습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
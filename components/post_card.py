@@ -0,0 +1,99 @@
+"""
+게시글 카드 컴포넌트
+피드의 게시글 카드를 컴파일된 템플릿으로 만들어 목록 전체를 한 번에 렌더링
+"""
+
+from datetime import datetime, timezone
+from html import escape
+
+import streamlit as st
+from utils.formatting import format_time_ago
+
+# 아이콘 SVG (모듈 로드 시 한 번만 생성)
+_MORE_ICON = (
+    '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">'
+    '<circle cx="12" cy="12" r="2" fill="currentColor"/>'
+    '<circle cx="12" cy="5" r="2" fill="currentColor"/>'
+    '<circle cx="12" cy="19" r="2" fill="currentColor"/>'
+    '</svg>'
+)
+
+_COMMENT_ICON = (
+    '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">'
+    '<path d="M21 15C21 15.5304 20.7893 16.0391 20.4142 16.4142C20.0391 16.7893 19.5304 17 19 17H7L3 21V5C3 4.46957 '
+    '3.21071 3.96086 3.58579 3.58579C3.96086 3.21071 4.46957 3 5 3H19C19.5304 3 20.0391 3.21071 20.4142 3.58579C20.7893 '
+    '3.96086 21 4.46957 21 5V15Z" stroke="#666" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>'
+    '</svg>'
+)
+
+_VIEW_ICON = (
+    '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">'
+    '<path d="M1 12S5 4 12 4S23 12 23 12S19 20 12 20S1 12 1 12Z" stroke="#666" stroke-width="2"/>'
+    '<circle cx="12" cy="12" r="3" stroke="#666" stroke-width="2"/>'
+    '</svg>'
+)
+
+def _escape_block(text: str) -> str:
+    """HTML 이스케이프 + 줄바꿈을 문자 참조로 변환 (빈 줄이 마크다운 HTML 블록을 끊지 않도록)"""
+    return escape(text).replace('\r\n', '\n').replace('\n', '&#10;')
+
+
+def render_post_card_html(post: dict, now=None) -> str:
+    """
+    게시글 카드 1개의 HTML 생성 (사용자 입력 값은 모두 HTML 이스케이프)
+
+    Args:
+        post: 피드 게시글 (id, title, excerpt, created_at, comment_count, view_count, users)
+        now: 게시 시간 표시 기준 시각 (UTC)
+
+    Returns:
+        str: 게시글 카드 HTML
+    """
+    author = post.get('users') or {}
+    post_id = escape(str(post['id']))
+    nickname = escape(author.get('nickname') or '익명')
+    time_str = escape(format_time_ago(post['created_at'], now))
+    title = _escape_block(post.get('title') or '')
+    excerpt = _escape_block(post.get('excerpt') or '')
+    comment_count = int(post.get('comment_count') or 0)
+    view_count = int(post.get('view_count') or 0)
+
+    # 카드 템플릿 - 인접한 f-string 조각은 컴파일 시 하나로 합쳐지고 아이콘은 미리 만든 상수 사용
+    # 들여쓰기/빈 줄이 있으면 마크다운이 코드 블록으로 해석하므로 한 줄로 생성
+    return (
+        f'<a href="?page=view_post&amp;id={post_id}" target="_self" style="text-decoration: none; color: inherit;">'
+        f'<div class="post-item">'
+        f'<div class="post-header">'
+        f'<div class="profile-image"></div>'
+        f'<div class="post-meta">'
+        f'<div class="post-nickname">{nickname}</div>'
+        f'<div class="post-time">{time_str}</div>'
+        f'</div>'
+        f'<div class="more-icon">{_MORE_ICON}</div>'
+        f'</div>'
+        f'<div class="post-title">{title}</div>'
+        f'<div class="post-content">{excerpt}</div>'
+        f'<div class="post-stats">'
+        f'<div class="stat-item">{_COMMENT_ICON}<span>댓글 {comment_count}</span></div>'
+        f'<div class="stat-item">{_VIEW_ICON}<span>조회수 {view_count}</span></div>'
+        f'</div>'
+        f'</div>'
+        f'</a>'
+    )
+
+
+def render_post_list_html(posts: list) -> str:
+    """게시글 목록 전체를 하나의 HTML 블록으로 생성"""
+    now = datetime.now(timezone.utc)
+    return '<div class="post-list">' + ''.join([render_post_card_html(post, now) for post in posts]) + '</div>'
+
+
+def render_post_list(posts: list):
+    """
+    게시글 목록 렌더링 - 게시글 수와 관계없이 st.markdown 1회
+
+    Example:
+        >>> posts, next_cursor = get_posts_for_school(school_id)
+        >>> render_post_list(posts)
+    """
+    st.markdown(render_post_list_html(posts), unsafe_allow_html=True)
@@ -0,0 +1,102 @@
+"""
+쿼리 디버그 패널
+쿼리 계측이 켜져 있을 때 ?debug=queries 로 열 수 있는 숨김 패널 - 재실행별 쿼리 목록과 중복/N+1 의심 쿼리 표시
+"""
+
+from collections import Counter
+
+import streamlit as st
+from utils.instrumentation import get_query_log, instrumentation_enabled
+from utils.admission import get_login_admission_metrics
+from utils.resilience import get_resilience_metrics
+
+# 같은 함수에서 같은 테이블을 이 횟수 이상 조회하면 N+1 의심으로 표시
+N_PLUS_ONE_THRESHOLD = 3
+
+
+def _debug_panel_requested() -> bool:
+    """?debug=queries 로 한 번 열면 세션 동안 계속 표시"""
+    if st.query_params.get("debug") == "queries":
+        st.session_state._query_debug = True
+    return st.session_state.get("_query_debug", False)
+
+
+def render_query_debug_panel():
+    """
+    쿼리 디버그 패널 렌더링 (계측 비활성화 또는 ?debug=queries 미지정 시 표시하지 않음)
+
+    페이지 렌더링이 끝난 뒤 호출해야 이번 재실행의 쿼리가 모두 포함됩니다.
+
+    Example:
+        >>> def main():
+        ...     render_header()
+        ...     render_content()
+        ...     render_query_debug_panel()
+    """
+    if not instrumentation_enabled() or not _debug_panel_requested():
+        return
+
+    reruns = get_query_log()
+    if not reruns:
+        return
+
+    current = reruns[-1]
+    total_bytes = sum(record.payload_bytes for record in current.queries)
+
+    with st.expander(
+        f"🔍 쿼리 {len(current.queries)}회 · {current.total_ms:.1f}ms · {total_bytes:,} bytes",
+        expanded=False,
+    ):
+        st.dataframe(
+            [
+                {
+                    "함수": record.function,
+                    "요청": f"{record.method} {record.path}",
+                    "쿼리": record.query,
+                    "ms": record.elapsed_ms,
+                    "행": record.rows,
+                    "bytes": record.payload_bytes,
+                    "오류": record.error or "",
+                }
+                for record in current.queries
+            ],
+            use_container_width=True,
+        )
+
+        duplicates = Counter((record.method, record.path, record.query) for record in current.queries)
+        for (method, path, query), count in duplicates.items():
+            if count > 1:
+                st.warning(f"동일 쿼리 {count}회: {method} {path}?{query}")
+
+        per_function = Counter((record.function, record.path) for record in current.queries)
+        for (function, path), count in per_function.items():
+            if count >= N_PLUS_ONE_THRESHOLD:
+                st.warning(f"N+1 의심: {function}에서 {path} {count}회 조회")
+
+        st.caption("최근 재실행")
+        st.dataframe(
+            [
+                {
+                    "페이지": rerun.page,
+                    "쿼리 수": len(rerun.queries),
+                    "ms": round(rerun.total_ms, 1),
+                    "bytes": sum(record.payload_bytes for record in rerun.queries),
+                }
+                for rerun in reversed(reruns)
+            ],
+            use_container_width=True,
+        )
+
+        resilience_metrics = get_resilience_metrics()
+        if resilience_metrics:
+            st.caption(
+                "재시도/서킷 지표 (프로세스 전체): "
+                + ", ".join(f"{name} {count}" for name, count in sorted(resilience_metrics.items()))
+            )
+
+        login_metrics = get_login_admission_metrics()
+        if login_metrics:
+            st.caption(
+                "로그인 허용 제어 지표 (프로세스 전체): "
+                + ", ".join(f"{name} {count}" for name, count in sorted(login_metrics.items()))
+            )
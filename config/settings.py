@@ -25,6 +25,87 @@ POST_CATEGORIES = [
     "기타"
 ]
 
+# 홈 화면 게시글 페이지 크기 (더보기 1회당 불러오는 게시글 수)
+FEED_PAGE_SIZE = 15
+
+# 피드 캐시 (프로세스 전역, 모든 세션 공유)
+FEED_CACHE_TTL_SECONDS = 30
+FEED_CACHE_MAX_ENTRIES = 512
+
+# 조회수 쓰기 지연 (초 단위 반영 주기, 0이면 조회 시마다 즉시 반영)
+VIEW_COUNT_FLUSH_SECONDS = 5
+VIEW_COUNT_MAX_PENDING = 500
+
+# 조회수 반영 실패 시 재시도 간격 상한 (초) - 실패할 때마다 반영 주기의 2배씩 늘림
+VIEW_COUNT_MAX_BACKOFF_SECONDS = 300
+
+# 쿼리 계측 (SUPABASE_INSTRUMENTATION=1 환경변수로 활성화, 세션별로 보관할 최근 재실행 수)
+QUERY_LOG_MAX_RERUNS = 20
+
+# 세션별 Supabase 클라이언트 풀 (최대 클라이언트 수, 유휴 클라이언트 제거 시간 초)
+SUPABASE_CLIENT_POOL_SIZE = 200
+SUPABASE_CLIENT_IDLE_SECONDS = 1800
+
+# 공유 HTTP 연결 풀 (HTTP/2는 h2 패키지가 설치된 경우에만 사용)
+SUPABASE_HTTP2 = True
+SUPABASE_HTTP_MAX_CONNECTIONS = 100
+SUPABASE_HTTP_MAX_KEEPALIVE = 20
+SUPABASE_HTTP_KEEPALIVE_SECONDS = 30
+SUPABASE_HTTP_TIMEOUT_SECONDS = 30
+
+# 독립 쿼리 동시 조회에 사용하는 최대 스레드 수 (프로세스 전체)
+FETCH_MAX_THREADS = 32
+
+# 조회 재시도 (읽기 요청만, 전체 지터 지수 백오프 - 시도 횟수는 첫 시도 포함)
+SUPABASE_RETRY_ATTEMPTS = 3
+SUPABASE_RETRY_BASE_DELAY_SECONDS = 0.1
+SUPABASE_RETRY_MAX_DELAY_SECONDS = 1.0
+
+# 서킷 브레이커 (연속 일시 오류 횟수, 차단 후 재시도까지 대기 시간 초)
+SUPABASE_CIRCUIT_FAILURE_THRESHOLD = 5
+SUPABASE_CIRCUIT_RESET_SECONDS = 30
+
+# 서킷 차단 중 대신 제공할 최근 조회 결과 (최대 개수, 최대 보관 시간 초)
+SUPABASE_STALE_MAX_ENTRIES = 1000
+SUPABASE_STALE_MAX_AGE_SECONDS = 600
+
+# 헤지 요청 - 읽기 요청이 이 시간(ms) 안에 끝나지 않으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용 (0: 사용 안 함)
+SUPABASE_HEDGE_AFTER_MS = 0
+
+# 사용자 프로필 캐시 (로그인/세션 복원 시 users 조회 대신 사용, 프로세스 전체)
+PROFILE_CACHE_TTL_SECONDS = 300
+PROFILE_CACHE_MAX_ENTRIES = 10000
+
+# 비대칭 서명 키(JWKS) 캐시 시간 (초) - HS256 토큰은 SUPABASE_JWT_SECRET 환경변수로 검증
+JWKS_CACHE_SECONDS = 600
+
+# 액세스 토큰 백그라운드 갱신 (만료 몇 초 전에 갱신할지, 세션별 갱신 시각을 분산하는 최대 지터 초, 실패 시 재시도 간격 초)
+TOKEN_REFRESH_AHEAD_SECONDS = 300
+TOKEN_REFRESH_JITTER_SECONDS = 120
+TOKEN_REFRESH_RETRY_SECONDS = 30
+
+# 서버 측 세션 저장소 (새로고침 시 서명된 쿠키로 로그인 상태 복원, 보관 기간 초)
+SESSION_COOKIE_NAME = "campuslink_session"
+SESSION_STORE_TTL_SECONDS = 7 * 24 * 3600
+
+# 로그인 허용 제어 (토큰 버킷: 최대 연속 시도 수, 시도 1회가 다시 채워지는 시간 초 - 이메일별/클라이언트 IP별)
+LOGIN_EMAIL_BURST = 5
+LOGIN_EMAIL_REFILL_SECONDS = 30
+LOGIN_IP_BURST = 30
+LOGIN_IP_REFILL_SECONDS = 2
+
+# 클라이언트 IP별 한도 사용 여부 - Streamlit은 TCP 연결 상대 주소를 IP로 사용하므로 리버스 프록시 뒤에서는
+# 모든 사용자가 프록시 IP 하나로 묶여 전체 로그인이 IP 한도에 걸림 (서버가 직접 노출된 경우에만 True)
+LOGIN_IP_LIMIT_ENABLED = False
+LOGIN_LIMITER_MAX_KEYS = 100000
+
+# 동시에 진행할 수 있는 로그인(Auth 호출) 수와 빈 자리를 기다리는 최대 시간 (초) - 초과 시 바로 재시도 안내
+LOGIN_MAX_CONCURRENT = 16
+LOGIN_QUEUE_WAIT_SECONDS = 0.2
+
+# 홈 화면 학교 탭 지연 로딩 (True: 선택된 학교만 조회, False: 모든 탭을 매번 조회)
+HOME_LAZY_TABS = True
+
 # 페이지 경로
 PAGES = {
     "login": "pages/1_login.py",
@@ -9,6 +9,7 @@ from utils.auth import init_session_state, is_logged_in, login_user
 from utils.dialogs import show_error, show_success
 from utils.supabase_client import get_supabase_client
 from utils.styles import hide_sidebar
+from components.query_debug_panel import render_query_debug_panel
 
 # ============================================
 # 페이지 설정
@@ -416,3 +417,5 @@ if login_button:
                 show_error("이메일 또는 비밀번호가 올바르지 않습니다.")
         except Exception as e:
             show_error(f"로그인 오류: {str(e)}")
+
+render_query_debug_panel()
@@ -9,6 +9,7 @@ import time
 from utils.supabase_client import get_supabase_client
 from utils.dialogs import show_error, show_success
 from utils.styles import hide_sidebar
+from components.query_debug_panel import render_query_debug_panel
 
 # ============================================
 # 페이지 설정
@@ -818,3 +819,5 @@ if signup_btn:
         
         except Exception as e:
             st.error(f"회원가입 중 오류가 발생했습니다: {str(e)}")
+
+render_query_debug_panel()
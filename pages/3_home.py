@@ -4,11 +4,17 @@
 """
 
 import streamlit as st
-from datetime import datetime, timezone
-from config.settings import PAGE_CONFIG, POST_CATEGORIES
+from config.settings import PAGE_CONFIG, POST_CATEGORIES, HOME_LAZY_TABS, FEED_PAGE_SIZE
 from utils.auth import require_login, logout_user, get_current_user
 from utils.supabase_client import get_supabase_client
 from utils.styles import hide_sidebar
+from utils.feed_cache import get_feed_cache, FeedCache
+from utils.single_flight import execute_shared
+from utils.assets import get_banner_html
+from components.post_card import render_post_list
+from utils import repository
+from utils.concurrent_fetch import fetch_all
+from components.query_debug_panel import render_query_debug_panel
 
 # 페이지 설정 - centered로 변경
 st.set_page_config(
@@ -20,52 +26,6 @@ st.set_page_config(
 # 사이드바 숨김
 hide_sidebar()
 
-def format_time_ago(created_at_str):
-    """
-    게시 시간을 '~전' 형식으로 포맷팅
-    - 오늘: 1분 전~59분 전, 1시간 전~23시간 전
-    - 1일 전~6일 전 (자정 기준으로 날짜 변경 시 1일 전)
-    - 7일 이상: YY.MM.DD. 형식
-    """
-    try:
-        # ISO 형식 파싱
-        created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
-        
-        # 한국 시간으로 변환 (UTC+9)
-        from datetime import timedelta
-        kst_now = now + timedelta(hours=9)
-        kst_created = created_at + timedelta(hours=9)
-        
-        # 자정 기준으로 날짜 차이 계산
-        kst_now_date = kst_now.date()
-        kst_created_date = kst_created.date()
-        days_diff = (kst_now_date - kst_created_date).days
-        
-        # 오늘 작성된 글 (날짜가 같은 경우)
-        if days_diff == 0:
-            # 시간 차이 계산
-            diff = now - created_at
-            
-            # 분 단위 (1분~59분)
-            minutes = int(diff.total_seconds() / 60)
-            if minutes < 60:
-                return f"{minutes}분 전" if minutes > 0 else "방금 전"
-            
-            # 시간 단위 (1시간~23시간)
-            hours = int(diff.total_seconds() / 3600)
-            return f"{hours}시간 전"
-        
-        # 1일 전~6일 전 (자정이 지난 경우)
-        if 1 <= days_diff <= 6:
-            return f"{days_diff}일 전"
-        
-        # 7일 이상: YY.MM.DD. 형식
-        return kst_created.strftime('%y.%m.%d.')
-        
-    except Exception as e:
-        return created_at_str
-
 def get_user_schools_count():
     """현재 사용자의 관심 학교 개수 반환"""
     try:
@@ -73,10 +33,7 @@ def get_user_schools_count():
         if not user:
             return 0
         
-        supabase = get_supabase_client()
-        response = supabase.table("user_schools").select("id").eq("user_id", user["id"]).execute()
-        
-        return len(response.data) if response.data else 0
+        return repository.count_user_schools(user["id"])
     except Exception as e:
         st.error(f"관심 학교 정보를 가져오는 중 오류가 발생했습니다: {str(e)}")
         return 0
@@ -88,26 +45,7 @@ def get_user_schools():
         if not user:
             return []
         
-        supabase = get_supabase_client()
-        response = supabase.table("user_schools").select("""
-            id,
-            schools (
-                id,
-                name
-            )
-        """).eq("user_id", user["id"]).execute()
-        
-        if response.data:
-            # schools 정보를 평면화
-            schools = []
-            for item in response.data:
-                if item.get('schools'):
-                    school_info = item['schools']
-                    school_info['user_school_id'] = item['id']  # user_schools 테이블의 ID 추가
-                    schools.append(school_info)
-            return schools
-        
-        return []
+        return repository.get_user_schools(user["id"])
     except Exception as e:
         st.error(f"관심 학교 목록을 가져오는 중 오류가 발생했습니다: {str(e)}")
         return []
@@ -494,6 +432,22 @@ def render_header(has_schools=False):
     
         
     
+def render_banner():
+    """메인 배너 렌더링
+    
+    이미지를 base64로 매번 인라인하지 않고, 서버 시작 시 한 번 만들어 둔
+    정적 파일(크기별 WebP/PNG)의 URL만 전달합니다.
+    """
+    banner_html = get_banner_html()
+    
+    if banner_html:
+        st.markdown(banner_html, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div class="custom-banner" style="background: #e3e3e3; height: 200px;">
+        </div>
+        """, unsafe_allow_html=True)
+
 def render_no_schools_screen():
     """관심 학교가 없을 때의 화면"""
     
@@ -518,6 +472,11 @@ def render_no_schools_screen():
         overflow: hidden;
     }
     
+    /* <picture> 래퍼가 레이아웃에 영향을 주지 않도록 */
+    .custom-banner picture {
+        display: contents;
+    }
+    
     .custom-banner img {
         width: 100% !important;
         max-width: 100% !important;
@@ -621,21 +580,7 @@ def render_no_schools_screen():
     """, unsafe_allow_html=True)
     
     # 메인 배너 영역 (pupu.png 이미지)
-    import base64
-    try:
-        with open("assets/pupu.png", "rb") as f:
-            banner_base64 = base64.b64encode(f.read()).decode()
-        
-        st.markdown(f"""
-        <div class="custom-banner">
-            <img src="data:image/png;base64,{banner_base64}" alt="배너" />
-        </div>
-        """, unsafe_allow_html=True)
-    except:
-        st.markdown("""
-        <div class="custom-banner" style="background: #e3e3e3; height: 200px;">
-        </div>
-        """, unsafe_allow_html=True)
+    render_banner()
     
     # 학교가 있을 때와 동일한 구조를 위한 4개의 빈 블록 추가 (헤더 여백 생성)
     st.markdown("""
@@ -661,66 +606,180 @@ def render_no_schools_screen():
     
     
         
-def get_posts_for_school(school_id, category="전체", offset=0, limit=15):
-    """학교별 게시글 목록 가져오기 (댓글 개수 포함)"""
-    try:
+def get_post_cursor(post):
+    """게시글의 키셋 페이지네이션 커서 (created_at, id) 반환"""
+    return (post['created_at'], post['id'])
+
+def fetch_posts_for_school(school_id, category="전체", cursor=None, limit=FEED_PAGE_SIZE, supabase=None):
+    """학교별 게시글 목록 조회 (댓글 개수 포함, 데이터만 반환)
+    
+    (created_at, id) 기준 키셋(커서) 페이지네이션을 사용하므로 페이지가 깊어져도
+    앞 페이지를 다시 읽지 않습니다. 댓글 개수는 트리거로 유지되는
+    posts.comment_count 컬럼을 읽으므로 페이지 크기와 관계없이 쿼리 1회로 끝납니다.
+    본문은 전체 대신 DB에서 생성된 미리보기(excerpt)만 가져옵니다.
+    조회 결과는 프로세스 전역 피드 캐시에 보관되어 모든 세션이 공유하고,
+    캐시가 비어 있을 때 여러 세션이 동시에 같은 페이지를 열면 쿼리 1회의 결과를 함께 사용합니다.
+    
+    st.* 호출을 하지 않으므로 fetch_all의 작업 스레드에서도 사용할 수 있으며, 조회 실패 시 예외를 그대로 발생시킵니다.
+    
+    Args:
+        school_id: 학교 ID
+        category: 게시판 카테고리
+        cursor: 직전 페이지 마지막 게시글의 (created_at, id). None이면 첫 페이지
+        limit: 페이지 크기
+        supabase: 사용할 클라이언트 (None이면 현재 세션의 클라이언트)
+    
+    Returns:
+        tuple: (게시글 목록, 다음 페이지 커서 또는 None)
+    """
+    # 피드 캐시 확인 (글/댓글 작성 시 해당 학교 항목은 무효화됨)
+    cache = get_feed_cache()
+    cache_key = FeedCache.make_key(school_id, category, cursor)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    if supabase is None:
         supabase = get_supabase_client()
-        
-        # 기본 쿼리 (users 테이블과 조인하여 작성자 정보 가져오기)
-        query = supabase.table("posts").select("""
-            id,
-            title,
-            content,
-            created_at,
-            user_id,
-            school_id,
-            view_count,
-            users (
-                nickname
-            )
-        """).eq("school_id", school_id).order("created_at", desc=True)
-        
-        # 페이지네이션
-        query = query.range(offset, offset + limit - 1)
-        
-        response = query.execute()
-        posts = response.data if response.data else []
-        
-        # 각 게시글의 댓글 개수 가져오기
-        for post in posts:
-            try:
-                comments_response = supabase.table("comments").select("id", count="exact").eq("post_id", post['id']).execute()
-                post['comment_count'] = comments_response.count if comments_response.count else 0
-            except:
-                post['comment_count'] = 0
-        
-        return posts
+    
+    # 기본 쿼리 (users 테이블과 조인하여 작성자 정보 가져오기)
+    query = supabase.table("posts").select("""
+        id,
+        title,
+        excerpt,
+        created_at,
+        user_id,
+        school_id,
+        view_count,
+        comment_count,
+        users (
+            nickname
+        )
+    """).eq("school_id", school_id)
+    
+    # 카테고리 필터 ("전체"가 아니면 DB에서 필터링 - (school_id, category, created_at) 인덱스 사용)
+    if category != "전체":
+        query = query.eq("category", category)
+    
+    query = query.order("created_at", desc=True).order("id", desc=True)
+    
+    # 키셋 페이지네이션: 커서보다 오래된 게시글만 (작성 시각이 같으면 id로 구분)
+    if cursor:
+        cursor_created_at, cursor_id = cursor
+        query = query.or_(
+            f'created_at.lt."{cursor_created_at}",'
+            f'and(created_at.eq."{cursor_created_at}",id.lt.{cursor_id})'
+        )
+    
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회 (동시에 실행 중인 동일 쿼리와 병합)
+    response = execute_shared(query.limit(limit + 1))
+    posts = response.data if response.data else []
+    
+    next_cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        next_cursor = get_post_cursor(posts[-1])
+    
+    cache.set(cache_key, (posts, next_cursor))
+    return posts, next_cursor
+
+def get_posts_for_school(school_id, category="전체", cursor=None, limit=FEED_PAGE_SIZE):
+    """학교별 게시글 목록 가져오기 (조회 실패 시 오류 메시지를 표시하고 빈 목록 반환)
+    
+    Returns:
+        tuple: (게시글 목록, 다음 페이지 커서 또는 None)
+    """
+    try:
+        return fetch_posts_for_school(school_id, category, cursor, limit)
     except Exception as e:
         st.error(f"게시글을 불러오는 중 오류가 발생했습니다: {str(e)}")
-        return []
+        return [], None
 
-def save_tab_state(user_id, school_id, category, posts_count):
-    """탭 상태 저장 (세션 스토리지 사용)"""
+def save_tab_state(user_id, school_id, category, posts, next_cursor):
+    """탭 상태 저장 (세션 스토리지 사용)
+    
+    불러온 게시글 목록과 다음 페이지 커서를 함께 보관하여
+    재실행 시 앞 페이지를 다시 조회하지 않도록 합니다.
+    """
     # user_preferences 테이블이 없으므로 세션 스토리지 사용
     if 'tab_states' not in st.session_state:
         st.session_state.tab_states = {}
     
     st.session_state.tab_states[f"{user_id}_{school_id}"] = {
         "category": category,
-        "posts_count": posts_count
+        "posts": posts,
+        "next_cursor": next_cursor
     }
 
 def get_tab_state(user_id, school_id):
-    """탭 상태 가져오기 (세션 스토리지 사용)"""
+    """탭 상태 가져오기 (세션 스토리지 사용)
+    
+    Returns:
+        tuple: (카테고리, 불러온 게시글 목록, 다음 페이지 커서)
+    """
     if 'tab_states' not in st.session_state:
-        return "전체", 0
+        return "전체", [], None
     
     key = f"{user_id}_{school_id}"
     if key in st.session_state.tab_states:
         state = st.session_state.tab_states[key]
-        return state["category"], state["posts_count"]
+        return state["category"], state["posts"], state["next_cursor"]
+    
+    return "전체", [], None
+
+def load_more_posts(user_id, school_id, category):
+    """더보기 버튼 콜백 - 다음 페이지만 조회하여 세션 목록 뒤에 추가"""
+    saved_category, saved_posts, saved_cursor = get_tab_state(user_id, school_id)
+    if saved_category != category or not saved_cursor:
+        return
+    
+    more_posts, next_cursor = get_posts_for_school(school_id, category, saved_cursor)
+    save_tab_state(user_id, school_id, category, saved_posts + more_posts, next_cursor)
+
+def make_feed_prefetch(user):
+    """마지막으로 본 학교의 첫 페이지를 미리 조회하는 함수 생성 (없으면 None)
+    
+    학교 목록이 있어야 선택 학교가 정해지지만, 대부분의 재실행은 마지막으로 본 학교를 다시 보여주므로
+    학교 목록 조회와 동시에 실행하여 피드 조회를 기다리지 않도록 합니다.
+    사용자/학교/카테고리/클라이언트는 여기(메인 스레드)에서 정하고, 반환된 함수는 데이터 조회만 하므로
+    fetch_all의 작업 스레드에서 실행해도 됩니다. 직전 렌더링의 관심 학교 목록에 있는 학교만 미리 조회하며,
+    조회 실패는 무시합니다 (렌더링 시 다시 조회하고 오류를 표시함).
+    """
+    if not user:
+        return None
+    
+    known_ids = get_known_school_ids(user["id"])
+    school_id = st.query_params.get("school_id")
+    if school_id is None or str(school_id) not in known_ids:
+        school_id = get_last_selected_tab(user["id"])
+    if school_id is None or str(school_id) not in known_ids:
+        return None
+    
+    saved_category, _, _ = get_tab_state(user["id"], school_id)
+    category = st.session_state.get(f"home_category_{school_id}", saved_category)
+    supabase = get_supabase_client()
+    
+    def prefetch():
+        try:
+            fetch_posts_for_school(school_id, category, supabase=supabase)
+        except Exception:
+            return None
+    
+    return prefetch
+
+def save_known_school_ids(user_id, schools):
+    """렌더링한 관심 학교 ID 목록 저장 (다음 재실행의 피드 미리 조회 대상 확인용)"""
+    if 'known_school_ids' not in st.session_state:
+        st.session_state.known_school_ids = {}
+    
+    st.session_state.known_school_ids[user_id] = {str(school['id']) for school in schools}
+
+def get_known_school_ids(user_id):
+    """직전 렌더링의 관심 학교 ID 목록 가져오기 (문자열 집합)"""
+    if 'known_school_ids' not in st.session_state:
+        return set()
     
-    return "전체", 0
+    return st.session_state.known_school_ids.get(user_id, set())
 
 def save_last_selected_tab(user_id, school_id):
     """마지막 선택한 탭 저장 (세션 스토리지 사용)"""
@@ -736,6 +795,52 @@ def get_last_selected_tab(user_id):
     
     return st.session_state.last_selected_tab.get(user_id)
         
+def render_school_feed(user, school):
+    """학교 하나의 게시글 목록 렌더링"""
+    # 탭 상태 복원
+    saved_category, saved_posts, saved_cursor = get_tab_state(user["id"], school['id'])
+    
+    # 게시판 카테고리 선택 (마지막으로 본 카테고리 복원)
+    categories = ["전체"] + POST_CATEGORIES
+    category = st.radio(
+        "게시판",
+        categories,
+        index=categories.index(saved_category) if saved_category in categories else 0,
+        key=f"home_category_{school['id']}",
+        label_visibility="collapsed",
+        horizontal=True
+    )
+    
+    # 첫 페이지는 매번 피드 캐시를 거쳐 조회 (새 글, 댓글 수, 조회수 반영)
+    posts, next_cursor = get_posts_for_school(school['id'], category)
+    
+    # "더보기"로 이미 불러온 이후 페이지는 세션 목록에서 이어 붙임
+    if saved_category == category and next_cursor and len(saved_posts) > len(posts):
+        posts = posts + [post for post in saved_posts if get_post_cursor(post) < next_cursor]
+        next_cursor = saved_cursor
+    
+    if posts:
+        # 게시글 목록 전체를 하나의 HTML 블록으로 렌더링 (값은 모두 이스케이프)
+        render_post_list(posts)
+    else:
+        st.info("아직 게시글이 없습니다.")
+    
+    # 다음 페이지가 있으면 더보기 버튼 표시
+    if next_cursor:
+        st.button(
+            "더보기",
+            key=f"load_more_{school['id']}",
+            on_click=load_more_posts,
+            args=(user["id"], school['id'], category),
+            use_container_width=True
+        )
+    
+    # 탭 상태 저장
+    save_tab_state(user["id"], school['id'], category, posts, next_cursor)
+    
+    # 현재 탭이 렌더링되면 활성 탭으로 간주하여 세션에 저장
+    st.session_state.current_active_school_id = school['id']
+
 def render_with_schools_screen():
     """관심 학교가 있을 때의 화면"""
     # 스타일 추가
@@ -886,6 +991,62 @@ def render_with_schools_screen():
         font-size: 16px !important;
     }
     
+    /* 지연 로딩 탭 모드 - 라디오 버튼을 탭 모양으로 표시 */
+    .st-key-home_school_tab {
+        margin-top: 2rem !important;
+        border-bottom: 1px solid #e3e3e3;
+    }
+    
+    .st-key-home_school_tab div[role="radiogroup"] {
+        display: flex !important;
+        flex-wrap: wrap !important;
+        gap: 1rem !important;
+    }
+    
+    .st-key-home_school_tab div[role="radiogroup"] > label {
+        padding: 8px 0 !important;
+        margin-right: 1rem !important;
+        font-size: 16px !important;
+        cursor: pointer !important;
+        border-bottom: 2px solid transparent;
+    }
+    
+    /* 라디오 원형 아이콘 숨김 */
+    .st-key-home_school_tab div[role="radiogroup"] > label > div:first-child {
+        display: none !important;
+    }
+    
+    .st-key-home_school_tab div[role="radiogroup"] > label:has(input:checked) {
+        color: #ff4b4b !important;
+        border-bottom: 2px solid #ff4b4b;
+    }
+    
+    /* 게시판 카테고리 선택 */
+    [class*="st-key-home_category_"] div[role="radiogroup"] {
+        display: flex !important;
+        flex-wrap: wrap !important;
+        gap: 8px !important;
+        margin: 1rem 0 !important;
+    }
+    
+    [class*="st-key-home_category_"] div[role="radiogroup"] > label {
+        padding: 4px 12px !important;
+        border: 1px solid #e3e3e3;
+        border-radius: 16px;
+        font-size: 14px !important;
+        cursor: pointer !important;
+    }
+    
+    [class*="st-key-home_category_"] div[role="radiogroup"] > label > div:first-child {
+        display: none !important;
+    }
+    
+    [class*="st-key-home_category_"] div[role="radiogroup"] > label:has(input:checked) {
+        background-color: #2c2c2c;
+        border-color: #2c2c2c;
+        color: white !important;
+    }
+    
     /* 플로팅 글쓰기 버튼 */
     .floating-write-button {
         position: fixed;
@@ -930,6 +1091,11 @@ def render_with_schools_screen():
         border-bottom: none;  /* 마지막 게시글은 밑줄 없음 */
     }
     
+    /* 한 블록으로 렌더링된 게시글 목록 - 게시글 사이 구분선 */
+    .post-list > a:not(:last-child) .post-item {
+        border-bottom: 1px solid #e3e3e3;
+    }
+    
     .post-item:hover {
         background-color: #f8f9fa;
     }
@@ -1059,6 +1225,11 @@ def render_with_schools_screen():
         overflow: hidden;
     }
     
+    /* <picture> 래퍼가 레이아웃에 영향을 주지 않도록 */
+    .custom-banner picture {
+        display: contents;
+    }
+    
     .custom-banner img {
         width: 100% !important;
         max-width: 100% !important;
@@ -1104,22 +1275,8 @@ def render_with_schools_screen():
     </style>
     """, unsafe_allow_html=True)
     
-    # 배너 이미지를 base64로 인코딩하여 삽입
-    import base64
-    try:
-        with open("assets/pupu.png", "rb") as f:
-            banner_base64 = base64.b64encode(f.read()).decode()
-        
-        st.markdown(f"""
-        <div class="custom-banner">
-            <img src="data:image/png;base64,{banner_base64}" alt="배너" />
-        </div>
-        """, unsafe_allow_html=True)
-    except:
-        st.markdown("""
-        <div class="custom-banner" style="background: #e3e3e3; height: 200px;">
-    </div>
-    """, unsafe_allow_html=True)
+    # 메인 배너 영역 (pupu.png 이미지)
+    render_banner()
     
     # 사용자의 관심 학교 목록 가져오기
     schools = get_user_schools()
@@ -1133,6 +1290,8 @@ def render_with_schools_screen():
     if not user:
         return
     
+    save_known_school_ids(user["id"], schools)
+    
     # 마지막 선택한 탭 가져오기
     last_selected_school_id = get_last_selected_tab(user["id"])
     
@@ -1147,86 +1306,37 @@ def render_with_schools_screen():
     if not selected_school_id:
         selected_school_id = schools[0]['id'] if schools else None
     
-    # 학교 탭을 Streamlit 네이티브로 생성
-    school_names = [school['name'] for school in schools]
-    tabs = st.tabs(school_names)
-        
-    # 선택된 탭 인덱스 찾기
+    # 선택된 탭 인덱스 찾기 (쿼리 파라미터는 문자열이므로 문자열로 비교)
     selected_tab_index = 0
     for idx, school in enumerate(schools):
-        if school['id'] == selected_school_id:
+        if str(school['id']) == str(selected_school_id):
             selected_tab_index = idx
             break
     
-    # 각 탭 렌더링
-    for idx, tab in enumerate(tabs):
-        with tab:
-            school = schools[idx]
-            
-            # 탭 상태 복원
-            saved_category, saved_posts_count = get_tab_state(user["id"], school['id'])
-            
-            # 게시글 목록 표시
-            posts = get_posts_for_school(school['id'], "전체", 0, max(saved_posts_count, 15))
-            
-            if posts:
-                for post in posts:
-                    # 게시 시간 포맷팅 (새로운 규칙 적용)
-                    time_str = format_time_ago(post['created_at'])
-                    
-                    # 실제 작성자 닉네임 가져오기
-                    author_nickname = post.get('users', {}).get('nickname', '익명') if post.get('users') else '익명'
-                    
-                    # 댓글 개수와 조회수 가져오기
-                    comment_count = post.get('comment_count', 0)
-                    view_count = post.get('view_count', 0)
-                    
-                    # 게시글을 클릭 가능한 링크로 만들기 (쿼리 파라미터 방식)
-                    st.markdown(f"""
-                    <a href="?page=view_post&id={post['id']}" target="_self" style="text-decoration: none; color: inherit;">
-                        <div class="post-item">
-                            <div class="post-header">
-                                <div class="profile-image"></div>
-                                <div class="post-meta">
-                                    <div class="post-nickname">{author_nickname}</div>
-                                    <div class="post-time">{time_str}</div>
-                                </div>
-                                <div class="more-icon">
-                                    <svg width="20" height="20" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
-                                        <circle cx="12" cy="12" r="2" fill="currentColor"/>
-                                        <circle cx="12" cy="5" r="2" fill="currentColor"/>
-                                        <circle cx="12" cy="19" r="2" fill="currentColor"/>
-                                    </svg>
-                                </div>
-                            </div>
-                            <div class="post-title">{post['title']}</div>
-                            <div class="post-content">{post['content']}</div>
-                            <div class="post-stats">
-                                <div class="stat-item">
-                                    <svg width="20" height="20" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
-                                        <path d="M21 15C21 15.5304 20.7893 16.0391 20.4142 16.4142C20.0391 16.7893 19.5304 17 19 17H7L3 21V5C3 4.46957 3.21071 3.96086 3.58579 3.58579C3.96086 3.21071 4.46957 3 5 3H19C19.5304 3 20.0391 3.21071 20.4142 3.58579C20.7893 3.96086 21 4.46957 21 5V15Z" stroke="#666" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
-                                    </svg>
-                                    <span>댓글 {comment_count}</span>
-                                </div>
-                                <div class="stat-item">
-                                    <svg width="20" height="20" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
-                                        <path d="M1 12S5 4 12 4S23 12 23 12S19 20 12 20S1 12 1 12Z" stroke="#666" stroke-width="2"/>
-                                        <circle cx="12" cy="12" r="3" stroke="#666" stroke-width="2"/>
-                                    </svg>
-                                    <span>조회수 {view_count}</span>
-                                </div>
-                            </div>
-                        </div>
-                    </a>
-                    """, unsafe_allow_html=True)
-            else:
-                st.info("아직 게시글이 없습니다.")
-            
-            # 탭 상태 저장
-            save_tab_state(user["id"], school['id'], "전체", len(posts) if posts else 0)
-            
-            # 현재 탭이 렌더링되면 활성 탭으로 간주하여 세션에 저장
-            st.session_state.current_active_school_id = school['id']
+    school_names = [school['name'] for school in schools]
+    
+    if HOME_LAZY_TABS:
+        # 지연 로딩 모드: 선택된 학교의 게시글만 조회
+        # (다른 학교는 사용자가 처음 열 때 조회됨)
+        selected_idx = st.radio(
+            "관심 학교",
+            range(len(schools)),
+            format_func=lambda x: school_names[x],
+            index=selected_tab_index,
+            key="home_school_tab",
+            label_visibility="collapsed",
+            horizontal=True
+        )
+        school = schools[selected_idx]
+        save_last_selected_tab(user["id"], school['id'])
+        render_school_feed(user, school)
+    else:
+        # 학교 탭을 Streamlit 네이티브로 생성 (모든 탭을 매번 조회)
+        tabs = st.tabs(school_names)
+        
+        for idx, tab in enumerate(tabs):
+            with tab:
+                render_school_feed(user, schools[idx])
     
     # 각 탭에 글쓰기 버튼 추가하는 방식으로 변경
     # 현재 활성 탭을 감지하기 위해 각 탭마다 버튼 생성
@@ -1289,8 +1399,12 @@ def main():
         # 학교 추가 페이지로 이동
         st.switch_page("pages/4_add_school.py")
     
-    # 관심 학교 개수 확인
-    schools_count = get_user_schools_count()
+    # 관심 학교 개수 확인 (마지막으로 본 학교의 첫 페이지를 동시에 미리 조회)
+    prefetch = make_feed_prefetch(get_current_user())
+    if prefetch:
+        schools_count, _ = fetch_all(get_user_schools_count, prefetch)
+    else:
+        schools_count = get_user_schools_count()
     
     # 헤더 렌더링 (학교 추가 여부 전달)
     render_header(has_schools=(schools_count > 0))
@@ -1303,3 +1417,4 @@ def main():
 
 if __name__ == "__main__":
     main()
+    render_query_debug_panel()
@@ -8,7 +8,10 @@ from config.settings import PAGE_CONFIG
 from utils.styles import hide_sidebar
 from utils.auth import require_login, get_current_user, logout_user
 from utils.supabase_client import get_supabase_client
+from utils.single_flight import execute_shared
 from utils.dialogs import show_warning
+from utils import repository
+from components.query_debug_panel import render_query_debug_panel
 
 # 페이지 설정 - centered로 변경 (홈 화면과 동일)
 st.set_page_config(
@@ -403,12 +406,11 @@ def search_schools(keyword: str) -> list:
         return []
     try:
         client = get_supabase_client()
-        response = (
+        response = execute_shared(
             client.table("schools")
             .select("*")  # 모든 컬럼 선택 (id, name 등)
             .ilike("name", f"%{keyword.strip()}%")
             .limit(20)
-            .execute()
         )
         
         return response.data or []
@@ -424,27 +426,7 @@ def get_user_schools() -> list:
         if not user:
             return []
         
-        client = get_supabase_client()
-        response = client.table("user_schools").select("""
-            id,
-            school_id,
-            schools (
-                id,
-                name
-            )
-        """).eq("user_id", user["id"]).execute()
-        
-        if response.data:
-            # 데이터 평면화
-            schools = []
-            for item in response.data:
-                if item.get('schools'):
-                    school_info = item['schools']
-                    school_info['user_school_id'] = item['id']  # user_schools 테이블의 ID
-                    schools.append(school_info)
-            return schools
-        
-        return []
+        return repository.get_user_schools(user["id"])
     except Exception:
         return []
 
@@ -462,17 +444,13 @@ def add_school_to_user(school_id: int) -> tuple[bool, str]:
         
         client = get_supabase_client()
         
-        # 현재 추가된 학교 개수 확인
-        count_result = client.table("user_schools").select("id", count="exact").eq("user_id", user["id"]).execute()
-        current_count = count_result.count if count_result.count else 0
+        # 현재 추가된 학교 개수/중복 확인 (이번 재실행에서 이미 조회한 관심 학교 목록 재사용)
+        my_schools = repository.get_user_schools(user["id"])
         
-        if current_count >= 5:
+        if len(my_schools) >= 5:
             return False, "최대 5개까지만 추가할 수 있습니다."
         
-        # 이미 추가된 학교인지 확인
-        existing = client.table("user_schools").select("id").eq("user_id", user["id"]).eq("school_id", school_id).execute()
-        
-        if existing.data and len(existing.data) > 0:
+        if any(str(school["id"]) == str(school_id) for school in my_schools):
             return False, "이미 추가된 학교입니다."
         
         # 관심 학교에 추가
@@ -480,6 +458,7 @@ def add_school_to_user(school_id: int) -> tuple[bool, str]:
             "user_id": user["id"],
             "school_id": school_id
         }).execute()
+        repository.invalidate_user_schools(user["id"])
         
         return True, "학교가 추가되었습니다."
     except Exception as e:
@@ -491,6 +470,10 @@ def remove_school_from_user(user_school_id: int) -> bool:
     try:
         client = get_supabase_client()
         client.table("user_schools").delete().eq("id", user_school_id).execute()
+        
+        user = get_current_user()
+        if user:
+            repository.invalidate_user_schools(user["id"])
         return True
     except Exception:
         return False
@@ -832,5 +815,6 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
+    render_query_debug_panel()
 
 
@@ -9,6 +9,11 @@ from utils.auth import require_login, get_current_user, logout_user
 from utils.dialogs import delete_confirm_dialog
 from utils.styles import hide_sidebar
 from utils.supabase_client import get_supabase_client
+from utils.single_flight import execute_shared
+from utils.feed_cache import invalidate_school_feed
+from utils.view_counter import get_view_count_buffer
+from utils.concurrent_fetch import fetch_all
+from components.query_debug_panel import render_query_debug_panel
 
 # 페이지 설정 - 홈 화면과 동일하게 centered로 변경
 st.set_page_config(
@@ -397,15 +402,13 @@ def render_header(has_schools=False):
     """, unsafe_allow_html=True)
 
 def increment_view_count(post_id):
-    """게시글 조회수 증가"""
+    """게시글 조회수 증가
+    
+    조회수는 쓰기 지연 버퍼에 모았다가 주기적으로 한 번에 원자적으로 반영합니다.
+    (조회할 때마다 읽고-쓰기를 하지 않으므로 동시 조회 시에도 누락되지 않음)
+    """
     try:
-        supabase = get_supabase_client()
-        # 현재 조회수 가져오기
-        response = supabase.table("posts").select("view_count").eq("id", post_id).execute()
-        if response.data:
-            current_count = response.data[0].get('view_count', 0)
-            # 조회수 +1
-            supabase.table("posts").update({"view_count": current_count + 1}).eq("id", post_id).execute()
+        get_view_count_buffer().add(post_id)
     except Exception as e:
         st.error(f"조회수 증가 중 오류: {str(e)}")
 
@@ -905,18 +908,25 @@ def main():
             st.switch_page("pages/3_home.py")
         return
     
-    # 조회수 증가 (한 번만 실행되도록 세션 체크)
-    if f"viewed_{post_id}" not in st.session_state:
-        increment_view_count(post_id)
-        st.session_state[f"viewed_{post_id}"] = True
+    # 인기 글에 동시 접속이 몰리면 진행 중인 동일 쿼리의 결과를 공유 (읽기 전용으로 사용)
+    def fetch_post():
+        return execute_shared(get_supabase_client().table("posts").select("""
+            *,
+            users (nickname)
+        """).eq("id", post_id))
     
-    # 게시글 데이터 가져오기
-    try:
-        supabase = get_supabase_client()
-        response = supabase.table("posts").select("""
+    def fetch_comments():
+        return execute_shared(get_supabase_client().table("comments").select("""
             *,
             users (nickname)
-        """).eq("id", post_id).execute()
+        """).eq("post_id", post_id).order("created_at", desc=True))
+    
+    # 게시글 데이터 가져오기 (서로 독립적인 댓글 목록도 동시에 조회)
+    try:
+        response, comments_response = fetch_all(fetch_post, fetch_comments, return_exceptions=True)
+        
+        if isinstance(response, Exception):
+            raise response
         
         if not response.data:
             st.warning("게시글을 찾을 수 없습니다.")
@@ -927,12 +937,17 @@ def main():
         st.error(f"게시글을 불러오는 중 오류가 발생했습니다: {str(e)}")
         return
     
-    # 댓글 개수 가져오기
-    try:
-        comments_response = supabase.table("comments").select("id", count="exact").eq("post_id", post_id).execute()
-        comment_count = comments_response.count if comments_response.count else 0
-    except:
-        comment_count = 0
+    # 조회수 증가 (게시글이 있을 때만, 한 번만 실행되도록 세션 체크)
+    post_id = post['id']
+    if f"viewed_{post_id}" not in st.session_state:
+        increment_view_count(post_id)
+        st.session_state[f"viewed_{post_id}"] = True
+    
+    # 댓글 개수 (트리거로 유지되는 posts.comment_count 컬럼)
+    comment_count = post.get('comment_count') or 0
+    
+    # 조회수 (아직 DB에 반영되지 않은 증가분 포함)
+    view_count = (post.get('view_count') or 0) + get_view_count_buffer().pending(post_id)
     
     # 작성자 정보
     author_nickname = post.get('users', {}).get('nickname', '익명') if post.get('users') else '익명'
@@ -1023,7 +1038,7 @@ def main():
                     <path d="M1 12S5 4 12 4S23 12 23 12S19 20 12 20S1 12 1 12Z" stroke="#666" stroke-width="2"/>
                     <circle cx="12" cy="12" r="3" stroke="#666" stroke-width="2"/>
                 </svg>
-        <span>조회수 {post.get('view_count', 0):,}</span>
+        <span>조회수 {view_count:,}</span>
             </div>
         </div>
     </div>
@@ -1109,6 +1124,8 @@ def main():
                     "user_id": user["id"],
                     "content": comment.strip()
                 }).execute()
+                # 피드의 댓글 수가 바로 반영되도록 해당 학교 피드 캐시 무효화
+                invalidate_school_feed(post['school_id'])
                 st.success("댓글이 작성되었습니다!")
                 st.rerun()
             except Exception as e:
@@ -1118,12 +1135,10 @@ def main():
     
     st.markdown('</div>', unsafe_allow_html=True)
     
-    # 댓글 목록 (해당 게시글의 실제 댓글)
+    # 댓글 목록 (해당 게시글의 실제 댓글 - 게시글과 함께 조회해 둔 결과)
     try:
-        comments_response = supabase.table("comments").select("""
-            *,
-            users (nickname)
-        """).eq("post_id", post_id).order("created_at", desc=True).execute()
+        if isinstance(comments_response, Exception):
+            raise comments_response
         
         comments = comments_response.data if comments_response.data else []
         
@@ -1165,5 +1180,6 @@ def main():
 
 if __name__ == "__main__":
     main()
+    render_query_debug_panel()
 
 
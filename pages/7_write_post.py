@@ -4,11 +4,14 @@
 
 import streamlit as st
 import streamlit.components.v1 as components
-from config.settings import PAGE_CONFIG
+from config.settings import PAGE_CONFIG, POST_CATEGORIES
 from utils.auth import require_login, get_current_user
 from utils.styles import hide_sidebar
 from utils.supabase_client import get_supabase_client
 from utils.dialogs import show_success, show_error
+from utils.feed_cache import invalidate_school_feed
+from utils import repository
+from components.query_debug_panel import render_query_debug_panel
 
 # 페이지 설정
 st.set_page_config(
@@ -28,18 +31,7 @@ def get_user_schools():
         if not user:
             return []
         
-        supabase = get_supabase_client()
-        response = supabase.table("user_schools").select("""
-            id,
-            schools (
-                id,
-                name
-            )
-        """).eq("user_id", user["id"]).execute()
-        
-        if response.data:
-            return [{"id": item["schools"]["id"], "name": item["schools"]["name"]} for item in response.data]
-        return []
+        return [{"id": school["id"], "name": school["name"]} for school in repository.get_user_schools(user["id"])]
     except Exception as e:
         st.error(f"관심 학교 정보를 가져오는 중 오류가 발생했습니다: {str(e)}")
         return []
@@ -543,6 +535,30 @@ def main():
     # 선택된 학교를 별도 키에 저장 (홈에서 전달받은 current_school_id는 보존)
     st.session_state.working_school_id = selected_school['id']
     
+    # 게시판 라벨
+    st.markdown("""
+    <p style="
+        font-size: 17px;
+        font-weight: 600;
+        color: black;
+        margin-top: 20px;
+        margin-bottom: 5px;
+    ">게시판</p>
+    """, unsafe_allow_html=True)
+    
+    # 게시판 카테고리 선택 (학교 선택과 같은 라디오 스타일)
+    st.markdown('<div class="school-radio-container" style="margin-top: 1rem;">', unsafe_allow_html=True)
+    
+    selected_category = st.radio(
+        "게시판 선택",
+        POST_CATEGORIES,
+        key="category_radio",
+        label_visibility="collapsed",
+        horizontal=True
+    )
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
     # 제목 라벨
     st.markdown("""
     <p style="
@@ -678,10 +694,13 @@ def main():
                         "content": content.strip(),
                         "user_id": user["id"],
                         "school_id": selected_school["id"],
+                        "category": selected_category,
                         "view_count": 0
                     }
                     response = supabase.table("posts").insert(post_data).execute()
                     if response.data:
+                        # 새 글이 바로 보이도록 해당 학교 피드 캐시 무효화
+                        invalidate_school_feed(selected_school["id"])
                         show_success("게시글이 작성되었습니다!")
                         st.switch_page("pages/3_home.py")
                     else:
@@ -693,3 +712,4 @@ def main():
     
 if __name__ == "__main__":
     main()
+    render_query_debug_panel()
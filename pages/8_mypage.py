@@ -6,9 +6,13 @@ Figma 디자인: https://www.figma.com/design/HHDev1QHqPB31yP9lENPD9/%EC%BA%A0%E
 import streamlit as st
 import re
 from utils.supabase_client import get_supabase_client
-from utils.auth import require_login, get_current_user, logout_user
+from utils.auth import require_login, get_current_user, logout_user, save_session, clear_saved_session
 from utils.styles import hide_sidebar
 from utils.dialogs import show_error, show_success
+from utils.feed_cache import get_feed_cache
+from utils import repository
+from utils.identity import invalidate_user_profile
+from components.query_debug_panel import render_query_debug_panel
 
 # 페이지 설정 - centered로 변경 (홈 화면과 동일)
 st.set_page_config(
@@ -28,9 +32,7 @@ def render_header():
     
     # 사용자의 관심 학교 개수 확인
     try:
-        client = get_supabase_client()
-        schools_response = client.table("user_schools").select("id").eq("user_id", user["id"]).execute()
-        has_schools = len(schools_response.data) > 0 if schools_response.data else False
+        has_schools = repository.count_user_schools(user["id"]) > 0
     except:
         has_schools = False
     
@@ -963,6 +965,11 @@ def main() -> None:
                     # 4. users 테이블에서 사용자 정보 삭제
                     client.table('users').delete().eq('id', user['id']).execute()
                     
+                    # 여러 학교의 글/댓글이 삭제되었으므로 피드 캐시 전체 비우기
+                    get_feed_cache().clear()
+                    repository.invalidate_user_schools(user['id'])
+                    invalidate_user_profile(user['email'])
+                    
                     # 5. 현재 로그인한 사용자 삭제 (Auth)
                     # admin이 아닌 일반 사용자 삭제 방법 사용
                     try:
@@ -973,7 +980,8 @@ def main() -> None:
                     except:
                         pass
                     
-                    # 6. 세션 정리
+                    # 6. 세션 정리 (새로고침 시 복원되지 않도록 저장된 세션과 쿠키도 삭제)
+                    clear_saved_session()
                     st.session_state.logged_in = False
                     st.session_state.user = None
                     st.session_state.access_token = None
@@ -1025,10 +1033,13 @@ def main() -> None:
                 result = client.table('users').update(update_data).eq('email', user['email']).execute()
                 
                 if result.data:
+                    invalidate_user_profile(user['email'])
+                    
                     # 세션 상태 업데이트
                     if 'user_data' in st.session_state:
                         st.session_state.user_data['nickname'] = nickname_input
                         st.session_state.user_data['phone'] = phone_input
+                        save_session()
                     
                     # 중복 확인 상태 리셋
                     st.session_state.last_checked_nickname = nickname_input
@@ -1048,3 +1059,4 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
+    render_query_debug_panel()
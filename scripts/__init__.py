@@ -0,0 +1,4 @@
+"""
+Scripts 패키지
+캠퍼스링크 - 운영용 명령줄 스크립트
+"""
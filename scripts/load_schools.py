@@ -0,0 +1,205 @@
+"""
+학교 목록 일괄 적재
+CSV/JSON Lines 학교 데이터를 스트리밍으로 읽어 이름 정규화, 중복 제거 후 일정 크기 배치로 schools 테이블에 upsert
+(content_hash가 같은 기존 행은 건너뛰므로 다시 실행해도 바뀐 행만 기록)
+schools 테이블은 일반 사용자가 쓸 수 없으므로 service_role 클라이언트로 기록 (SUPABASE_SERVICE_ROLE_KEY 필요)
+
+실행:
+    python -m scripts.load_schools schools.csv
+    python -m scripts.load_schools schools.jsonl --name-field 학교명 --location-field 소재지 --batch-size 1000
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import sys
+import time
+import unicodedata
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from utils.supabase_client import get_admin_client
+
+# 기본 배치 크기 (배치마다 upsert 최대 1회)
+DEFAULT_BATCH_SIZE = 500
+
+# 기존 content_hash 조회 시 한 번에 보내는 학교명 수 (in.(...) 필터가 URL에 들어가므로 길이 제한)
+LOOKUP_CHUNK_SIZE = 100
+
+# JSON Lines로 읽는 확장자 (JSON 배열 파일은 전체를 메모리에 올려야 하므로 지원하지 않음)
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def normalize_text(value: Any) -> Optional[str]:
+    """유니코드 NFKC 정규화 후 앞뒤 공백 제거, 연속 공백을 하나로 (빈 값은 None)"""
+    if value is None:
+        return None
+    text = " ".join(unicodedata.normalize("NFKC", str(value)).split())
+    return text or None
+
+
+def content_hash(row: dict) -> str:
+    """적재 대상 컬럼 값의 해시 (값이 같으면 같은 해시)"""
+    payload = json.dumps({"name": row["name"], "location": row["location"]}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def read_records(path: Path) -> Iterator[dict]:
+    """파일에서 레코드를 한 줄씩 읽기 (CSV 또는 JSON Lines)"""
+    if path.suffix.lower() in JSON_LINES_SUFFIXES:
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        # utf-8-sig: 엑셀에서 저장한 CSV의 BOM 제거
+        with path.open(encoding="utf-8-sig", newline="") as f:
+            yield from csv.DictReader(f)
+
+
+def normalize_records(records: Iterable[dict], name_field: str, location_field: str, stats: Counter) -> Iterator[dict]:
+    """레코드를 schools 행 형식으로 정규화 (학교명이 없는 레코드는 건너뜀)"""
+    for record in records:
+        name = normalize_text(record.get(name_field))
+        if name is None:
+            stats["invalid"] += 1
+            continue
+        yield {"name": name, "location": normalize_text(record.get(location_field))}
+
+
+def dedupe(rows: Iterable[dict], stats: Counter) -> Iterator[dict]:
+    """
+    정규화된 학교명 기준 중복 제거 (처음 나온 행 유지)
+
+    이미 나온 학교명의 해시만 보관하므로 메모리 사용량은 고유 학교 수에 비례합니다.
+    """
+    seen: set[bytes] = set()
+    for row in rows:
+        key = hashlib.blake2b(row["name"].encode(), digest_size=16).digest()
+        if key in seen:
+            stats["duplicates"] += 1
+            continue
+        seen.add(key)
+        yield row
+
+
+def with_content_hash(rows: Iterable[dict]) -> Iterator[dict]:
+    for row in rows:
+        yield {**row, "content_hash": content_hash(row)}
+
+
+def batched(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def sync_batch(client, batch: list[dict], dry_run: bool = False) -> Counter:
+    """
+    배치 1개를 DB에 반영
+
+    배치의 학교명으로 기존 행의 content_hash를 조회하여 새 학교와 내용이 바뀐 학교만 upsert합니다.
+
+    Returns:
+        Counter: inserted / updated / unchanged 개수
+    """
+    existing = {}
+    for chunk in batched(batch, LOOKUP_CHUNK_SIZE):
+        response = client.table("schools").select("name, content_hash").in_("name", [row["name"] for row in chunk]).execute()
+        existing.update((row["name"], row.get("content_hash")) for row in response.data)
+
+    result = Counter()
+    changed = []
+    for row in batch:
+        if row["name"] not in existing:
+            result["inserted"] += 1
+            changed.append(row)
+        elif existing[row["name"]] != row["content_hash"]:
+            result["updated"] += 1
+            changed.append(row)
+        else:
+            result["unchanged"] += 1
+
+    if changed and not dry_run:
+        client.table("schools").upsert(changed, on_conflict="name").execute()
+
+    return result
+
+
+def load_schools(
+    path: Path,
+    name_field: str = "name",
+    location_field: str = "location",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    progress=sys.stderr,
+) -> Counter:
+    """
+    학교 파일을 읽어 schools 테이블에 반영
+
+    읽기 → 정규화 → 중복 제거 → 해시 계산 → 배치 반영이 제너레이터로 연결되어
+    메모리에는 배치 1개와 학교명 해시 집합만 유지됩니다.
+
+    Returns:
+        Counter: inserted / updated / unchanged / duplicates / invalid 개수
+    """
+    client = get_admin_client()
+    stats = Counter()
+    rows = with_content_hash(dedupe(normalize_records(read_records(path), name_field, location_field, stats), stats))
+
+    start = time.perf_counter()
+    processed = 0
+    for batch in batched(rows, batch_size):
+        stats.update(sync_batch(client, batch, dry_run))
+        processed += len(batch)
+        if progress is not None:
+            elapsed = time.perf_counter() - start
+            print(
+                f"\r{processed:,}개 처리 · 신규 {stats['inserted']:,} · 변경 {stats['updated']:,} · "
+                f"동일 {stats['unchanged']:,} · 중복 {stats['duplicates']:,} · 오류 {stats['invalid']:,} "
+                f"({processed / elapsed if elapsed else 0:,.0f}개/초)",
+                end="",
+                file=progress,
+                flush=True,
+            )
+
+    if progress is not None and processed:
+        print(file=progress)
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="학교 목록 일괄 적재 (CSV/JSON Lines)",
+        epilog="service_role 클라이언트로 기록하므로 SUPABASE_SERVICE_ROLE_KEY 환경 변수가 필요합니다.",
+    )
+    parser.add_argument("path", type=Path, help="학교 데이터 파일 (.csv, .jsonl, .ndjson)")
+    parser.add_argument("--name-field", default="name", help="학교명 컬럼/키 (기본값: name)")
+    parser.add_argument("--location-field", default="location", help="지역 컬럼/키 (기본값: location)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="배치 크기")
+    parser.add_argument("--dry-run", action="store_true", help="DB에 쓰지 않고 변경 개수만 확인")
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"파일을 찾을 수 없습니다: {args.path}", file=sys.stderr)
+        return 1
+
+    try:
+        stats = load_schools(args.path, args.name_field, args.location_field, max(1, args.batch_size), args.dry_run)
+    except Exception as e:
+        print(f"\n학교 목록 적재 중 오류가 발생했습니다: {e}", file=sys.stderr)
+        return 1
+
+    prefix = "[dry-run] " if args.dry_run else ""
+    print(
+        f"{prefix}학교 목록 적재 완료: 신규 {stats['inserted']}개, 변경 {stats['updated']}개, "
+        f"동일 {stats['unchanged']}개, 중복 {stats['duplicates']}개, 학교명 없음 {stats['invalid']}개"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+게시글 댓글 수 보정 작업
+posts.comment_count가 실제 댓글 수와 어긋난 경우 일괄 보정
+
+실행:
+    python -m scripts.reconcile_comment_counts
+"""
+
+import sys
+
+from utils.supabase_client import get_admin_client
+
+
+def reconcile_comment_counts() -> int:
+    """
+    DB의 reconcile_post_comment_counts() 함수를 호출하여 댓글 수 보정
+    (실행 권한이 service_role로 제한되어 있으므로 SUPABASE_SERVICE_ROLE_KEY 필요)
+
+    Returns:
+        int: 보정된 게시글 수
+    """
+    supabase = get_admin_client()
+    response = supabase.rpc("reconcile_post_comment_counts").execute()
+    return response.data or 0
+
+
+def main() -> int:
+    try:
+        fixed = reconcile_comment_counts()
+    except Exception as e:
+        print(f"댓글 수 보정 중 오류가 발생했습니다: {e}", file=sys.stderr)
+        return 1
+
+    print(f"댓글 수 보정 완료: {fixed}개 게시글")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
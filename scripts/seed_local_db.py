@@ -0,0 +1,106 @@
+"""
+로컬 SQLite 백엔드 시드 데이터 생성
+벤치마크/부하 테스트용으로 사용자, 학교, 게시글, 댓글을 일괄 생성
+
+실행:
+    python -m scripts.seed_local_db --db .local/campuslink.db --schools 20 --posts 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+from config.settings import POST_CATEGORIES
+from utils.local_backend import DEFAULT_DB_PATH, LocalClient
+
+# 시드 사용자 공통 비밀번호
+SEED_PASSWORD = "password1234"
+
+
+def seed_local_db(client: LocalClient, users: int, schools: int, posts: int, comments: int, seed: int = 0) -> dict:
+    """
+    로컬 DB에 시드 데이터 생성
+
+    사용자 i의 로그인 이메일은 user{i}@example.com, 비밀번호는 SEED_PASSWORD입니다.
+    모든 사용자는 앞쪽 학교 3곳을 관심학교로 등록합니다.
+
+    Returns:
+        dict: 테이블별 생성 개수
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+
+    for i in range(users):
+        client.auth.sign_up({"email": f"user{i}@example.com", "password": SEED_PASSWORD})
+    client.auth.sign_out()
+
+    user_rows = client.table("users").insert([
+        {"email": f"user{i}@example.com", "nickname": f"사용자{i}", "phone": f"010-0000-{i:04d}"}
+        for i in range(users)
+    ]).execute().data
+    school_rows = client.table("schools").insert([
+        {"name": f"테스트대학교{i}", "location": rng.choice(["서울", "부산", "대구", "대전", "광주"])}
+        for i in range(schools)
+    ]).execute().data
+
+    client.table("user_schools").insert([
+        {"user_id": user["id"], "school_id": school["id"]}
+        for user in user_rows
+        for school in school_rows[:3]
+    ]).execute()
+
+    post_rows = client.table("posts").insert([
+        {
+            "user_id": rng.choice(user_rows)["id"],
+            "school_id": rng.choice(school_rows)["id"],
+            "category": rng.choice(POST_CATEGORIES),
+            "title": f"테스트 게시글 {i}",
+            "content": "\n".join(f"본문 {i}번 글의 {line}번째 줄입니다." for line in range(rng.randint(1, 20))),
+            "view_count": rng.randint(0, 500),
+            "created_at": (now - timedelta(minutes=i * 7)).isoformat(timespec="microseconds"),
+        }
+        for i in range(posts)
+    ]).execute().data
+
+    client.table("comments").insert([
+        {
+            "post_id": rng.choice(post_rows)["id"],
+            "user_id": rng.choice(user_rows)["id"],
+            "content": f"테스트 댓글 {i}",
+        }
+        for i in range(comments)
+    ]).execute()
+
+    return {"users": users, "schools": schools, "posts": posts, "comments": comments}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="로컬 SQLite 백엔드 시드 데이터 생성")
+    parser.add_argument("--db", default=os.getenv("LOCAL_DB_PATH") or DEFAULT_DB_PATH, help="DB 파일 경로")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--schools", type=int, default=10)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--comments", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--reset", action="store_true", help="기존 DB 파일을 지우고 새로 생성")
+    args = parser.parse_args()
+
+    if args.reset:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(args.db + suffix):
+                os.remove(args.db + suffix)
+
+    try:
+        counts = seed_local_db(LocalClient(args.db), args.users, args.schools, args.posts, args.comments, args.seed)
+    except Exception as e:
+        print(f"시드 데이터 생성 중 오류가 발생했습니다: {e}", file=sys.stderr)
+        return 1
+
+    print(f"시드 데이터 생성 완료 ({args.db}): " + ", ".join(f"{k} {v}개" for k, v in counts.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""
+앱 서버 실행 (시작 워밍업 포함)
+서버가 뜨는 동안 백그라운드에서 클라이언트/연결/배너를 미리 준비하여 첫 사용자의 대기 시간을 줄임
+
+실행:
+    python -m scripts.serve [streamlit run 옵션...]
+    python -m scripts.serve --server.port 8080
+"""
+
+import sys
+from pathlib import Path
+
+from utils.startup import start_warm_up
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+
+def main() -> int:
+    # 같은 프로세스에서 Streamlit 서버를 띄우므로 워밍업 결과(클라이언트, 연결 풀, 배너)가 그대로 재사용됨
+    start_warm_up()
+
+    from streamlit.web import cli
+    sys.argv = ["streamlit", "run", str(APP_PATH), *sys.argv[1:]]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+-- 게시글 댓글 수 비정규화 컬럼
+-- comments 집계 대신 posts.comment_count 컬럼만 읽도록 트리거로 증감 유지
+
+alter table public.posts
+    add column if not exists comment_count integer not null default 0;
+
+-- 기존 데이터 채우기
+update public.posts p
+set comment_count = c.cnt
+from (
+    select post_id, count(*) as cnt
+    from public.comments
+    group by post_id
+) c
+where c.post_id = p.id;
+
+-- 댓글 추가 시 증가 (문장 단위 트리거 - 여러 행을 한 번에 넣어도 게시글당 UPDATE 1회)
+create or replace function public.increment_post_comment_count()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    update posts p
+    set comment_count = p.comment_count + n.cnt
+    from (
+        select post_id, count(*) as cnt
+        from inserted_comments
+        group by post_id
+    ) n
+    where p.id = n.post_id;
+    return null;
+end;
+$$;
+
+-- 댓글 삭제 시 감소 (회원 탈퇴 시 일괄 삭제도 게시글당 UPDATE 1회)
+create or replace function public.decrement_post_comment_count()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    update posts p
+    set comment_count = greatest(p.comment_count - d.cnt, 0)
+    from (
+        select post_id, count(*) as cnt
+        from deleted_comments
+        group by post_id
+    ) d
+    where p.id = d.post_id;
+    return null;
+end;
+$$;
+
+drop trigger if exists comments_increment_post_comment_count on public.comments;
+create trigger comments_increment_post_comment_count
+    after insert on public.comments
+    referencing new table as inserted_comments
+    for each statement
+    execute function public.increment_post_comment_count();
+
+drop trigger if exists comments_decrement_post_comment_count on public.comments;
+create trigger comments_decrement_post_comment_count
+    after delete on public.comments
+    referencing old table as deleted_comments
+    for each statement
+    execute function public.decrement_post_comment_count();
+
+-- 어긋난 댓글 수 일괄 보정 (scripts/reconcile_comment_counts.py가 service_role 키로 호출하거나 pg_cron에서 실행)
+-- 반환값: 보정된 게시글 수
+create or replace function public.reconcile_post_comment_counts()
+returns integer
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+    fixed integer;
+begin
+    update posts p
+    set comment_count = a.cnt
+    from (
+        select p2.id, count(c.id)::integer as cnt
+        from posts p2
+        left join comments c on c.post_id = p2.id
+        group by p2.id
+    ) a
+    where p.id = a.id
+      and p.comment_count is distinct from a.cnt;
+
+    get diagnostics fixed = row_count;
+    return fixed;
+end;
+$$;
+
+-- 트리거 함수와 전체 보정 함수는 PostgREST /rpc로 호출할 수 없도록 실행 권한 회수
+-- (트리거는 권한과 무관하게 실행되고, 보정 함수는 service_role 키로만 호출)
+revoke execute on function public.increment_post_comment_count() from public, anon, authenticated;
+revoke execute on function public.decrement_post_comment_count() from public, anon, authenticated;
+revoke execute on function public.reconcile_post_comment_counts() from public, anon, authenticated;
+grant execute on function public.reconcile_post_comment_counts() to service_role;
@@ -0,0 +1,32 @@
+-- 조회수 원자적 증가
+-- 읽고-쓰기(read-modify-write) 대신 DB에서 한 번에 증가시켜 동시 조회 시 누락 방지
+-- utils/view_counter.py가 게시글별 증가분을 모아 주기적으로 한 번에 호출 (service_role 키 전용)
+
+create or replace function public.increment_post_view_counts(
+    p_post_ids bigint[],
+    p_deltas integer[]
+)
+returns void
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    if cardinality(p_post_ids) is distinct from cardinality(p_deltas) then
+        raise exception 'p_post_ids와 p_deltas의 길이가 다릅니다.' using errcode = '22023';
+    end if;
+
+    if exists (select 1 from unnest(p_deltas) as d(delta) where d.delta is null or d.delta <= 0) then
+        raise exception '조회수 증가분은 양수여야 합니다.' using errcode = '22023';
+    end if;
+
+    update posts p
+    set view_count = coalesce(p.view_count, 0) + d.delta
+    from unnest(p_post_ids, p_deltas) as d(post_id, delta)
+    where p.id = d.post_id;
+end;
+$$;
+
+-- PostgREST /rpc로 누구나 임의의 증가분을 보낼 수 없도록 service_role만 실행 허용
+revoke execute on function public.increment_post_view_counts(bigint[], integer[]) from public, anon, authenticated;
+grant execute on function public.increment_post_view_counts(bigint[], integer[]) to service_role;
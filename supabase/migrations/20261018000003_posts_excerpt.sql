@@ -0,0 +1,12 @@
+-- 피드 카드용 본문 미리보기 컬럼
+-- 피드는 본문 전체(최대 800자) 대신 이 컬럼만 조회하고, 전체 본문은 게시글 열람 화면에서만 조회
+-- 미리보기 길이: 150자 (넘으면 말줄임표 추가)
+
+alter table public.posts
+    add column if not exists excerpt text
+    generated always as (
+        case
+            when char_length(content) > 150 then left(content, 150) || '…'
+            else content
+        end
+    ) stored;
@@ -0,0 +1,20 @@
+-- 게시판 카테고리 컬럼 및 피드 인덱스
+-- 카테고리 목록은 config/settings.py의 POST_CATEGORIES와 동일하게 유지
+
+alter table public.posts
+    add column if not exists category text not null default '자유게시판';
+
+alter table public.posts
+    drop constraint if exists posts_category_check;
+
+alter table public.posts
+    add constraint posts_category_check
+    check (category in ('자유게시판', '질문게시판', '정보공유', '스터디', '동아리', '기타'));
+
+-- 카테고리별 피드: school_id + category 조건, (created_at, id) 키셋 정렬
+create index if not exists posts_school_category_created_idx
+    on public.posts (school_id, category, created_at desc, id desc);
+
+-- 전체 피드: school_id 조건, (created_at, id) 키셋 정렬
+create index if not exists posts_school_created_idx
+    on public.posts (school_id, created_at desc, id desc);
@@ -0,0 +1,10 @@
+-- 학교 목록 일괄 적재 (scripts/load_schools.py)
+-- 정규화된 학교명을 기준으로 upsert하고, content_hash가 같은 행은 다시 쓰지 않음
+-- 기존 데이터에 같은 이름의 학교가 있으면 유니크 인덱스 생성 전에 먼저 정리해야 함
+
+alter table public.schools
+    add column if not exists content_hash text;
+
+-- upsert(on_conflict=name) 대상 및 중복 학교 방지
+create unique index if not exists schools_name_key
+    on public.schools (name);
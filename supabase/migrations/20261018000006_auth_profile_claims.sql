@@ -0,0 +1,47 @@
+-- 액세스 토큰 프로필 클레임 (Custom Access Token Hook)
+-- 로그인/세션 복원 시 users 조회 없이 토큰의 profile 클레임을 사용 (utils/identity.py)
+-- 적용 후 대시보드 Authentication > Hooks 에서 Custom Access Token 훅으로 이 함수를 지정해야 함
+-- 훅을 켜지 않아도 앱은 프로필 캐시/DB 조회로 동작함
+
+create or replace function public.custom_access_token_hook(event jsonb)
+returns jsonb
+language plpgsql
+stable
+as $$
+declare
+    claims jsonb := event->'claims';
+    user_profile jsonb;
+begin
+    select jsonb_build_object(
+        'id', u.id,
+        'email', u.email,
+        'nickname', u.nickname,
+        'phone', u.phone,
+        'contact_email', u.contact_email,
+        'created_at', u.created_at
+    )
+    into user_profile
+    from public.users u
+    where u.email = claims->>'email';
+
+    if user_profile is not null then
+        claims := jsonb_set(claims, '{profile}', user_profile);
+    end if;
+
+    return jsonb_set(event, '{claims}', claims);
+end;
+$$;
+
+grant usage on schema public to supabase_auth_admin;
+grant execute on function public.custom_access_token_hook to supabase_auth_admin;
+revoke execute on function public.custom_access_token_hook from authenticated, anon, public;
+grant select on table public.users to supabase_auth_admin;
+
+-- users에 RLS가 켜져 있어도 훅이 프로필을 읽을 수 있도록 허용
+drop policy if exists "auth admin can read users for token hook" on public.users;
+create policy "auth admin can read users for token hook"
+    on public.users
+    as permissive
+    for select
+    to supabase_auth_admin
+    using (true);
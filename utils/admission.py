@@ -0,0 +1,193 @@
+"""
+로그인 허용 제어
+이메일별/클라이언트 IP별 토큰 버킷과 동시 진행 수 제한으로 Auth 백엔드로 가는 로그인 요청을 제한 - 초과 요청은 기다리지 않고 바로 거절
+"""
+
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from config.settings import (
+    LOGIN_EMAIL_BURST,
+    LOGIN_EMAIL_REFILL_SECONDS,
+    LOGIN_IP_BURST,
+    LOGIN_IP_LIMIT_ENABLED,
+    LOGIN_IP_REFILL_SECONDS,
+    LOGIN_LIMITER_MAX_KEYS,
+    LOGIN_MAX_CONCURRENT,
+    LOGIN_QUEUE_WAIT_SECONDS,
+)
+
+
+class LoginThrottledError(Exception):
+    """로그인 요청이 허용량을 넘은 경우 (retry_after: 다시 시도할 수 있을 때까지 남은 초)"""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(f"로그인 요청 제한 ({reason}), {retry_after:.1f}초 후 재시도")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBuckets:
+    """
+    키별 토큰 버킷
+
+    - 키마다 최대 burst개의 토큰, refill_seconds마다 1개씩 다시 채워짐
+    - 요청 1회에 토큰 1개 사용, 토큰이 없으면 다음 토큰까지 남은 시간 반환
+    - 키가 max_keys개를 넘으면 가장 오래 사용하지 않은 키부터 제거 (제거된 키는 가득 찬 버킷으로 다시 시작)
+    """
+
+    def __init__(self, burst: int, refill_seconds: float, max_keys: int = LOGIN_LIMITER_MAX_KEYS):
+        self.burst = burst
+        self.refill_seconds = refill_seconds
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, key: str) -> float:
+        """
+        토큰 1개 사용 시도
+
+        Returns:
+            float: 0이면 허용, 그 외에는 다음 토큰까지 남은 초
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated_at) / self.refill_seconds)
+
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                self._buckets.move_to_end(key)
+                return (1 - tokens) * self.refill_seconds
+
+            self._buckets[key] = (tokens - 1, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return 0.0
+
+    def refund(self, key: str) -> None:
+        """try_acquire()로 사용한 토큰 1개 반환 (요청이 다른 한도에 걸려 실제로 처리되지 않은 경우)"""
+        with self._lock:
+            if key in self._buckets:
+                tokens, updated_at = self._buckets[key]
+                self._buckets[key] = (min(self.burst, tokens + 1), updated_at)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._buckets)
+
+
+class LoginAdmission:
+    """
+    로그인 허용 제어
+
+    admit()은 이메일 버킷 → IP 버킷 → 동시 진행 자리 순으로 확인하고,
+    하나라도 초과하면 Auth 백엔드를 호출하기 전에 LoginThrottledError를 발생시킵니다.
+    뒤 단계에서 거절되면 앞 단계에서 사용한 토큰은 돌려주므로, 혼잡(busy)으로 거절된 시도는
+    사용자의 이메일 한도를 소모하지 않습니다.
+    동시 진행 자리는 queue_wait_seconds까지만 기다리므로 급증 시에도 요청이 쌓이지 않습니다.
+    IP 한도는 ip_limit이 True일 때만 적용합니다 (LOGIN_IP_LIMIT_ENABLED 참고).
+
+    지표 (프로세스 전체):
+        - admitted: 허용된 로그인 수
+        - rejected_email / rejected_ip / rejected_busy: 이메일 한도 / IP 한도 / 동시 진행 한도 초과로 거절한 수
+    """
+
+    def __init__(
+        self,
+        email_buckets: Optional[TokenBuckets] = None,
+        ip_buckets: Optional[TokenBuckets] = None,
+        max_concurrent: int = LOGIN_MAX_CONCURRENT,
+        queue_wait_seconds: float = LOGIN_QUEUE_WAIT_SECONDS,
+        ip_limit: bool = LOGIN_IP_LIMIT_ENABLED,
+    ):
+        if email_buckets is None:
+            email_buckets = TokenBuckets(LOGIN_EMAIL_BURST, LOGIN_EMAIL_REFILL_SECONDS)
+        if ip_buckets is None:
+            ip_buckets = TokenBuckets(LOGIN_IP_BURST, LOGIN_IP_REFILL_SECONDS)
+        self.email_buckets = email_buckets
+        self.ip_buckets = ip_buckets
+        self.ip_limit = ip_limit
+        self.max_concurrent = max_concurrent
+        self.queue_wait_seconds = queue_wait_seconds
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _reject(self, reason: str, retry_after: float) -> LoginThrottledError:
+        with self._lock:
+            self._counters[f"rejected_{reason}"] += 1
+        return LoginThrottledError(reason, retry_after)
+
+    @contextmanager
+    def admit(self, email: str, ip_address: Optional[str] = None) -> Iterator[None]:
+        """
+        로그인 1회 허용 (블록 안에서 Auth 호출 수행)
+
+        Args:
+            email: 로그인 이메일 (대소문자/앞뒤 공백 무시)
+            ip_address: 클라이언트 IP (알 수 없거나 ip_limit이 False면 IP 한도는 적용하지 않음)
+
+        Raises:
+            LoginThrottledError: 한도 초과
+
+        Example:
+            >>> with get_login_admission().admit(email, st.context.ip_address):
+            ...     supabase.auth.sign_in_with_password({...})
+        """
+        email_key = email.strip().lower()
+        ip_key = ip_address if self.ip_limit else None
+
+        retry_after = self.email_buckets.try_acquire(email_key)
+        if retry_after:
+            raise self._reject("email", retry_after)
+
+        if ip_key:
+            retry_after = self.ip_buckets.try_acquire(ip_key)
+            if retry_after:
+                self.email_buckets.refund(email_key)
+                raise self._reject("ip", retry_after)
+
+        if not self._slots.acquire(timeout=self.queue_wait_seconds):
+            self.email_buckets.refund(email_key)
+            if ip_key:
+                self.ip_buckets.refund(ip_key)
+            raise self._reject("busy", 1.0)
+
+        with self._lock:
+            self._counters["admitted"] += 1
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+
+# 전역 싱글톤 인스턴스
+_login_admission: Optional[LoginAdmission] = None
+_login_admission_lock = threading.Lock()
+
+
+def get_login_admission() -> LoginAdmission:
+    """로그인 허용 제어 인스턴스 반환 (싱글톤 패턴)"""
+    global _login_admission
+
+    if _login_admission is None:
+        with _login_admission_lock:
+            if _login_admission is None:
+                _login_admission = LoginAdmission()
+
+    return _login_admission
+
+
+def get_login_admission_metrics() -> dict[str, int]:
+    """로그인 허용/거절 지표 (0인 항목은 생략)"""
+    return get_login_admission().snapshot()
+
@@ -0,0 +1,149 @@
+"""
+정적 에셋 관리
+배너 이미지를 정적 파일로 제공 - 크기별/WebP 변환본을 서버 시작 시 한 번만 생성
+"""
+
+import hashlib
+import logging
+import shutil
+import threading
+import time
+from html import escape
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트 (app.py 위치 = Streamlit 정적 파일 기준 경로)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 원본 배너 이미지
+BANNER_SOURCE = PROJECT_ROOT / "assets" / "pupu.png"
+
+# 정적 파일 디렉터리 (.streamlit/config.toml의 enableStaticServing 필요)
+STATIC_DIR = PROJECT_ROOT / "static"
+BANNER_DIR = STATIC_DIR / "banner"
+STATIC_URL = "app/static"
+
+# 생성할 배너 가로 크기 (px)
+BANNER_WIDTHS = (640, 1280, 1920)
+
+# 변환본 생성에 실패한 뒤 다시 시도하기까지 기다리는 시간 (초)
+BANNER_RETRY_SECONDS = 60
+
+logger = logging.getLogger("campuslink.assets")
+
+_banner_html: Optional[str] = None
+_banner_failed_at: Optional[float] = None
+_banner_lock = threading.Lock()
+
+
+def _generate_banner_variants(source: Path) -> list[tuple[str, int, str]]:
+    """
+    배너 변환본 생성
+
+    파일명에 원본 내용 해시를 넣어 원본이 바뀌면 브라우저 캐시도 갱신되도록 하고,
+    이미 생성된 파일은 다시 만들지 않습니다.
+    Pillow가 없으면 원본 PNG만 정적 디렉터리에 복사합니다.
+
+    Returns:
+        list: (MIME 타입, 가로 크기, URL) 목록
+    """
+    digest = hashlib.sha1(source.read_bytes()).hexdigest()[:10]
+    BANNER_DIR.mkdir(parents=True, exist_ok=True)
+
+    try:
+        from PIL import Image
+    except ImportError:
+        target = BANNER_DIR / f"{source.stem}-{digest}.png"
+        if not target.exists():
+            shutil.copyfile(source, target)
+        return [("image/png", 0, f"{STATIC_URL}/banner/{target.name}")]
+
+    variants = []
+    with Image.open(source) as image:
+        image.load()
+        # 원본보다 큰 크기는 원본 크기로 맞추고 중복 제거
+        for width in sorted({min(width, image.width) for width in BANNER_WIDTHS}):
+            height = round(image.height * width / image.width)
+            resized = None
+
+            for fmt, ext, options in (
+                ("WEBP", "webp", {"quality": 82, "method": 6}),
+                ("PNG", "png", {"optimize": True}),
+            ):
+                target = BANNER_DIR / f"{source.stem}-{digest}-{width}.{ext}"
+                if not target.exists():
+                    if resized is None:
+                        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                    # 동시 생성 중 반쯤 쓰인 파일이 서빙되지 않도록 임시 파일 후 교체
+                    temp = target.with_suffix(f".tmp.{ext}")
+                    resized.save(temp, fmt, **options)
+                    temp.replace(target)
+                variants.append((f"image/{ext}", width, f"{STATIC_URL}/banner/{target.name}"))
+
+    return variants
+
+
+def _build_banner_html(variants: list[tuple[str, int, str]]) -> str:
+    """변환본 목록으로 반응형 <picture> 배너 HTML 생성"""
+    def srcset(mime: str) -> str:
+        return ", ".join(
+            f"{escape(url)} {width}w" if width else escape(url)
+            for variant_mime, width, url in variants
+            if variant_mime == mime
+        )
+
+    webp_srcset = srcset("image/webp")
+    png_variants = [url for mime, _, url in variants if mime == "image/png"]
+    webp_source = f'<source type="image/webp" srcset="{webp_srcset}" sizes="100vw">' if webp_srcset else ""
+
+    return f"""
+    <div class="custom-banner">
+        <picture>
+            {webp_source}
+            <img src="{escape(png_variants[-1])}" srcset="{srcset("image/png")}" sizes="100vw" alt="배너" />
+        </picture>
+    </div>
+    """
+
+
+def ensure_banner_variants() -> Optional[str]:
+    """
+    배너 변환본 생성 후 배너 HTML 반환 (성공하면 프로세스당 한 번만 생성)
+
+    생성에 실패하면 오류를 기록하고 BANNER_RETRY_SECONDS 동안은 배너 없이 렌더링한 뒤 다시 시도합니다.
+
+    Returns:
+        str or None: 배너 HTML (원본 이미지가 없거나 생성 실패 시 None)
+    """
+    global _banner_html, _banner_failed_at
+
+    if _banner_html is not None:
+        return _banner_html
+
+    if _banner_failed_at is not None and time.monotonic() - _banner_failed_at < BANNER_RETRY_SECONDS:
+        return None
+
+    with _banner_lock:
+        if _banner_html is None and (
+            _banner_failed_at is None or time.monotonic() - _banner_failed_at >= BANNER_RETRY_SECONDS
+        ):
+            try:
+                _banner_html = _build_banner_html(_generate_banner_variants(BANNER_SOURCE))
+                _banner_failed_at = None
+            except Exception:
+                logger.exception("배너 변환본 생성 실패, %d초 후 재시도: %s", BANNER_RETRY_SECONDS, BANNER_SOURCE)
+                _banner_failed_at = time.monotonic()
+
+    return _banner_html
+
+
+def get_banner_html() -> Optional[str]:
+    """
+    배너 HTML 반환 - 이미지 바이트 대신 정적 파일 URL만 포함
+
+    Example:
+        >>> banner_html = get_banner_html()
+        >>> if banner_html:
+        ...     st.markdown(banner_html, unsafe_allow_html=True)
+    """
+    return ensure_banner_variants()
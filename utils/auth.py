@@ -3,14 +3,270 @@
 Supabase Auth 기반 로그인, 로그아웃, 세션 관리
 """
 
+import json
+import math
+import threading
+import time
 import streamlit as st
 from typing import Optional, Dict, Any
-from utils.supabase_client import get_supabase_client
+from config.settings import SESSION_COOKIE_NAME
+from utils.admission import LoginThrottledError, get_login_admission
+from utils.supabase_client import get_supabase_client, peek_supabase_client, release_supabase_client
+from utils.identity import get_user_profile, restore_auth_session, token_expires_at, verified_claims
+from utils.script_context import current_session_id
+from utils.session_store import dump_user, get_session_store, load_user
+from utils.token_refresher import get_token_refresher
+
+# 세션 복원을 시도한 토큰 - 같은 토큰으로는 다시 시도하지 않음 (비로그인 결과도 캐시)
+_RESTORE_ATTEMPT_KEY = "_session_restore_attempt"
+
+# 세션 저장소의 세션 ID (로그인/쿠키 복원 시 설정)
+_STORED_SESSION_KEY = "_stored_session_id"
+
+# 다음 렌더링 때 브라우저에 기록할 세션 쿠키 (값, Max-Age) - 로그아웃은 빈 값과 0
+_PENDING_COOKIE_KEY = "_pending_session_cookie"
+
+# 만료된 저장소 세션 복원 시 갱신을 한 번에 하나씩 수행 (같은 쿠키로 동시에 새로고침한 세션이 같은 토큰을 두 번 갱신하지 않도록)
+_restore_refresh_lock = threading.Lock()
+
+
+def _session_record() -> dict:
+    """세션 저장소에 보관할 로그인 상태"""
+    return {
+        "user": dump_user(st.session_state.user),
+        "access_token": st.session_state.access_token,
+        "refresh_token": st.session_state.refresh_token,
+        "token_expires_at": st.session_state.token_expires_at,
+        "user_data": st.session_state.user_data,
+    }
+
+
+def _save_refreshed_tokens(stored_session_id: str):
+    """백그라운드 토큰 갱신 결과를 세션 저장소에 바로 기록 (재실행 없이 브라우저를 닫아도 유효한 토큰 유지)"""
+    store = get_session_store()
+    
+    def on_refresh(refreshed):
+        record = store.load(stored_session_id)
+        if record is not None:
+            record.update(
+                access_token=refreshed.access_token,
+                refresh_token=refreshed.refresh_token,
+                token_expires_at=refreshed.expires_at,
+            )
+            store.save(stored_session_id, record)
+    
+    return on_refresh
+
+
+def save_session():
+    """
+    현재 로그인 상태를 세션 저장소에 반영 (프로필 수정 등 session_state를 바꾼 뒤 호출)
+    
+    쿠키로 연결된 저장소 세션이 없으면 아무것도 하지 않습니다.
+    """
+    stored_session_id = st.session_state.get(_STORED_SESSION_KEY)
+    if stored_session_id is not None and st.session_state.get("logged_in"):
+        get_session_store().save(stored_session_id, _session_record())
+
+
+def clear_saved_session():
+    """세션 저장소에서 현재 세션을 삭제하고 브라우저 세션 쿠키 삭제 예약 (로그아웃/회원 탈퇴)"""
+    stored_session_id = st.session_state.pop(_STORED_SESSION_KEY, None)
+    if stored_session_id is not None:
+        get_session_store().delete(stored_session_id)
+        get_token_refresher().untrack(stored_session_id)
+    if stored_session_id is not None or st.context.cookies.get(SESSION_COOKIE_NAME):
+        st.session_state[_PENDING_COOKIE_KEY] = ("", 0)
+
+
+def _render_pending_cookie():
+    """
+    예약된 세션 쿠키를 브라우저에 기록
+    
+    Streamlit은 응답 헤더를 설정할 수 없으므로 스크립트로 document.cookie를 씁니다.
+    쿠키 값은 서명된 세션 ID일 뿐이며 토큰은 서버의 세션 저장소에만 있습니다.
+    """
+    pending = st.session_state.pop(_PENDING_COOKIE_KEY, None)
+    if pending is None:
+        return
+    
+    value, max_age = pending
+    cookie = json.dumps(f"{SESSION_COOKIE_NAME}={value}; Path=/; Max-Age={max_age}; SameSite=Lax")
+    st.html(
+        f"""<script>
+        document.cookie = {cookie} + (window.location.protocol === "https:" ? "; Secure" : "");
+        </script>""",
+        unsafe_allow_javascript=True,
+    )
+
+
+def _restore_stored_session() -> bool:
+    """
+    세션 쿠키가 가리키는 세션 저장소 기록으로 로그인 상태 복원 (로컬 SQLite 조회만 수행)
+    
+    저장된 액세스 토큰이 이미 만료된 경우에만 리프레시 토큰으로 한 번 갱신합니다.
+    갱신에 실패하면(폐기된 토큰 등) 기록을 삭제하고 비로그인 상태로 둡니다.
+    
+    Returns:
+        bool: 복원 여부
+    """
+    cookie = st.context.cookies.get(SESSION_COOKIE_NAME)
+    if not cookie:
+        return False
+    
+    store = get_session_store()
+    stored_session_id = store.unsign(cookie)
+    if stored_session_id is None:
+        return False
+    
+    record = store.load(stored_session_id)
+    if record is None or not record.get("user_data"):
+        return False
+    
+    user = load_user(record["user"])
+    access_token = record["access_token"]
+    refresh_token = record["refresh_token"]
+    expires_at = record.get("token_expires_at") or token_expires_at(access_token)
+    
+    if expires_at is None or expires_at <= time.time():
+        with _restore_refresh_lock:
+            # 기다리는 동안 다른 세션이 먼저 갱신했으면 저장소의 새 토큰 사용
+            record = store.load(stored_session_id)
+            if record is None:
+                return False
+            access_token = record["access_token"]
+            refresh_token = record["refresh_token"]
+            expires_at = record.get("token_expires_at") or token_expires_at(access_token)
+            
+            if expires_at is None or expires_at <= time.time():
+                try:
+                    session = get_supabase_client().auth.refresh_session(refresh_token).session
+                except Exception:
+                    store.delete(stored_session_id)
+                    return False
+                user = session.user or user
+                access_token, refresh_token, expires_at = session.access_token, session.refresh_token, session.expires_at
+                record.update(access_token=access_token, refresh_token=refresh_token, token_expires_at=expires_at)
+                store.save(stored_session_id, record)
+    
+    st.session_state.logged_in = True
+    st.session_state.user = user
+    st.session_state.access_token = access_token
+    st.session_state.refresh_token = refresh_token
+    st.session_state.token_expires_at = expires_at
+    st.session_state.user_data = record["user_data"]
+    st.session_state[_STORED_SESSION_KEY] = stored_session_id
+    
+    # 만료 시각 연장 (갱신된 토큰이 있으면 함께 기록)
+    store.save(stored_session_id, _session_record())
+    return True
+
+
+def _restore_session():
+    """
+    로그인 상태 복원 (세션 저장소 → 세션 클라이언트에 남아 있는 Supabase 세션 순)
+    
+    새로고침으로 session_state가 비었으면 세션 쿠키로 세션 저장소에서 복원하고,
+    그렇지 않고 이 세션에서 만들어진 클라이언트도 없으면 복원할 세션이 없으므로 백엔드를 호출하지 않습니다.
+    """
+    if _restore_stored_session():
+        return
+    
+    supabase = peek_supabase_client()
+    if supabase is None:
+        return
+    
+    session = supabase.auth.get_session()
+    
+    if session and session.user:
+        # users 정보 (토큰의 프로필 클레임 또는 프로필 캐시, 없으면 DB 조회)
+        user_data = get_user_profile(supabase, session.user.email, verified_claims(session.access_token))
+        
+        if user_data:
+            # 세션 복원
+            st.session_state.logged_in = True
+            st.session_state.user = session.user
+            st.session_state.access_token = session.access_token
+            st.session_state.refresh_token = session.refresh_token
+            st.session_state.token_expires_at = session.expires_at
+            st.session_state.user_data = user_data
+
+
+def _adopt_stored_tokens(stored_session_id: str):
+    """
+    세션 저장소 기록과 session_state 중 더 새로운 토큰으로 맞춤 (재실행마다 로컬 SQLite 조회만 수행)
+    
+    같은 쿠키로 복원된 다른 Streamlit 세션(새로고침 전 탭 등)이 갱신한 토큰을 가져오고,
+    이미 만들어진 세션 클라이언트에도 설정하여 폐기된 리프레시 토큰을 다시 쓰지 않게 합니다.
+    반대로 이 세션의 토큰이 더 새로우면(저장소 기록 실패 등) 저장소 기록을 갱신합니다.
+    """
+    record = get_session_store().load(stored_session_id)
+    if record is None or record.get("refresh_token") == st.session_state.refresh_token:
+        return
+    if (record.get("token_expires_at") or 0) < (st.session_state.token_expires_at or 0):
+        save_session()
+        return
+    
+    st.session_state.access_token = record["access_token"]
+    st.session_state.refresh_token = record["refresh_token"]
+    st.session_state.token_expires_at = record["token_expires_at"]
+    
+    client = peek_supabase_client()
+    if client is not None:
+        restore_auth_session(client.auth, record["access_token"], record["refresh_token"], st.session_state.user)
+
+
+def _sync_token_refresh():
+    """
+    백그라운드에서 갱신된 토큰을 session_state에 반영하고 현재 토큰을 갱신 대상으로 등록
+    
+    갱신은 작업 스레드에서 만료 전에 미리 수행되므로 여기서는 네트워크 호출 없이 결과만 가져옵니다.
+    유휴로 추적이 끝난 뒤 클라이언트를 다시 만들면서 만료된 토큰이 갱신된 경우에는
+    새 토큰을 세션 저장소에도 기록하여 폐기된 리프레시 토큰이 남지 않게 합니다.
+    
+    세션 저장소에 연결된 세션은 Streamlit 세션 ID 대신 저장소 세션 ID로 등록하므로, 같은 쿠키로 복원된
+    여러 세션이 있어도 리프레시 토큰 하나는 한 번만 갱신됩니다 (같은 토큰을 두 번 쓰면 재사용으로 폐기됨).
+    """
+    session_id = current_session_id()
+    if session_id is None or not st.session_state.refresh_token:
+        return
+    
+    stored_session_id = st.session_state.get(_STORED_SESSION_KEY)
+    if stored_session_id is not None:
+        _adopt_stored_tokens(stored_session_id)
+    
+    refresh_token = st.session_state.refresh_token
+    client = get_supabase_client()
+    if st.session_state.refresh_token != refresh_token:
+        save_session()
+    
+    refresher = get_token_refresher()
+    tracking_id = stored_session_id or session_id
+    if tracking_id != session_id:
+        # 저장소 세션에 연결되기 전 Streamlit 세션 ID로 등록한 항목은 중단 (같은 토큰을 두 항목이 갱신하지 않도록)
+        refresher.untrack(session_id)
+    
+    refreshed = refresher.take_refreshed(tracking_id, st.session_state.refresh_token)
+    if refreshed is not None:
+        st.session_state.access_token = refreshed.access_token
+        st.session_state.refresh_token = refreshed.refresh_token
+        st.session_state.token_expires_at = refreshed.expires_at
+    
+    on_refresh = _save_refreshed_tokens(stored_session_id) if stored_session_id is not None else None
+    
+    expires_at = st.session_state.token_expires_at or token_expires_at(st.session_state.access_token)
+    if expires_at:
+        refresher.track(tracking_id, client, st.session_state.refresh_token, int(expires_at), on_refresh)
 
 
 def init_session_state():
     """
     Streamlit session_state 초기화 + 세션 복원
+    
+    is_logged_in()/require_login()/get_current_user()마다 호출되므로 복원은 세션당
+    (토큰이 바뀔 때마다) 한 번만 시도하고, 비로그인 결과도 기억하여 다시 조회하지 않습니다.
+    로그인 상태에서는 백그라운드에서 갱신된 토큰만 반영합니다.
+    예약된 세션 쿠키 변경(로그인/로그아웃)이 있으면 여기서 브라우저에 기록합니다.
     """
     if "logged_in" not in st.session_state:
         st.session_state.logged_in = False
@@ -21,27 +277,31 @@ def init_session_state():
     if "access_token" not in st.session_state:
         st.session_state.access_token = None
     
+    if "refresh_token" not in st.session_state:
+        st.session_state.refresh_token = None
+    
+    if "token_expires_at" not in st.session_state:
+        st.session_state.token_expires_at = None
+    
     if "user_data" not in st.session_state:
         st.session_state.user_data = None
     
-    # 🔥 핵심: 새로고침 시 Supabase 세션이 살아있으면 복원
-    if not st.session_state.logged_in:
+    # 🔥 핵심: 새로고침 시 Supabase 세션이 살아있으면 복원 (같은 토큰으로는 한 번만 시도)
+    restore_key = (st.session_state.access_token, st.session_state.refresh_token)
+    if not st.session_state.logged_in and st.session_state.get(_RESTORE_ATTEMPT_KEY) != restore_key:
+        st.session_state[_RESTORE_ATTEMPT_KEY] = restore_key
         try:
-            supabase = get_supabase_client()
-            session = supabase.auth.get_session()
-            
-            if session and session.user:
-                # users 테이블에서 정보 조회
-                user_response = supabase.table("users").select("*").eq("email", session.user.email).execute()
-                
-                if user_response.data and len(user_response.data) > 0:
-                    # 세션 복원
-                    st.session_state.logged_in = True
-                    st.session_state.user = session.user
-                    st.session_state.access_token = session.access_token
-                    st.session_state.user_data = user_response.data[0]
+            _restore_session()
+        except Exception:
+            pass
+    
+    if st.session_state.logged_in:
+        try:
+            _sync_token_refresh()
         except Exception:
             pass
+    
+    _render_pending_cookie()
 
 
 def is_logged_in() -> bool:
@@ -75,31 +335,51 @@ def login_user(email: str, password: str) -> tuple[bool, str]:
     try:
         supabase = get_supabase_client()
         
-        # 1단계: Supabase Auth 로그인
-        auth_response = supabase.auth.sign_in_with_password({
-            "email": email,
-            "password": password
-        })
-        
-        if not auth_response.user:
-            return False, "로그인 실패"
-        
-        # 2단계: users 테이블에서 추가 정보 조회 (이메일로 조회)
-        user_response = supabase.table("users").select("*").eq("email", email).execute()
+        # 이메일/IP별 시도 횟수와 동시 진행 수가 한도 안일 때만 Auth 백엔드 호출 (초과 시 LoginThrottledError)
+        with get_login_admission().admit(email, st.context.ip_address):
+            # 1단계: Supabase Auth 로그인
+            auth_response = supabase.auth.sign_in_with_password({
+                "email": email,
+                "password": password
+            })
+            
+            if not auth_response.user:
+                return False, "로그인 실패"
+            
+            # 2단계: users 정보 (토큰의 프로필 클레임 또는 프로필 캐시, 없으면 이메일로 DB 조회)
+            claims = verified_claims(auth_response.session.access_token)
+            user_data = get_user_profile(supabase, email, claims)
         
-        if not user_response.data or len(user_response.data) == 0:
+        if not user_data:
             return False, "사용자 정보를 찾을 수 없습니다."
         
-        user_data = user_response.data[0]
-        
         # 3단계: session_state 업데이트 (Auth 정보 + DB 정보)
         st.session_state.logged_in = True
         st.session_state.user = auth_response.user
         st.session_state.access_token = auth_response.session.access_token
+        st.session_state.refresh_token = auth_response.session.refresh_token
+        st.session_state.token_expires_at = auth_response.session.expires_at
         st.session_state.user_data = user_data  # DB의 추가 정보 저장
+        st.session_state.pop(_RESTORE_ATTEMPT_KEY, None)
+        
+        # 4단계: 새로고침 후에도 복원되도록 세션 저장소에 기록하고 세션 쿠키 발급 예약
+        try:
+            clear_saved_session()
+            store = get_session_store()
+            stored_session_id = store.create(_session_record())
+            st.session_state[_STORED_SESSION_KEY] = stored_session_id
+            st.session_state[_PENDING_COOKIE_KEY] = (store.sign(stored_session_id), int(store.ttl_seconds))
+        except Exception:
+            pass
+        
+        # 만료 전 백그라운드 갱신 예약
+        _sync_token_refresh()
         
         return True, "로그인 성공"
     
+    except LoginThrottledError as e:
+        return False, f"로그인 요청이 많습니다. {max(1, math.ceil(e.retry_after))}초 후 다시 시도해주세요."
+    
     except Exception as e:
         error_msg = str(e).lower()
         
@@ -133,11 +413,24 @@ def logout_user():
     except Exception:
         pass
     
+    # 인증 상태가 남지 않도록 세션 클라이언트 폐기, 토큰 갱신 중단, 저장된 세션과 쿠키 삭제
+    release_supabase_client()
+    session_id = current_session_id()
+    if session_id is not None:
+        get_token_refresher().untrack(session_id)
+    try:
+        clear_saved_session()
+    except Exception:
+        pass
+    
     # session_state 초기화
     st.session_state.logged_in = False
     st.session_state.user = None
     st.session_state.access_token = None
+    st.session_state.refresh_token = None
+    st.session_state.token_expires_at = None
     st.session_state.user_data = None
+    st.session_state.pop(_RESTORE_ATTEMPT_KEY, None)
 
 
 def get_current_user() -> Optional[Dict[str, Any]]:
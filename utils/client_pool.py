@@ -0,0 +1,148 @@
+"""
+세션별 Supabase 클라이언트 풀
+세션마다 인증 상태가 분리된 클라이언트를 두고, HTTP 연결 풀(keep-alive/TLS)은 모든 클라이언트가 공유
+"""
+
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from config.settings import (
+    SUPABASE_CLIENT_IDLE_SECONDS,
+    SUPABASE_CLIENT_POOL_SIZE,
+    SUPABASE_HTTP2,
+    SUPABASE_HTTP_KEEPALIVE_SECONDS,
+    SUPABASE_HTTP_MAX_CONNECTIONS,
+    SUPABASE_HTTP_MAX_KEEPALIVE,
+    SUPABASE_HTTP_TIMEOUT_SECONDS,
+)
+
+
+def create_shared_http_client():
+    """
+    모든 세션 클라이언트가 공유하는 httpx 클라이언트 생성
+
+    postgrest/gotrue는 요청마다 인증 헤더를 넘기므로 세션 간에 헤더가 섞이지 않고,
+    연결 풀만 공유되어 TLS 핸드셰이크를 재사용합니다.
+    HTTP/2는 h2 패키지가 설치된 경우에만 사용합니다.
+    """
+    import httpx
+
+    return httpx.Client(
+        http2=SUPABASE_HTTP2 and importlib.util.find_spec("h2") is not None,
+        timeout=httpx.Timeout(SUPABASE_HTTP_TIMEOUT_SECONDS),
+        limits=httpx.Limits(
+            max_connections=SUPABASE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=SUPABASE_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=SUPABASE_HTTP_KEEPALIVE_SECONDS,
+        ),
+        follow_redirects=True,
+    )
+
+
+def _release_client(client: Any) -> None:
+    """풀에서 제거된 클라이언트의 자동 토큰 갱신 타이머 정리 (공유 HTTP 연결은 닫지 않음)"""
+    auth = getattr(client, "auth", None)
+    timer = getattr(auth, "_refresh_token_timer", None)
+    if timer is not None:
+        timer.cancel()
+
+
+class SessionClientPool:
+    """
+    Streamlit 세션 ID별 클라이언트 풀
+
+    - 세션마다 별도 클라이언트를 만들어 로그인/로그아웃이 다른 세션의 인증 상태를 바꾸지 않음
+    - idle_seconds 동안 사용되지 않은 클라이언트는 다음 조회 시 제거
+    - 최대 개수를 넘으면 가장 오래 사용되지 않은 클라이언트부터 제거 (LRU)
+    - 클라이언트 생성은 잠금 밖에서 수행하여 다른 세션의 조회를 막지 않음
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_clients: int = SUPABASE_CLIENT_POOL_SIZE,
+        idle_seconds: float = SUPABASE_CLIENT_IDLE_SECONDS,
+    ):
+        self.factory = factory
+        self.max_clients = max_clients
+        self.idle_seconds = idle_seconds
+        self._clients: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> tuple[Any, bool]:
+        """
+        세션 클라이언트 반환 (없으면 생성)
+
+        Returns:
+            tuple: (클라이언트, 새로 생성 여부)
+        """
+        with self._lock:
+            evicted = self._evict_idle()
+            entry = self._clients.get(session_id)
+            if entry is not None:
+                self._clients[session_id] = (time.monotonic(), entry[1])
+                self._clients.move_to_end(session_id)
+
+        for client in evicted:
+            _release_client(client)
+        if entry is not None:
+            return entry[1], False
+
+        client = self.factory()
+
+        with self._lock:
+            entry = self._clients.get(session_id)
+            if entry is None:
+                self._clients[session_id] = (time.monotonic(), client)
+                evicted = []
+                while len(self._clients) > self.max_clients:
+                    evicted.append(self._clients.popitem(last=False)[1][1])
+            else:
+                # 동시에 다른 스레드가 먼저 생성한 경우 그 클라이언트 사용
+                evicted = [client]
+                client = entry[1]
+
+        for stale in evicted:
+            _release_client(stale)
+        return client, entry is None
+
+    def peek(self, session_id: str) -> Optional[Any]:
+        """이미 만들어진 세션 클라이언트 반환 (없으면 만들지 않고 None, 사용 시각도 갱신하지 않음)"""
+        with self._lock:
+            entry = self._clients.get(session_id)
+        return entry[1] if entry is not None else None
+
+    def discard(self, session_id: str) -> None:
+        """세션 클라이언트 제거"""
+        with self._lock:
+            entry = self._clients.pop(session_id, None)
+        if entry is not None:
+            _release_client(entry[1])
+
+    def clear(self) -> None:
+        """모든 세션 클라이언트 제거"""
+        with self._lock:
+            clients = [client for _, client in self._clients.values()]
+            self._clients.clear()
+        for client in clients:
+            _release_client(client)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def _evict_idle(self) -> list:
+        """유휴 시간이 지난 클라이언트 제거 (잠금 안에서 호출, 오래된 순으로 정렬되어 있음)"""
+        deadline = time.monotonic() - self.idle_seconds
+        evicted = []
+        while self._clients:
+            session_id, (last_used, client) = next(iter(self._clients.items()))
+            if last_used >= deadline:
+                break
+            del self._clients[session_id]
+            evicted.append(client)
+        return evicted
+
@@ -0,0 +1,96 @@
+"""
+독립 쿼리 동시 조회
+서로 의존하지 않는 조회를 병렬로 실행하고 렌더링 전에 합류 - 페이지 지연이 쿼리 합계가 아닌 가장 느린 쿼리에 가까워짐
+"""
+
+import threading
+from typing import Any, Callable
+
+from config.settings import FETCH_MAX_THREADS
+
+# 프로세스 전체 동시 조회 스레드 수 제한 (초과분은 호출 스레드에서 순차 실행)
+_thread_slots = threading.BoundedSemaphore(FETCH_MAX_THREADS)
+
+
+class _Failure:
+    """조회 중 발생한 예외 보관"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def _attach_script_run_ctx(thread: threading.Thread) -> None:
+    """
+    현재 스크립트 실행 컨텍스트를 작업 스레드에 연결
+
+    세션 클라이언트/재실행 메모(session_state)를 작업 스레드에서도 그대로 사용하기 위해 필요합니다.
+    """
+    try:
+        from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+    except ImportError:
+        return
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is not None:
+        add_script_run_ctx(thread, ctx)
+
+
+def fetch_all(*loaders: Callable[[], Any], return_exceptions: bool = False) -> list:
+    """
+    조회 함수들을 동시에 실행하고 모두 끝날 때까지 대기
+
+    첫 번째 함수는 호출 스레드에서 실행하고 나머지는 스레드마다 하나씩 실행합니다.
+    조회 함수 안에서는 st.* 렌더링 호출을 하지 말고 데이터만 반환해야 합니다.
+
+    Args:
+        loaders: 인자 없는 조회 함수
+        return_exceptions: True면 예외를 결과 자리에 담아 반환, False면 첫 예외를 다시 발생
+
+    Returns:
+        list: loaders 순서대로의 결과
+
+    Example:
+        >>> post_response, comments_response = fetch_all(
+        ...     lambda: supabase.table("posts").select("*").eq("id", post_id).execute(),
+        ...     lambda: supabase.table("comments").select("*").eq("post_id", post_id).execute(),
+        ... )
+    """
+    results: list = [None] * len(loaders)
+
+    def run(index: int, loader: Callable[[], Any]) -> None:
+        try:
+            results[index] = loader()
+        except Exception as e:
+            results[index] = _Failure(e)
+
+    threads = []
+    for index, loader in enumerate(loaders[1:], start=1):
+        if not _thread_slots.acquire(blocking=False):
+            # 동시 조회 스레드가 모두 사용 중이면 순차 실행으로 대체
+            run(index, loader)
+            continue
+
+        def run_in_slot(index=index, loader=loader):
+            try:
+                run(index, loader)
+            finally:
+                _thread_slots.release()
+
+        thread = threading.Thread(target=run_in_slot, name=f"fetch-{index}", daemon=True)
+        _attach_script_run_ctx(thread)
+        thread.start()
+        threads.append(thread)
+
+    if loaders:
+        run(0, loaders[0])
+
+    for thread in threads:
+        thread.join()
+
+    for index, result in enumerate(results):
+        if isinstance(result, _Failure):
+            if not return_exceptions:
+                raise result.error
+            results[index] = result.error
+
+    return results
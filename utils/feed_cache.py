@@ -0,0 +1,103 @@
+"""
+게시글 피드 캐시
+프로세스 전역 TTL + LRU 캐시 - 모든 세션이 공유
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from config.settings import FEED_CACHE_MAX_ENTRIES, FEED_CACHE_TTL_SECONDS
+
+
+class FeedCache:
+    """
+    (school_id, category, cursor) 키로 피드 페이지를 보관하는 캐시
+
+    - TTL이 지난 항목은 조회 시 만료 처리
+    - 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    - 글/댓글 작성 시 해당 학교의 항목을 모두 무효화 (write-through)
+
+    캐시된 값은 여러 세션이 공유하므로 읽기 전용으로 다뤄야 합니다.
+    """
+
+    def __init__(self, max_entries: int = FEED_CACHE_MAX_ENTRIES, ttl_seconds: float = FEED_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(school_id, category: str, cursor: Optional[Hashable]) -> tuple:
+        """캐시 키 생성 (쿼리 파라미터의 문자열 ID와 DB의 정수 ID를 같은 키로 취급)"""
+        return (str(school_id), category, tuple(cursor) if cursor else None)
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """캐시 조회 - 없거나 만료된 경우 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: Any) -> None:
+        """캐시 저장 - 최대 개수 초과 시 LRU 항목 제거"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_school(self, school_id) -> None:
+        """해당 학교의 모든 피드 페이지 무효화"""
+        school_key = str(school_id)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == school_key]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+
+# 전역 싱글톤 인스턴스
+_feed_cache: Optional[FeedCache] = None
+_feed_cache_lock = threading.Lock()
+
+
+def get_feed_cache() -> FeedCache:
+    """
+    피드 캐시 인스턴스 반환 (싱글톤 패턴)
+
+    Returns:
+        FeedCache: 프로세스 전역 피드 캐시
+    """
+    global _feed_cache
+
+    if _feed_cache is None:
+        with _feed_cache_lock:
+            if _feed_cache is None:
+                _feed_cache = FeedCache()
+
+    return _feed_cache
+
+
+def invalidate_school_feed(school_id) -> None:
+    """
+    게시글/댓글 작성 후 해당 학교의 피드 캐시 무효화
+
+    Example:
+        >>> supabase.table("posts").insert(post_data).execute()
+        >>> invalidate_school_feed(post_data["school_id"])
+    """
+    get_feed_cache().invalidate_school(school_id)
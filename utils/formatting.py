@@ -0,0 +1,57 @@
+"""
+표시용 포맷팅 함수
+게시 시간 등 화면 표시 형식 변환
+"""
+
+from datetime import datetime, timedelta, timezone
+
+
+def format_time_ago(created_at_str, now=None):
+    """
+    게시 시간을 '~전' 형식으로 포맷팅
+    - 오늘: 1분 전~59분 전, 1시간 전~23시간 전
+    - 1일 전~6일 전 (자정 기준으로 날짜 변경 시 1일 전)
+    - 7일 이상: YY.MM.DD. 형식
+    
+    Args:
+        created_at_str: ISO 형식 게시 시간
+        now: 기준 시각 (UTC). 목록을 포맷팅할 때 한 번만 구해서 넘기면 됨
+    """
+    try:
+        # ISO 형식 파싱
+        created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
+        # 한국 시간으로 변환 (UTC+9)
+        kst_now = now + timedelta(hours=9)
+        kst_created = created_at + timedelta(hours=9)
+        
+        # 자정 기준으로 날짜 차이 계산
+        kst_now_date = kst_now.date()
+        kst_created_date = kst_created.date()
+        days_diff = (kst_now_date - kst_created_date).days
+        
+        # 오늘 작성된 글 (날짜가 같은 경우)
+        if days_diff == 0:
+            # 시간 차이 계산
+            diff = now - created_at
+            
+            # 분 단위 (1분~59분)
+            minutes = int(diff.total_seconds() / 60)
+            if minutes < 60:
+                return f"{minutes}분 전" if minutes > 0 else "방금 전"
+            
+            # 시간 단위 (1시간~23시간)
+            hours = int(diff.total_seconds() / 3600)
+            return f"{hours}시간 전"
+        
+        # 1일 전~6일 전 (자정이 지난 경우)
+        if 1 <= days_diff <= 6:
+            return f"{days_diff}일 전"
+        
+        # 7일 이상: YY.MM.DD. 형식
+        return kst_created.strftime('%y.%m.%d.')
+        
+    except Exception as e:
+        return created_at_str
@@ -0,0 +1,252 @@
+"""
+사용자 식별
+액세스 토큰을 서명 키로 로컬 검증하고, 프로필은 토큰의 커스텀 클레임 또는 프로세스 전역 TTL 캐시에서 가져옴
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from config.settings import JWKS_CACHE_SECONDS, PROFILE_CACHE_MAX_ENTRIES, PROFILE_CACHE_TTL_SECONDS
+
+# 액세스 토큰 audience (Supabase Auth 기본값)
+ACCESS_TOKEN_AUDIENCE = "authenticated"
+
+# 허용하는 서명 알고리즘 (HS256: 공유 비밀키, RS256/ES256: Supabase 비대칭 서명 키)
+ALLOWED_ALGORITHMS = ("HS256", "RS256", "ES256")
+
+# 프로필 커스텀 클레임 (supabase/migrations의 custom_access_token_hook이 추가)
+PROFILE_CLAIM = "profile"
+
+
+class TokenVerificationError(Exception):
+    """액세스 토큰을 로컬에서 검증할 수 없는 경우 (서명/만료 오류, 서명 키 미설정)"""
+
+
+_jwks_client = None
+_jwks_lock = threading.Lock()
+
+
+def _hs256_secret() -> Optional[str]:
+    """HS256 서명 비밀키 (로컬 SQLite 백엔드는 로컬 인증과 같은 기본값 사용)"""
+    secret = os.getenv("SUPABASE_JWT_SECRET")
+    if not secret and os.getenv("SUPABASE_BACKEND", "").lower() == "sqlite":
+        from utils.local_backend import DEFAULT_JWT_SECRET
+        secret = DEFAULT_JWT_SECRET
+    return secret or None
+
+
+def _get_jwks_client():
+    """Supabase Auth 공개 서명 키 클라이언트 (키를 JWKS_CACHE_SECONDS 동안 캐시)"""
+    global _jwks_client
+
+    if _jwks_client is None:
+        with _jwks_lock:
+            if _jwks_client is None:
+                import jwt
+
+                url = os.getenv("SUPABASE_URL")
+                if not url:
+                    raise TokenVerificationError("SUPABASE_URL이 설정되지 않아 서명 키를 가져올 수 없습니다.")
+                _jwks_client = jwt.PyJWKClient(
+                    f"{url.rstrip('/')}/auth/v1/.well-known/jwks.json",
+                    cache_keys=True,
+                    lifespan=JWKS_CACHE_SECONDS,
+                )
+
+    return _jwks_client
+
+
+def verify_access_token(access_token: str) -> dict:
+    """
+    액세스 토큰 서명/만료/audience를 로컬에서 검증하고 클레임 반환
+
+    HS256 토큰은 SUPABASE_JWT_SECRET으로, 비대칭 서명 토큰은 캐시된 JWKS 공개 키로 검증하므로
+    키를 처음 가져올 때를 제외하면 네트워크 호출이 없습니다.
+
+    Raises:
+        TokenVerificationError: 검증 실패 또는 서명 키를 사용할 수 없는 경우
+
+    Example:
+        >>> claims = verify_access_token(st.session_state.access_token)
+        >>> claims["email"]
+    """
+    import jwt
+
+    try:
+        algorithm = jwt.get_unverified_header(access_token).get("alg")
+        if algorithm not in ALLOWED_ALGORITHMS:
+            raise TokenVerificationError(f"지원하지 않는 서명 알고리즘입니다: {algorithm}")
+
+        if algorithm == "HS256":
+            key = _hs256_secret()
+            if key is None:
+                raise TokenVerificationError("SUPABASE_JWT_SECRET이 설정되지 않았습니다.")
+        else:
+            key = _get_jwks_client().get_signing_key_from_jwt(access_token).key
+
+        return jwt.decode(access_token, key, algorithms=[algorithm], audience=ACCESS_TOKEN_AUDIENCE)
+    except jwt.PyJWTError as e:
+        raise TokenVerificationError(str(e)) from e
+
+
+def verified_claims(access_token: Optional[str]) -> Optional[dict]:
+    """검증된 클레임 (토큰이 없거나 로컬 검증이 불가능하면 None)"""
+    if not access_token:
+        return None
+    try:
+        return verify_access_token(access_token)
+    except TokenVerificationError:
+        return None
+
+
+def token_expires_at(access_token: Optional[str]) -> Optional[int]:
+    """토큰의 만료 시각(exp) - 서명은 확인하지 않으므로 갱신 예약에만 사용"""
+    if not access_token:
+        return None
+
+    import jwt
+
+    try:
+        return int(jwt.decode(access_token, options={"verify_signature": False})["exp"])
+    except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+        return None
+
+
+class ProfileCache:
+    """
+    이메일 키로 users 행을 보관하는 TTL + LRU 캐시 (모든 세션이 공유)
+
+    반환값은 복사본이므로 호출한 쪽에서 수정해도 캐시에 영향이 없습니다.
+    """
+
+    def __init__(self, max_entries: int = PROFILE_CACHE_MAX_ENTRIES, ttl_seconds: float = PROFILE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, email: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[email]
+                return None
+            self._entries.move_to_end(email)
+            return dict(entry[1])
+
+    def set(self, email: str, profile: dict) -> None:
+        with self._lock:
+            self._entries[email] = (time.monotonic() + self.ttl_seconds, dict(profile))
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, email: str) -> None:
+        with self._lock:
+            self._entries.pop(email, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# 전역 싱글톤 인스턴스
+_profile_cache: Optional[ProfileCache] = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> ProfileCache:
+    """프로필 캐시 인스턴스 반환 (싱글톤 패턴)"""
+    global _profile_cache
+
+    if _profile_cache is None:
+        with _profile_cache_lock:
+            if _profile_cache is None:
+                _profile_cache = ProfileCache()
+
+    return _profile_cache
+
+
+def get_user_profile(client: Any, email: str, claims: Optional[dict] = None) -> Optional[dict]:
+    """
+    users 테이블 프로필 반환 (클레임 → 캐시 → DB 조회 순)
+
+    Args:
+        client: users 조회에 사용할 Supabase 클라이언트
+        email: 로그인 이메일
+        claims: 검증된 액세스 토큰 클레임 (profile 커스텀 클레임이 있으면 DB를 조회하지 않음)
+
+    Returns:
+        dict or None: users 행 복사본 (사용자가 없으면 None)
+    """
+    cache = get_profile_cache()
+
+    profile = (claims or {}).get(PROFILE_CLAIM)
+    if isinstance(profile, dict) and profile.get("id") is not None:
+        cache.set(email, profile)
+        return dict(profile)
+
+    cached = cache.get(email)
+    if cached is not None:
+        return cached
+
+    response = client.table("users").select("*").eq("email", email).execute()
+    if not response.data:
+        return None
+
+    cache.set(email, response.data[0])
+    return dict(response.data[0])
+
+
+def invalidate_user_profile(email: str) -> None:
+    """프로필 수정/회원 탈퇴 후 캐시 무효화"""
+    get_profile_cache().invalidate(email)
+
+
+def _supports_direct_restore(auth: Any) -> bool:
+    """세션을 /user 호출 없이 직접 저장할 수 있는 gotrue 클라이언트인지 (로컬 백엔드 등은 False)"""
+    return callable(getattr(auth, "_save_session", None)) and callable(getattr(auth, "_notify_all_subscribers", None))
+
+
+def restore_auth_session(auth: Any, access_token: str, refresh_token: str, user: Any = None) -> Any:
+    """
+    클라이언트 auth에 기존 토큰으로 로그인 세션 설정
+
+    gotrue의 set_session()은 만료되지 않은 토큰도 사용자 확인을 위해 /user를 호출하므로,
+    토큰을 로컬에서 검증할 수 있고 사용자 객체가 있으면 세션을 직접 저장합니다.
+    그 외(만료된 토큰, 로컬 백엔드 등)에는 set_session()을 그대로 사용합니다.
+
+    세션 직접 저장은 set_session()과 같은 내부 메서드(_save_session, _notify_all_subscribers)를
+    사용하므로 requirements.txt에서 supabase-auth 버전을 고정하고, 메서드가 없거나
+    호출 형식이 바뀐 버전에서는 set_session()으로 대체합니다.
+
+    Returns:
+        설정된 세션 - 만료된 토큰이었다면 set_session()이 갱신한 새 토큰이 들어 있으므로
+        호출한 쪽에서 보관 중인 토큰을 이 값으로 바꿔야 합니다 (이전 리프레시 토큰은 폐기됨)
+    """
+    claims = verified_claims(access_token) if user is not None and _supports_direct_restore(auth) else None
+    if claims is None:
+        return auth.set_session(access_token, refresh_token).session
+
+    from supabase_auth.types import Session
+
+    expires_at = int(claims["exp"])
+    session = Session(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        user=user,
+        token_type="bearer",
+        expires_in=max(0, expires_at - int(time.time())),
+        expires_at=expires_at,
+    )
+    try:
+        auth._save_session(session)
+        auth._notify_all_subscribers("TOKEN_REFRESHED", session)
+    except (AttributeError, TypeError):
+        return auth.set_session(access_token, refresh_token).session
+    return session
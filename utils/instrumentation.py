@@ -0,0 +1,232 @@
+"""
+쿼리 계측
+Supabase 클라이언트를 감싸 execute() 소요 시간/행 수/응답 크기를 호출한 페이지·함수별로 기록
+(SUPABASE_INSTRUMENTATION=1 환경변수로 활성화)
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+from config.settings import QUERY_LOG_MAX_RERUNS
+from utils.script_context import current_rerun_token
+
+logger = logging.getLogger("campuslink.queries")
+
+# 세션별 재실행 기록을 보관하는 session_state 키
+_SESSION_LOG_KEY = "_query_log"
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PAGES_DIR = os.path.join(_PROJECT_ROOT, "pages")
+
+
+@dataclass
+class QueryRecord:
+    """execute() 1회 기록"""
+    page: str
+    function: str
+    method: str
+    path: str
+    query: str
+    elapsed_ms: float
+    rows: int
+    payload_bytes: int
+    error: Optional[str] = None
+    thread: str = ""
+
+
+@dataclass
+class RerunLog:
+    """스크립트 재실행(rerun) 1회 동안의 쿼리 기록"""
+    token: Any
+    page: str
+    started_at: float
+    queries: list = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(record.elapsed_ms for record in self.queries)
+
+
+def request_signature(builder: Any) -> tuple[str, str, tuple]:
+    """
+    요청 빌더의 (HTTP 메서드, 경로, 쿼리 파라미터) 반환
+
+    postgrest 빌더(builder.request의 httpx.QueryParams)와 로컬 백엔드 빌더(튜플 목록)를 같은 형식으로 다룹니다.
+    """
+    request = getattr(builder, "request", None)
+    source = request if hasattr(request, "http_method") else builder
+    params = getattr(source, "params", None) or ()
+    items = params.multi_items() if hasattr(params, "multi_items") else list(params)
+    return (
+        str(getattr(source, "http_method", "")),
+        str(getattr(source, "path", "")),
+        tuple((str(key), str(value)) for key, value in items),
+    )
+
+
+def instrumentation_enabled() -> bool:
+    """SUPABASE_INSTRUMENTATION 환경변수 확인"""
+    return os.getenv("SUPABASE_INSTRUMENTATION", "").lower() in ("1", "true", "yes", "on")
+
+
+def _caller() -> tuple[str, str]:
+    """
+    쿼리를 실행한 페이지와 함수 찾기
+
+    Returns:
+        tuple: (페이지 파일명 또는 "-", "모듈.함수")
+    """
+    frame = sys._getframe(2)
+    function = None
+    page = "-"
+
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(_PROJECT_ROOT) and filename != os.path.abspath(__file__):
+            module = os.path.splitext(os.path.basename(filename))[0]
+            if function is None:
+                function = f"{module}.{frame.f_code.co_name}"
+            if os.path.dirname(filename) == _PAGES_DIR or filename == os.path.join(_PROJECT_ROOT, "app.py"):
+                page = module
+                break
+        frame = frame.f_back
+
+    return page, function or "-"
+
+
+def _rerun_log(page: str) -> Optional[RerunLog]:
+    """현재 세션의 이번 재실행 기록 (Streamlit 스크립트 실행 중이 아니면 None)"""
+    token = current_rerun_token()
+    if token is None:
+        return None
+
+    import streamlit as st
+    logs = st.session_state.get(_SESSION_LOG_KEY)
+    if logs is None:
+        logs = deque(maxlen=QUERY_LOG_MAX_RERUNS)
+        st.session_state[_SESSION_LOG_KEY] = logs
+
+    if not logs or logs[-1].token is not token:
+        logs.append(RerunLog(token=token, page=page, started_at=time.time()))
+    elif logs[-1].page == "-" and page != "-":
+        logs[-1].page = page
+    return logs[-1]
+
+
+def _payload_size(data: Any) -> tuple[int, int]:
+    """응답 데이터의 (행 수, JSON 바이트 크기)"""
+    rows = len(data) if isinstance(data, list) else int(data is not None)
+    try:
+        size = len(json.dumps(data, ensure_ascii=False, default=str).encode())
+    except (TypeError, ValueError):
+        size = 0
+    return rows, size
+
+
+class InstrumentedBuilder:
+    """요청 빌더 프록시 - 체이닝은 그대로 위임하고 execute()만 계측"""
+
+    def __init__(self, builder: Any):
+        self._builder = builder
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            return attr
+
+        def chained(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return InstrumentedBuilder(result) if hasattr(result, "execute") else result
+        return chained
+
+    def execute(self) -> Any:
+        page, function = _caller()
+        method, path, params = request_signature(self._builder)
+        start = time.perf_counter()
+        error = None
+        response = None
+
+        try:
+            response = self._builder.execute()
+            return response
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            rows, size = _payload_size(getattr(response, "data", None))
+            record_query(QueryRecord(
+                page=page,
+                function=function,
+                method=method,
+                path=path,
+                query="&".join(f"{key}={value}" for key, value in params),
+                elapsed_ms=round(elapsed_ms, 2),
+                rows=rows,
+                payload_bytes=size,
+                error=error,
+                thread=threading.current_thread().name,
+            ))
+
+
+class InstrumentedClient:
+    """Supabase 클라이언트 프록시 - table()/from_()/rpc()가 반환하는 빌더를 계측"""
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    def table(self, table_name: str) -> InstrumentedBuilder:
+        return InstrumentedBuilder(self._client.table(table_name))
+
+    def from_(self, table_name: str) -> InstrumentedBuilder:
+        return InstrumentedBuilder(self._client.from_(table_name))
+
+    def rpc(self, fn: str, *args, **kwargs) -> InstrumentedBuilder:
+        return InstrumentedBuilder(self._client.rpc(fn, *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+def instrument_client(client: Any) -> InstrumentedClient:
+    """
+    클라이언트에 쿼리 계측 적용
+
+    Example:
+        >>> client = instrument_client(create_client(url, key))
+        >>> client.table("posts").select("*").execute()  # 소요 시간/행 수 기록
+    """
+    if not logger.handlers:
+        # 앱에 로깅 설정이 없으므로 계측을 켠 경우에만 표준 에러로 출력
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    return client if isinstance(client, InstrumentedClient) else InstrumentedClient(client)
+
+
+def record_query(record: QueryRecord) -> None:
+    """쿼리 기록을 구조화 로그로 남기고 현재 세션의 재실행 기록에 추가"""
+    logger.info(json.dumps({"event": "supabase_query", **asdict(record)}, ensure_ascii=False))
+
+    try:
+        rerun_log = _rerun_log(record.page)
+    except Exception:
+        rerun_log = None
+    if rerun_log is not None:
+        rerun_log.queries.append(record)
+
+
+def get_query_log() -> list[RerunLog]:
+    """현재 세션의 최근 재실행 기록 (오래된 순)"""
+    import streamlit as st
+    return list(st.session_state.get(_SESSION_LOG_KEY) or [])
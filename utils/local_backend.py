@@ -0,0 +1,863 @@
+"""
+로컬 SQLite 백엔드
+Supabase 클라이언트 대신 사용하는 오프라인 대체 구현 - 부하 테스트/벤치마크용
+
+페이지에서 사용하는 API 일부만 구현합니다.
+    - table()/from_(): select (users(...), schools(...) 임베드, comments(count) 집계 포함),
+      insert/upsert/update/delete, eq/neq/gt/gte/lt/lte/like/ilike/is_/in_/or_,
+      order/limit/range, count="exact"
+    - rpc(): supabase/migrations의 DB 함수와 동일한 동작
+    - auth: sign_up, sign_in_with_password, sign_out, get_session, get_user, refresh_session
+
+SUPABASE_BACKEND=sqlite 환경변수로 선택하고 LOCAL_DB_PATH로 DB 파일을 지정합니다.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+# 기본 DB 파일 경로
+DEFAULT_DB_PATH = os.path.join(".local", "campuslink.db")
+
+# 로컬 액세스 토큰 서명 키 / 만료 시간 (초)
+DEFAULT_JWT_SECRET = "local-development-jwt-secret-not-for-production"
+ACCESS_TOKEN_TTL_SECONDS = 3600
+
+# supabase/migrations 적용 후의 스키마와 동일하게 유지
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS auth_users (
+    id TEXT PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    user_metadata TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS auth_refresh_tokens (
+    token TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL REFERENCES auth_users(id) ON DELETE CASCADE,
+    revoked INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL UNIQUE,
+    nickname TEXT UNIQUE,
+    phone TEXT,
+    contact_email TEXT,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS schools (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    location TEXT,
+    content_hash TEXT,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS user_schools (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    school_id INTEGER NOT NULL REFERENCES schools(id) ON DELETE CASCADE,
+    created_at TEXT NOT NULL,
+    UNIQUE (user_id, school_id)
+);
+
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    school_id INTEGER NOT NULL REFERENCES schools(id) ON DELETE CASCADE,
+    category TEXT NOT NULL DEFAULT '자유게시판'
+        CHECK (category IN ('자유게시판', '질문게시판', '정보공유', '스터디', '동아리', '기타')),
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    excerpt TEXT GENERATED ALWAYS AS (
+        CASE WHEN length(content) > 150 THEN substr(content, 1, 150) || '…' ELSE content END
+    ) STORED,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS posts_school_category_created_idx
+    ON posts (school_id, category, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS posts_school_created_idx
+    ON posts (school_id, created_at DESC, id DESC);
+
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS comments_post_created_idx
+    ON comments (post_id, created_at DESC);
+
+CREATE TRIGGER IF NOT EXISTS comments_increment_post_comment_count
+AFTER INSERT ON comments
+BEGIN
+    UPDATE posts SET comment_count = comment_count + 1 WHERE id = NEW.post_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS comments_decrement_post_comment_count
+AFTER DELETE ON comments
+BEGIN
+    UPDATE posts SET comment_count = max(comment_count - 1, 0) WHERE id = OLD.post_id;
+END;
+"""
+
+# 외래 키 (테이블 -> {컬럼: 참조 테이블}) - 임베드 조회에 사용
+FOREIGN_KEYS = {
+    "user_schools": {"user_id": "users", "school_id": "schools"},
+    "posts": {"user_id": "users", "school_id": "schools"},
+    "comments": {"post_id": "posts", "user_id": "users"},
+}
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class LocalAPIError(Exception):
+    """로컬 백엔드 쿼리 오류 (postgrest.APIError 대응)"""
+
+
+class LocalAuthError(Exception):
+    """로컬 백엔드 인증 오류 (gotrue AuthApiError 대응)"""
+
+
+@dataclass
+class LocalAPIResponse:
+    """쿼리 결과 (postgrest APIResponse 대응)"""
+    data: Any
+    count: Optional[int] = None
+
+
+@dataclass
+class LocalUser:
+    id: str
+    email: str
+    user_metadata: dict = field(default_factory=dict)
+
+
+@dataclass
+class LocalSession:
+    access_token: str
+    refresh_token: str
+    expires_in: int
+    expires_at: int
+    user: LocalUser
+    token_type: str = "bearer"
+
+
+@dataclass
+class LocalAuthResponse:
+    user: Optional[LocalUser]
+    session: Optional[LocalSession]
+
+
+def _now_iso() -> str:
+    """created_at 기본값 (Supabase timestamptz와 같은 형식으로 문자열 비교가 가능하도록)"""
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _quote(identifier: str) -> str:
+    """SQL 식별자 검증 후 인용"""
+    if not _IDENTIFIER.match(identifier):
+        raise LocalAPIError(f"잘못된 식별자입니다: {identifier}")
+    return f'"{identifier}"'
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def encode_jwt(claims: dict, secret: str) -> str:
+    """HS256 JWT 생성 (로컬 인증 토큰용)"""
+    header = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+    payload = _b64url(json.dumps(claims, separators=(",", ":")).encode())
+    signature = hmac.new(secret.encode(), f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    return f"{header}.{payload}.{_b64url(signature)}"
+
+
+def _hash_password(password: str, salt: Optional[bytes] = None) -> str:
+    salt = salt or secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, 100_000)
+    return f"{salt.hex()}${digest.hex()}"
+
+
+def _verify_password(password: str, password_hash: str) -> bool:
+    salt_hex, _ = password_hash.split("$", 1)
+    return hmac.compare_digest(_hash_password(password, bytes.fromhex(salt_hex)), password_hash)
+
+
+# ============================================
+# PostgREST 파라미터 해석
+# ============================================
+
+def _split_top_level(text: str) -> list[str]:
+    """괄호/큰따옴표 밖의 쉼표로 분리"""
+    parts, depth, quoted, current = [], 0, False, []
+    for i, char in enumerate(text):
+        if char == '"' and (i == 0 or text[i - 1] != "\\"):
+            quoted = not quoted
+        elif not quoted and char == "(":
+            depth += 1
+        elif not quoted and char == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and char == ",":
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    if current:
+        parts.append("".join(current))
+    return parts
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    return value
+
+
+def _format_value(value: Any) -> str:
+    """필터 값을 PostgREST 형식 문자열로 변환 (예약 문자가 있으면 큰따옴표)"""
+    text = "null" if value is None else str(value).lower() if isinstance(value, bool) else str(value)
+    if any(char in text for char in ',.:()"'):
+        return '"' + text.replace('"', '\\"') + '"'
+    return text
+
+
+def _filter_sql(column: str, expression: str) -> tuple[str, list]:
+    """'op.value' 형식 필터를 SQL 조건으로 변환"""
+    negate = expression.startswith("not.")
+    if negate:
+        expression = expression[4:]
+
+    operator, _, raw = expression.partition(".")
+    col = _quote(column)
+
+    if operator in ("eq", "neq", "gt", "gte", "lt", "lte"):
+        symbol = {"eq": "=", "neq": "!=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}[operator]
+        sql, args = f"{col} {symbol} ?", [_unquote(raw)]
+    elif operator in ("like", "ilike"):
+        pattern = _unquote(raw).replace("*", "%")
+        sql = f"{col} LIKE ?" if operator == "ilike" else f"{col} GLOB ?"
+        args = [pattern if operator == "ilike" else pattern.replace("%", "*").replace("_", "?")]
+    elif operator == "is":
+        keyword = {"null": "NULL", "true": "1", "false": "0"}.get(raw.lower())
+        if keyword is None:
+            raise LocalAPIError(f"지원하지 않는 is 값입니다: {raw}")
+        sql, args = (f"{col} IS NULL", []) if keyword == "NULL" else (f"{col} = {keyword}", [])
+    elif operator == "in":
+        values = [_unquote(v) for v in _split_top_level(raw.strip("()"))]
+        if not values:
+            sql, args = "0", []
+        else:
+            sql, args = f"{col} IN ({', '.join('?' * len(values))})", values
+    else:
+        raise LocalAPIError(f"지원하지 않는 연산자입니다: {operator}")
+
+    return (f"NOT ({sql})", args) if negate else (sql, args)
+
+
+def _logic_sql(operator: str, body: str) -> tuple[str, list]:
+    """or=(...) / and(...) 논리 조건을 SQL로 변환"""
+    clauses, args = [], []
+    for item in _split_top_level(body):
+        if item.startswith(("and(", "or(")):
+            inner_operator, _, inner = item.partition("(")
+            sql, item_args = _logic_sql(inner_operator, inner[:-1])
+        else:
+            column, _, expression = item.partition(".")
+            sql, item_args = _filter_sql(column, expression)
+        clauses.append(f"({sql})")
+        args.extend(item_args)
+
+    joiner = " OR " if operator == "or" else " AND "
+    return joiner.join(clauses) or "1", args
+
+
+def _parse_select(columns: str) -> list:
+    """
+    select 문자열 해석
+
+    Returns:
+        list: "*", 컬럼명, 또는 (관계 테이블, 하위 항목 목록) 튜플
+    """
+    items = []
+    for item in _split_top_level(columns):
+        if not item:
+            continue
+        if "(" in item:
+            name, _, inner = item.partition("(")
+            # alias:relation(...) 형식은 관계 이름만 사용
+            name = name.split(":")[-1].split("!")[0]
+            items.append((name, _parse_select(inner[:-1])))
+        else:
+            items.append(item)
+    return items
+
+
+# ============================================
+# 쿼리 빌더
+# ============================================
+
+class LocalQueryBuilder:
+    """
+    테이블 쿼리 빌더 (postgrest 요청 빌더 대응)
+
+    필터는 PostgREST와 같은 쿼리 파라미터(params)로 기록되므로
+    계측/캐시 계층에서 실제 Supabase 요청과 동일하게 다룰 수 있습니다.
+    """
+
+    def __init__(self, client: "LocalClient", table: str):
+        self._client = client
+        self.table = table
+        self.path = f"/{table}"
+        self.http_method = "GET"
+        self.params: list[tuple[str, str]] = []
+        self.json: Any = None
+        self.count: Optional[str] = None
+        self.on_conflict: Optional[str] = None
+        self.ignore_duplicates = False
+
+    # ---------- 요청 종류 ----------
+
+    def select(self, *columns: str, count: Optional[str] = None, head: bool = False) -> "LocalQueryBuilder":
+        self.http_method = "HEAD" if head else "GET"
+        self.params.append(("select", re.sub(r"\s+", "", ",".join(columns) or "*")))
+        self.count = count
+        return self
+
+    def insert(self, json: Any, count: Optional[str] = None, **_) -> "LocalQueryBuilder":
+        self.http_method = "POST"
+        self.json = json
+        self.count = count
+        return self
+
+    def upsert(self, json: Any, on_conflict: str = "", ignore_duplicates: bool = False, **_) -> "LocalQueryBuilder":
+        self.http_method = "POST"
+        self.json = json
+        self.on_conflict = on_conflict or "id"
+        self.ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, json: dict, count: Optional[str] = None, **_) -> "LocalQueryBuilder":
+        self.http_method = "PATCH"
+        self.json = json
+        self.count = count
+        return self
+
+    def delete(self, count: Optional[str] = None, **_) -> "LocalQueryBuilder":
+        self.http_method = "DELETE"
+        self.count = count
+        return self
+
+    # ---------- 필터 ----------
+
+    def filter(self, column: str, operator: str, criteria: Any) -> "LocalQueryBuilder":
+        self.params.append((column, f"{operator}.{criteria}"))
+        return self
+
+    def eq(self, column: str, value: Any) -> "LocalQueryBuilder":
+        return self.filter(column, "eq", _format_value(value))
+
+    def neq(self, column: str, value: Any) -> "LocalQueryBuilder":
+        return self.filter(column, "neq", _format_value(value))
+
+    def gt(self, column: str, value: Any) -> "LocalQueryBuilder":
+        return self.filter(column, "gt", _format_value(value))
+
+    def gte(self, column: str, value: Any) -> "LocalQueryBuilder":
+        return self.filter(column, "gte", _format_value(value))
+
+    def lt(self, column: str, value: Any) -> "LocalQueryBuilder":
+        return self.filter(column, "lt", _format_value(value))
+
+    def lte(self, column: str, value: Any) -> "LocalQueryBuilder":
+        return self.filter(column, "lte", _format_value(value))
+
+    def like(self, column: str, pattern: str) -> "LocalQueryBuilder":
+        return self.filter(column, "like", pattern)
+
+    def ilike(self, column: str, pattern: str) -> "LocalQueryBuilder":
+        return self.filter(column, "ilike", pattern)
+
+    def is_(self, column: str, value: Any) -> "LocalQueryBuilder":
+        return self.filter(column, "is", _format_value(value))
+
+    def in_(self, column: str, values: list) -> "LocalQueryBuilder":
+        return self.filter(column, "in", "(" + ",".join(_format_value(v) for v in values) + ")")
+
+    def or_(self, filters: str) -> "LocalQueryBuilder":
+        self.params.append(("or", f"({filters})"))
+        return self
+
+    # ---------- 정렬/페이지네이션 ----------
+
+    def order(self, column: str, desc: bool = False, nullsfirst: bool = False, **_) -> "LocalQueryBuilder":
+        direction = f"{column}.{'desc' if desc else 'asc'}{'.nullsfirst' if nullsfirst else ''}"
+        for i, (key, value) in enumerate(self.params):
+            if key == "order":
+                self.params[i] = ("order", f"{value},{direction}")
+                return self
+        self.params.append(("order", direction))
+        return self
+
+    def limit(self, size: int) -> "LocalQueryBuilder":
+        self.params = [(k, v) for k, v in self.params if k != "limit"] + [("limit", str(size))]
+        return self
+
+    def range(self, start: int, end: int) -> "LocalQueryBuilder":
+        self.params = [(k, v) for k, v in self.params if k not in ("offset", "limit")]
+        self.params += [("offset", str(start)), ("limit", str(end - start + 1))]
+        return self
+
+    def execute(self) -> LocalAPIResponse:
+        return self._client._execute(self)
+
+
+class LocalRPCBuilder:
+    """DB 함수 호출 빌더 (postgrest rpc 요청 빌더 대응)"""
+
+    def __init__(self, client: "LocalClient", fn: str, params: Optional[dict]):
+        self._client = client
+        self.fn = fn
+        self.path = f"/rpc/{fn}"
+        self.http_method = "POST"
+        self.params: list[tuple[str, str]] = []
+        self.json = params or {}
+
+    def execute(self) -> LocalAPIResponse:
+        return self._client._execute_rpc(self)
+
+
+# ============================================
+# 인증
+# ============================================
+
+class LocalAuth:
+    """Supabase Auth 일부 대응 - 세션은 클라이언트 인스턴스 메모리에 보관"""
+
+    def __init__(self, client: "LocalClient"):
+        self._client = client
+        self._session: Optional[LocalSession] = None
+
+    def _issue_session(self, user: LocalUser) -> LocalSession:
+        now = int(time.time())
+        access_token = encode_jwt({
+            "sub": user.id,
+            "email": user.email,
+            "role": "authenticated",
+            "aud": "authenticated",
+            "user_metadata": user.user_metadata,
+            "iat": now,
+            "exp": now + ACCESS_TOKEN_TTL_SECONDS,
+        }, self._client.jwt_secret)
+        refresh_token = secrets.token_urlsafe(24)
+
+        with self._client._write() as conn:
+            conn.execute(
+                "INSERT INTO auth_refresh_tokens (token, user_id, created_at) VALUES (?, ?, ?)",
+                (refresh_token, user.id, _now_iso()),
+            )
+
+        self._session = LocalSession(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_in=ACCESS_TOKEN_TTL_SECONDS,
+            expires_at=now + ACCESS_TOKEN_TTL_SECONDS,
+            user=user,
+        )
+        return self._session
+
+    def _load_user(self, where: str, value: str) -> Optional[LocalUser]:
+        row = self._client._connection().execute(
+            f"SELECT id, email, user_metadata FROM auth_users WHERE {where} = ?", (value,)
+        ).fetchone()
+        if row is None:
+            return None
+        return LocalUser(id=row["id"], email=row["email"], user_metadata=json.loads(row["user_metadata"]))
+
+    def sign_up(self, credentials: dict) -> LocalAuthResponse:
+        email = credentials["email"]
+        metadata = (credentials.get("options") or {}).get("data") or {}
+        user = LocalUser(id=str(uuid.uuid4()), email=email, user_metadata=metadata)
+
+        try:
+            with self._client._write() as conn:
+                conn.execute(
+                    "INSERT INTO auth_users (id, email, password_hash, user_metadata, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (user.id, email, _hash_password(credentials["password"]), json.dumps(metadata), _now_iso()),
+                )
+        except sqlite3.IntegrityError:
+            raise LocalAuthError("User already registered")
+
+        return LocalAuthResponse(user=user, session=self._issue_session(user))
+
+    def sign_in_with_password(self, credentials: dict) -> LocalAuthResponse:
+        row = self._client._connection().execute(
+            "SELECT password_hash FROM auth_users WHERE email = ?", (credentials["email"],)
+        ).fetchone()
+        if row is None or not _verify_password(credentials["password"], row["password_hash"]):
+            raise LocalAuthError("Invalid login credentials")
+
+        user = self._load_user("email", credentials["email"])
+        return LocalAuthResponse(user=user, session=self._issue_session(user))
+
+    def refresh_session(self, refresh_token: Optional[str] = None) -> LocalAuthResponse:
+        token = refresh_token or (self._session.refresh_token if self._session else None)
+        if not token:
+            raise LocalAuthError("Refresh Token Not Found")
+
+        with self._client._write() as conn:
+            row = conn.execute(
+                "UPDATE auth_refresh_tokens SET revoked = 1 WHERE token = ? AND revoked = 0 RETURNING user_id",
+                (token,),
+            ).fetchone()
+        if row is None:
+            raise LocalAuthError("Invalid Refresh Token")
+
+        user = self._load_user("id", row["user_id"])
+        return LocalAuthResponse(user=user, session=self._issue_session(user))
+
+    def set_session(self, access_token: str, refresh_token: str) -> LocalAuthResponse:
+        """기존 토큰으로 세션 복원 (토큰을 새로 발급하지 않음)"""
+        row = self._client._connection().execute(
+            "SELECT user_id FROM auth_refresh_tokens WHERE token = ? AND revoked = 0", (refresh_token,)
+        ).fetchone()
+        if row is None:
+            raise LocalAuthError("Invalid Refresh Token")
+
+        user = self._load_user("id", row["user_id"])
+        expires_at = int(time.time()) + ACCESS_TOKEN_TTL_SECONDS
+        self._session = LocalSession(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_in=ACCESS_TOKEN_TTL_SECONDS,
+            expires_at=expires_at,
+            user=user,
+        )
+        return LocalAuthResponse(user=user, session=self._session)
+
+    def get_session(self) -> Optional[LocalSession]:
+        return self._session
+
+    def get_user(self, jwt: Optional[str] = None) -> Optional[LocalAuthResponse]:
+        if self._session is None:
+            return None
+        return LocalAuthResponse(user=self._session.user, session=self._session)
+
+    def sign_out(self, *_, **__) -> None:
+        if self._session is not None:
+            with self._client._write() as conn:
+                conn.execute("UPDATE auth_refresh_tokens SET revoked = 1 WHERE token = ?", (self._session.refresh_token,))
+        self._session = None
+
+
+# ============================================
+# 클라이언트
+# ============================================
+
+class LocalClient:
+    """
+    Supabase Client 대체 구현 (SQLite)
+
+    연결은 스레드마다 따로 열고, 쓰기는 프로세스 내 잠금으로 직렬화합니다.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, jwt_secret: Optional[str] = None):
+        self.db_path = db_path
+        self.jwt_secret = jwt_secret or os.getenv("SUPABASE_JWT_SECRET") or DEFAULT_JWT_SECRET
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self.rpc_functions: dict[str, Callable[[sqlite3.Connection, dict], Any]] = {
+            "increment_post_view_counts": _rpc_increment_post_view_counts,
+            "reconcile_post_comment_counts": _rpc_reconcile_post_comment_counts,
+        }
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._write() as conn:
+            conn.executescript(SCHEMA)
+
+        self.auth = LocalAuth(self)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+        return conn
+
+    class _WriteTransaction:
+        def __init__(self, client: "LocalClient"):
+            self.client = client
+
+        def __enter__(self) -> sqlite3.Connection:
+            self.client._write_lock.acquire()
+            self.conn = self.client._connection()
+            return self.conn
+
+        def __exit__(self, exc_type, *_):
+            try:
+                if exc_type is None:
+                    self.conn.commit()
+                else:
+                    self.conn.rollback()
+            finally:
+                self.client._write_lock.release()
+
+    def _write(self) -> "_WriteTransaction":
+        """쓰기 트랜잭션 (성공 시 커밋, 실패 시 롤백)"""
+        return LocalClient._WriteTransaction(self)
+
+    def table(self, table_name: str) -> LocalQueryBuilder:
+        _quote(table_name)
+        return LocalQueryBuilder(self, table_name)
+
+    from_ = table
+
+    def rpc(self, fn: str, params: Optional[dict] = None) -> LocalRPCBuilder:
+        return LocalRPCBuilder(self, fn, params)
+
+    # ---------- 실행 ----------
+
+    def _where(self, params: list[tuple[str, str]]) -> tuple[str, list]:
+        clauses, args = [], []
+        for key, value in params:
+            if key in ("select", "order", "limit", "offset", "on_conflict", "columns"):
+                continue
+            if key in ("or", "and"):
+                sql, item_args = _logic_sql(key, value[1:-1])
+            else:
+                sql, item_args = _filter_sql(key, value)
+            clauses.append(f"({sql})")
+            args.extend(item_args)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def _execute(self, builder: LocalQueryBuilder) -> LocalAPIResponse:
+        try:
+            if builder.http_method in ("GET", "HEAD"):
+                return self._select(builder)
+            if builder.http_method == "POST":
+                return self._insert(builder)
+            if builder.http_method == "PATCH":
+                return self._update(builder)
+            return self._delete(builder)
+        except sqlite3.Error as e:
+            raise LocalAPIError(str(e)) from e
+
+    def _select(self, builder: LocalQueryBuilder) -> LocalAPIResponse:
+        params = dict(builder.params)
+        where, args = self._where(builder.params)
+        table = _quote(builder.table)
+        conn = self._connection()
+
+        count = None
+        if builder.count:
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}{where}", args).fetchone()[0]
+        if builder.http_method == "HEAD":
+            return LocalAPIResponse(data=[], count=count)
+
+        sql = f"SELECT * FROM {table}{where}"
+        if "order" in params:
+            terms = []
+            for term in params["order"].split(","):
+                column, _, direction = term.partition(".")
+                nulls = " NULLS FIRST" if direction.endswith("nullsfirst") else ""
+                terms.append(f"{_quote(column)} {'DESC' if direction.startswith('desc') else 'ASC'}{nulls}")
+            sql += " ORDER BY " + ", ".join(terms)
+        if "limit" in params or "offset" in params:
+            sql += " LIMIT ? OFFSET ?"
+            args = args + [int(params.get("limit", -1)), int(params.get("offset", 0))]
+
+        rows = [dict(row) for row in conn.execute(sql, args)]
+        data = self._project(builder.table, rows, _parse_select(params.get("select", "*")))
+        return LocalAPIResponse(data=data, count=count)
+
+    def _project(self, table: str, rows: list[dict], items: list) -> list[dict]:
+        """select 항목대로 컬럼을 고르고 관계 테이블을 임베드 (관계마다 쿼리 1회로 일괄 조회)"""
+        results = [{} for _ in rows]
+
+        for item in items:
+            if item == "*":
+                for result, row in zip(results, rows):
+                    result.update(row)
+            elif isinstance(item, str):
+                for result, row in zip(results, rows):
+                    if item not in row:
+                        raise LocalAPIError(f"column {table}.{item} does not exist")
+                    result[item] = row[item]
+            else:
+                relation, sub_items = item
+                self._embed(table, rows, results, relation, sub_items)
+
+        return results
+
+    def _embed(self, table: str, rows: list[dict], results: list[dict], relation: str, sub_items: list) -> None:
+        conn = self._connection()
+        relation_table = _quote(relation)
+
+        # 다대일: 현재 테이블의 외래 키가 관계 테이블을 참조 (예: posts.user_id -> users)
+        fk_column = next((col for col, target in FOREIGN_KEYS.get(table, {}).items() if target == relation), None)
+        if fk_column:
+            keys = sorted({row[fk_column] for row in rows if row.get(fk_column) is not None})
+            related = {}
+            if keys:
+                found = conn.execute(
+                    f"SELECT * FROM {relation_table} WHERE id IN ({', '.join('?' * len(keys))})", keys
+                ).fetchall()
+                found = [dict(row) for row in found]
+                related = {row["id"]: projected for row, projected in zip(found, self._project(relation, found, sub_items))}
+            for result, row in zip(results, rows):
+                result[relation] = related.get(row.get(fk_column))
+            return
+
+        # 일대다: 관계 테이블의 외래 키가 현재 테이블을 참조 (예: comments.post_id -> posts)
+        reverse_column = next((col for col, target in FOREIGN_KEYS.get(relation, {}).items() if target == table), None)
+        if reverse_column is None:
+            raise LocalAPIError(f"Could not find a relationship between '{table}' and '{relation}'")
+
+        keys = sorted({row["id"] for row in rows})
+        grouped: dict[Any, list] = {key: [] for key in keys}
+        column = _quote(reverse_column)
+        placeholders = ", ".join("?" * len(keys))
+
+        if keys and sub_items == ["count"]:
+            for key, cnt in conn.execute(
+                f"SELECT {column}, COUNT(*) FROM {relation_table} WHERE {column} IN ({placeholders}) GROUP BY {column}", keys
+            ):
+                grouped[key] = cnt
+            for result, row in zip(results, rows):
+                result[relation] = [{"count": grouped.get(row["id"]) or 0}]
+            return
+
+        if keys:
+            found = [dict(row) for row in conn.execute(
+                f"SELECT * FROM {relation_table} WHERE {column} IN ({placeholders})", keys
+            )]
+            for row, projected in zip(found, self._project(relation, found, sub_items)):
+                grouped[row[reverse_column]].append(projected)
+        for result, row in zip(results, rows):
+            result[relation] = grouped.get(row["id"], [])
+
+    def _insert(self, builder: LocalQueryBuilder) -> LocalAPIResponse:
+        records = builder.json if isinstance(builder.json, list) else [builder.json]
+        table = _quote(builder.table)
+        columns = self._columns(builder.table)
+        inserted = []
+
+        with self._write() as conn:
+            for record in records:
+                record = dict(record)
+                if "created_at" in columns and not record.get("created_at"):
+                    record["created_at"] = _now_iso()
+                names = list(record)
+                sql = (
+                    f"INSERT INTO {table} ({', '.join(_quote(n) for n in names)}) "
+                    f"VALUES ({', '.join('?' * len(names))})"
+                )
+                if builder.on_conflict:
+                    targets = ", ".join(_quote(c.strip()) for c in builder.on_conflict.split(","))
+                    updates = [n for n in names if n not in builder.on_conflict.split(",") and n != "created_at"]
+                    if builder.ignore_duplicates or not updates:
+                        sql += f" ON CONFLICT ({targets}) DO NOTHING"
+                    else:
+                        sql += f" ON CONFLICT ({targets}) DO UPDATE SET " + ", ".join(
+                            f"{_quote(n)} = excluded.{_quote(n)}" for n in updates
+                        )
+                row = conn.execute(sql + " RETURNING *", [record[n] for n in names]).fetchone()
+                if row is not None:
+                    inserted.append(dict(row))
+
+        return LocalAPIResponse(data=inserted, count=len(inserted) if builder.count else None)
+
+    def _update(self, builder: LocalQueryBuilder) -> LocalAPIResponse:
+        where, args = self._where(builder.params)
+        names = list(builder.json)
+        assignments = ", ".join(f"{_quote(n)} = ?" for n in names)
+        with self._write() as conn:
+            rows = conn.execute(
+                f"UPDATE {_quote(builder.table)} SET {assignments}{where} RETURNING *",
+                [builder.json[n] for n in names] + args,
+            ).fetchall()
+        data = [dict(row) for row in rows]
+        return LocalAPIResponse(data=data, count=len(data) if builder.count else None)
+
+    def _delete(self, builder: LocalQueryBuilder) -> LocalAPIResponse:
+        where, args = self._where(builder.params)
+        with self._write() as conn:
+            rows = conn.execute(f"DELETE FROM {_quote(builder.table)}{where} RETURNING *", args).fetchall()
+        data = [dict(row) for row in rows]
+        return LocalAPIResponse(data=data, count=len(data) if builder.count else None)
+
+    def _execute_rpc(self, builder: LocalRPCBuilder) -> LocalAPIResponse:
+        fn = self.rpc_functions.get(builder.fn)
+        if fn is None:
+            raise LocalAPIError(f"Could not find the function public.{builder.fn}")
+        try:
+            with self._write() as conn:
+                return LocalAPIResponse(data=fn(conn, builder.json))
+        except sqlite3.Error as e:
+            raise LocalAPIError(str(e)) from e
+
+    def _columns(self, table: str) -> set[str]:
+        return {row["name"] for row in self._connection().execute(f"PRAGMA table_xinfo({_quote(table)})")}
+
+
+# ============================================
+# DB 함수 (supabase/migrations 대응)
+# ============================================
+
+def _rpc_increment_post_view_counts(conn: sqlite3.Connection, params: dict) -> None:
+    if len(params["p_post_ids"]) != len(params["p_deltas"]):
+        raise LocalAPIError("p_post_ids와 p_deltas의 길이가 다릅니다.")
+    if any(delta is None or delta <= 0 for delta in params["p_deltas"]):
+        raise LocalAPIError("조회수 증가분은 양수여야 합니다.")
+    conn.executemany(
+        "UPDATE posts SET view_count = COALESCE(view_count, 0) + ? WHERE id = ?",
+        [(delta, post_id) for post_id, delta in zip(params["p_post_ids"], params["p_deltas"])],
+    )
+
+
+def _rpc_reconcile_post_comment_counts(conn: sqlite3.Connection, params: dict) -> int:
+    return conn.execute("""
+        UPDATE posts
+        SET comment_count = (SELECT COUNT(*) FROM comments c WHERE c.post_id = posts.id)
+        WHERE comment_count IS NOT (SELECT COUNT(*) FROM comments c WHERE c.post_id = posts.id)
+    """).rowcount
+
+
+def create_local_client(db_path: Optional[str] = None) -> LocalClient:
+    """
+    로컬 SQLite 클라이언트 생성
+
+    Args:
+        db_path: DB 파일 경로 (기본값: LOCAL_DB_PATH 환경변수 또는 .local/campuslink.db)
+
+    Example:
+        >>> client = create_local_client()
+        >>> client.table("posts").select("*, users(nickname)").eq("school_id", 1).execute()
+    """
+    return LocalClient(db_path or os.getenv("LOCAL_DB_PATH") or DEFAULT_DB_PATH)
@@ -0,0 +1,107 @@
+"""
+데이터 접근 계층
+여러 페이지가 공통으로 쓰는 조회를 모아 스크립트 재실행(rerun) 1회 동안 메모이즈 - 같은 쿼리는 재실행당 최대 1회
+"""
+
+from typing import Any, Callable, Hashable, Optional
+
+from utils.script_context import current_rerun_token
+from utils.supabase_client import get_supabase_client
+
+# 재실행 메모를 보관하는 session_state 키
+_MEMO_KEY = "_repository_memo"
+
+
+def _rerun_memo() -> Optional[dict]:
+    """현재 재실행의 메모 (스크립트 실행 중이 아니면 None - 메모이즈하지 않음)"""
+    token = current_rerun_token()
+    if token is None:
+        return None
+
+    import streamlit as st
+
+    entry = st.session_state.get(_MEMO_KEY)
+    if entry is None or entry[0] is not token:
+        entry = (token, {})
+        st.session_state[_MEMO_KEY] = entry
+    return entry[1]
+
+
+def memoize(key: Hashable, loader: Callable[[], Any]) -> Any:
+    """
+    재실행 메모 조회 - 없으면 loader() 결과를 저장 (예외는 저장하지 않음)
+
+    Example:
+        >>> memoize(("user_schools", user_id), lambda: fetch_user_schools(user_id))
+    """
+    memo = _rerun_memo()
+    if memo is None:
+        return loader()
+
+    if key not in memo:
+        memo[key] = loader()
+    return memo[key]
+
+
+def invalidate(kind: str, *args) -> None:
+    """
+    쓰기 후 메모 무효화
+
+    Args:
+        kind: 조회 종류 (예: "user_schools")
+        args: 키 인자 - 생략하면 해당 종류 전체 무효화
+    """
+    memo = _rerun_memo()
+    if memo is None:
+        return
+
+    prefix = (kind, *(str(arg) for arg in args))
+    for key in [key for key in memo if key[:len(prefix)] == prefix]:
+        del memo[key]
+
+
+# ============================================
+# 관심 학교
+# ============================================
+
+def _fetch_user_schools(user_id) -> list:
+    supabase = get_supabase_client()
+    response = supabase.table("user_schools").select("""
+        id,
+        school_id,
+        schools (
+            id,
+            name
+        )
+    """).eq("user_id", user_id).execute()
+
+    return [
+        {
+            "id": item["schools"]["id"],
+            "name": item["schools"]["name"],
+            "user_school_id": item["id"],  # user_schools 테이블의 ID
+        }
+        for item in response.data or []
+        if item.get("schools")
+    ]
+
+
+def get_user_schools(user_id) -> list:
+    """
+    사용자의 관심 학교 목록 (재실행당 쿼리 1회)
+
+    Returns:
+        list: [{"id", "name", "user_school_id"}] - 호출마다 새 dict로 반환하므로 수정해도 메모에 영향 없음
+    """
+    schools = memoize(("user_schools", str(user_id)), lambda: _fetch_user_schools(user_id))
+    return [dict(school) for school in schools]
+
+
+def count_user_schools(user_id) -> int:
+    """사용자의 관심 학교 개수 (관심 학교 목록 메모를 공유하므로 추가 쿼리 없음)"""
+    return len(memoize(("user_schools", str(user_id)), lambda: _fetch_user_schools(user_id)))
+
+
+def invalidate_user_schools(user_id) -> None:
+    """관심 학교 추가/삭제 후 호출"""
+    invalidate("user_schools", user_id)
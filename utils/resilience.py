@@ -0,0 +1,410 @@
+"""
+Supabase 요청 복원력 정책
+읽기 요청 재시도(지터 백오프), 서킷 브레이커(차단 중 최근 조회 결과 제공), 헤지 요청을 클라이언트 프록시로 적용하고 지표로 집계
+"""
+
+import logging
+import queue
+import random
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Hashable, Optional
+
+from config.settings import (
+    SUPABASE_CIRCUIT_FAILURE_THRESHOLD,
+    SUPABASE_CIRCUIT_RESET_SECONDS,
+    SUPABASE_HEDGE_AFTER_MS,
+    SUPABASE_RETRY_ATTEMPTS,
+    SUPABASE_RETRY_BASE_DELAY_SECONDS,
+    SUPABASE_RETRY_MAX_DELAY_SECONDS,
+    SUPABASE_STALE_MAX_AGE_SECONDS,
+    SUPABASE_STALE_MAX_ENTRIES,
+)
+from utils.concurrent_fetch import _attach_script_run_ctx
+from utils.single_flight import query_fingerprint
+
+logger = logging.getLogger("campuslink.resilience")
+
+# 재시도/헤지/최근 결과 제공 대상 (멱등 읽기 요청)
+_READ_METHODS = ("GET", "HEAD")
+
+# 일시 오류로 보는 HTTP 상태 코드
+_TRANSIENT_STATUS_CODES = {"408", "429", "500", "502", "503", "504"}
+
+# 일시 오류로 보는 PostgreSQL 오류 코드 (문장 타임아웃, 직렬화 실패, 교착 상태, 연결 수 초과, 관리자 종료)
+_TRANSIENT_PG_CODES = {"57014", "40001", "40P01", "53300", "57P01"}
+
+
+class BackendUnavailableError(Exception):
+    """서킷이 열려 있거나 재시도가 모두 실패했고 대신 제공할 최근 결과도 없는 경우"""
+
+    def __init__(self, message: str = "서버가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해주세요."):
+        super().__init__(message)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    재시도하면 성공할 수 있는 일시 오류인지 확인
+
+    네트워크/타임아웃 오류, 5xx/429 응답, DB 타임아웃·교착 상태 등은 일시 오류이고,
+    권한/제약 조건 위반 같은 4xx 오류는 다시 보내도 같은 결과이므로 일시 오류가 아닙니다.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+
+    # 로컬 SQLite 백엔드의 잠금 경합
+    if isinstance(error, sqlite3.OperationalError):
+        message = str(error).lower()
+        return "locked" in message or "busy" in message
+
+    try:
+        import httpx
+    except ImportError:
+        httpx = None
+    if httpx is not None:
+        if isinstance(error, httpx.TransportError):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            return str(error.response.status_code) in _TRANSIENT_STATUS_CODES
+
+    # postgrest APIError (JSON이 아닌 오류 응답은 code에 HTTP 상태 코드가 들어 있음)
+    code = getattr(error, "code", None)
+    if code is not None:
+        code = str(code)
+        return code in _TRANSIENT_STATUS_CODES or code in _TRANSIENT_PG_CODES or code.startswith("08")
+
+    return False
+
+
+class ResilienceMetrics:
+    """
+    복원력 지표 카운터 (프로세스 전체)
+
+    - retries: 읽기 요청 재시도 횟수
+    - retries_exhausted: 재시도를 모두 사용하고도 실패한 읽기 요청 수
+    - circuit_opened: 서킷 차단(trip) 횟수
+    - circuit_rejected: 서킷 차단 중 백엔드로 보내지 않은 요청 수
+    - stale_served: 최근 조회 결과로 대신 응답한 횟수
+    - hedged / hedge_won: 헤지 요청을 보낸 횟수 / 헤지 요청이 먼저 성공한 횟수
+    """
+
+    def __init__(self):
+        self._counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+
+class CircuitBreaker:
+    """
+    연속 일시 오류 기반 서킷 브레이커
+
+    - closed: 모든 요청 통과, 일시 오류가 failure_threshold번 연속되면 open
+    - open: reset_seconds 동안 요청을 보내지 않음
+    - half_open: 대기 시간이 지나면 요청 1개만 시험으로 통과 - 성공하면 closed, 실패하면 다시 open
+
+    일시 오류가 아닌 오류(4xx)는 백엔드가 응답한 것이므로 성공으로 취급합니다.
+    """
+
+    def __init__(
+        self,
+        metrics: ResilienceMetrics,
+        failure_threshold: int = SUPABASE_CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds: float = SUPABASE_CIRCUIT_RESET_SECONDS,
+    ):
+        self.metrics = metrics
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """요청을 백엔드로 보내도 되는지 확인 (half_open 전환 시 호출한 요청이 시험 요청이 됨)"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_seconds:
+                self.state = "half_open"
+                return True
+
+        self.metrics.incr("circuit_rejected")
+        return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self.state == "closed":
+                return
+            self.state = "closed"
+        logger.info("서킷 복구: 백엔드 응답 정상")
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == "open":
+                return
+            if self.state == "closed" and self._failures < self.failure_threshold:
+                return
+            self.state = "open"
+            self._opened_at = time.monotonic()
+            failures = self._failures
+
+        self.metrics.incr("circuit_opened")
+        logger.warning("서킷 차단: 연속 일시 오류 %d회, %s초 동안 요청 중단", failures, self.reset_seconds)
+
+
+class StaleResponseCache:
+    """
+    읽기 요청별 마지막 성공 응답 (서킷 차단 중 대신 제공)
+
+    - (인증 헤더, 쿼리 지문) 키로 보관하여 다른 사용자의 조회 결과를 제공하지 않음
+    - max_age_seconds가 지난 응답은 제공하지 않음
+    - 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+
+    보관된 응답은 여러 세션이 공유하므로 읽기 전용으로 다뤄야 합니다.
+    """
+
+    def __init__(self, max_entries: int = SUPABASE_STALE_MAX_ENTRIES, max_age_seconds: float = SUPABASE_STALE_MAX_AGE_SECONDS):
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.max_age_seconds:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, response: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _auth_key(builder: Any) -> str:
+    """요청의 인증 헤더 (로컬 백엔드 빌더는 빈 문자열)"""
+    headers = getattr(getattr(builder, "request", None), "headers", None) or {}
+    return headers.get("authorization", "")
+
+
+class ResiliencePolicy:
+    """
+    execute() 실행 정책
+
+    - 읽기(GET/HEAD): 일시 오류 시 전체 지터 지수 백오프로 재시도, 실패하거나 서킷이 열려 있으면 최근 조회 결과로 응답
+    - 쓰기(POST/PATCH/DELETE, RPC 포함): 재시도하지 않고, 서킷이 열려 있으면 바로 실패
+    - hedge_after_ms > 0이면 읽기 요청이 그 시간 안에 끝나지 않을 때 같은 요청을 한 번 더 보내 먼저 성공한 응답 사용
+    """
+
+    def __init__(
+        self,
+        attempts: int = SUPABASE_RETRY_ATTEMPTS,
+        base_delay: float = SUPABASE_RETRY_BASE_DELAY_SECONDS,
+        max_delay: float = SUPABASE_RETRY_MAX_DELAY_SECONDS,
+        hedge_after_ms: float = SUPABASE_HEDGE_AFTER_MS,
+    ):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge_after_ms = hedge_after_ms
+        self.metrics = ResilienceMetrics()
+        self.breaker = CircuitBreaker(self.metrics)
+        self.stale = StaleResponseCache()
+
+    def execute(self, builder: Any) -> Any:
+        fingerprint = query_fingerprint(builder)
+        if fingerprint[0] not in _READ_METHODS:
+            return self._execute_write(builder)
+
+        key = (_auth_key(builder), fingerprint)
+        error: Optional[Exception] = None
+
+        for attempt in range(self.attempts):
+            if not self.breaker.allow():
+                return self._fallback(key, error)
+
+            try:
+                response = self._attempt(builder)
+            except Exception as e:
+                if not is_transient_error(e):
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                error = e
+            else:
+                self.breaker.record_success()
+                self.stale.set(key, response)
+                return response
+
+            if attempt + 1 < self.attempts:
+                self.metrics.incr("retries")
+                time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+
+        self.metrics.incr("retries_exhausted")
+        logger.warning("읽기 요청 재시도 %d회 모두 실패: %s %s", self.attempts, fingerprint[1], error)
+        return self._fallback(key, error)
+
+    def _execute_write(self, builder: Any) -> Any:
+        if not self.breaker.allow():
+            raise BackendUnavailableError()
+
+        try:
+            response = builder.execute()
+        except Exception as e:
+            if is_transient_error(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+
+        self.breaker.record_success()
+        return response
+
+    def _fallback(self, key: Hashable, error: Optional[Exception]) -> Any:
+        """최근 조회 결과로 응답 (없으면 마지막 오류 또는 BackendUnavailableError)"""
+        response = self.stale.get(key)
+        if response is not None:
+            self.metrics.incr("stale_served")
+            return response
+        if error is not None:
+            raise error
+        raise BackendUnavailableError()
+
+    def _attempt(self, builder: Any) -> Any:
+        """요청 1회 (헤지 사용 시 지연되면 같은 요청을 한 번 더 보냄)"""
+        if self.hedge_after_ms <= 0:
+            return builder.execute()
+
+        results: queue.Queue = queue.Queue()
+
+        def run(index: int) -> None:
+            try:
+                results.put((index, True, builder.execute()))
+            except Exception as e:
+                results.put((index, False, e))
+
+        def start(index: int) -> None:
+            thread = threading.Thread(target=run, args=(index,), name=f"hedge-{index}", daemon=True)
+            _attach_script_run_ctx(thread)
+            thread.start()
+
+        start(0)
+        pending = 1
+        try:
+            outcome = results.get(timeout=self.hedge_after_ms / 1000)
+        except queue.Empty:
+            self.metrics.incr("hedged")
+            start(1)
+            pending = 2
+            outcome = results.get()
+
+        # 먼저 끝난 요청이 실패했으면 나머지 요청 결과를 기다림
+        if not outcome[1] and pending == 2:
+            outcome = results.get()
+
+        index, ok, value = outcome
+        if not ok:
+            raise value
+        if index == 1:
+            self.metrics.incr("hedge_won")
+        return value
+
+
+class ResilientBuilder:
+    """요청 빌더 프록시 - 체이닝은 그대로 위임하고 execute()에 정책 적용"""
+
+    def __init__(self, builder: Any, policy: ResiliencePolicy):
+        self._builder = builder
+        self._policy = policy
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            return attr
+
+        def chained(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return ResilientBuilder(result, self._policy) if hasattr(result, "execute") else result
+        return chained
+
+    def execute(self) -> Any:
+        return self._policy.execute(self._builder)
+
+
+class ResilientClient:
+    """Supabase 클라이언트 프록시 - table()/from_()/rpc()가 반환하는 빌더에 정책 적용 (auth 등은 그대로 위임)"""
+
+    def __init__(self, client: Any, policy: ResiliencePolicy):
+        self._client = client
+        self._policy = policy
+
+    def table(self, table_name: str) -> ResilientBuilder:
+        return ResilientBuilder(self._client.table(table_name), self._policy)
+
+    def from_(self, table_name: str) -> ResilientBuilder:
+        return ResilientBuilder(self._client.from_(table_name), self._policy)
+
+    def rpc(self, fn: str, *args, **kwargs) -> ResilientBuilder:
+        return ResilientBuilder(self._client.rpc(fn, *args, **kwargs), self._policy)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+# 전역 싱글톤 인스턴스 (서킷 상태와 지표는 모든 세션 클라이언트가 공유)
+_policy: Optional[ResiliencePolicy] = None
+_policy_lock = threading.Lock()
+
+
+def get_resilience_policy() -> ResiliencePolicy:
+    """
+    복원력 정책 인스턴스 반환 (싱글톤 패턴)
+
+    Example:
+        >>> policy = get_resilience_policy()
+        >>> policy.breaker.state
+        'closed'
+    """
+    global _policy
+
+    if _policy is None:
+        with _policy_lock:
+            if _policy is None:
+                _policy = ResiliencePolicy()
+
+    return _policy
+
+
+def resilient_client(client: Any) -> ResilientClient:
+    """
+    클라이언트에 복원력 정책 적용
+
+    Example:
+        >>> client = resilient_client(create_client(url, key))
+        >>> client.table("posts").select("*").execute()  # 일시 오류 시 재시도
+    """
+    return client if isinstance(client, ResilientClient) else ResilientClient(client, get_resilience_policy())
+
+
+def get_resilience_metrics() -> dict[str, int]:
+    """재시도/서킷 차단/최근 결과 제공/헤지 지표 (0인 항목은 생략)"""
+    return get_resilience_policy().metrics.snapshot()
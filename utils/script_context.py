@@ -0,0 +1,30 @@
+"""
+Streamlit 스크립트 실행 컨텍스트 조회
+현재 세션/재실행(rerun)을 식별 - 스크립트 실행 스레드 밖(명령줄 스크립트, 백그라운드 스레드)에서는 None
+"""
+
+from typing import Any, Optional
+
+
+def _get_ctx():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    return get_script_run_ctx(suppress_warning=True)
+
+
+def current_session_id() -> Optional[str]:
+    """현재 Streamlit 세션 ID"""
+    ctx = _get_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+def current_rerun_token() -> Optional[Any]:
+    """
+    현재 재실행을 식별하는 객체 (is로 비교)
+
+    ScriptRunContext.reset()이 재실행마다 커서 딕셔너리를 새로 만들므로 그 객체를 식별자로 사용합니다.
+    """
+    ctx = _get_ctx()
+    return ctx.cursors if ctx is not None else None
@@ -0,0 +1,179 @@
+"""
+서버 측 세션 저장소
+로그인 상태(사용자 정보, 토큰)를 로컬 SQLite에 TTL과 함께 보관하고 서명된 쿠키의 세션 ID로 조회 - 새로고침 시 네트워크 호출 없이 복원
+(SESSION_STORE_PATH로 파일 경로, SESSION_COOKIE_SECRET으로 쿠키 서명 키 지정)
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, is_dataclass
+from typing import Any, Optional
+
+from config.settings import SESSION_STORE_TTL_SECONDS
+
+# 기본 저장소 파일 경로
+DEFAULT_SESSION_STORE_PATH = os.path.join(".local", "sessions.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_expires_idx ON sessions (expires_at);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# 세션을 새로 만들 때 이 확률로 만료된 세션 정리
+_PURGE_PROBABILITY = 0.01
+
+
+def dump_user(user: Any) -> Optional[dict]:
+    """Auth 사용자 객체를 JSON으로 저장 가능한 값으로 변환 (gotrue User 또는 로컬 백엔드 LocalUser)"""
+    if user is None:
+        return None
+    if hasattr(user, "model_dump"):
+        return {"type": "gotrue", "data": user.model_dump(mode="json")}
+    if is_dataclass(user):
+        return {"type": "local", "data": asdict(user)}
+    return None
+
+
+def load_user(value: Optional[dict]) -> Any:
+    """dump_user()로 저장한 값을 Auth 사용자 객체로 복원"""
+    if not value:
+        return None
+    if value["type"] == "gotrue":
+        from supabase_auth.types import User
+        return User.model_validate(value["data"])
+    from utils.local_backend import LocalUser
+    return LocalUser(**value["data"])
+
+
+class SessionStore:
+    """
+    세션 ID → 로그인 상태 저장소
+
+    - 세션 ID는 추측할 수 없는 난수이고, 쿠키에는 HMAC 서명을 붙여 저장 (sign/unsign)
+    - 저장/갱신 시마다 ttl_seconds만큼 만료 시각 연장
+    - 스레드마다 별도 SQLite 연결을 사용 (WAL 모드)
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = SESSION_STORE_TTL_SECONDS, secret: Optional[str] = None):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self._connection()
+        with conn:
+            conn.executescript(SCHEMA)
+
+        self._secret = (secret or os.getenv("SESSION_COOKIE_SECRET") or self._stored_secret()).encode()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _stored_secret(self) -> str:
+        """서명 키 환경변수가 없으면 저장소에 한 번 생성한 키 사용 (서버 재시작 후에도 쿠키 유지)"""
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('cookie_secret', ?)",
+                (secrets.token_urlsafe(32),),
+            )
+        return conn.execute("SELECT value FROM meta WHERE key = 'cookie_secret'").fetchone()[0]
+
+    def _signature(self, session_id: str) -> str:
+        digest = hmac.new(self._secret, session_id.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+    def sign(self, session_id: str) -> str:
+        """쿠키 값 (세션 ID.서명)"""
+        return f"{session_id}.{self._signature(session_id)}"
+
+    def unsign(self, cookie_value: Optional[str]) -> Optional[str]:
+        """쿠키 값의 서명을 확인하고 세션 ID 반환 (위조/형식 오류 시 None)"""
+        if not cookie_value or "." not in cookie_value:
+            return None
+        session_id, signature = cookie_value.rsplit(".", 1)
+        if not hmac.compare_digest(signature, self._signature(session_id)):
+            return None
+        return session_id
+
+    def create(self, data: dict) -> str:
+        """새 세션 저장 후 세션 ID 반환"""
+        session_id = secrets.token_urlsafe(24)
+        self.save(session_id, data)
+        if secrets.randbelow(int(1 / _PURGE_PROBABILITY)) == 0:
+            self.purge_expired()
+        return session_id
+
+    def save(self, session_id: str, data: dict) -> None:
+        """세션 저장 또는 덮어쓰기 (만료 시각 연장)"""
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (id, data, expires_at) VALUES (?, ?, ?)",
+                (session_id, json.dumps(data, ensure_ascii=False, default=str), time.time() + self.ttl_seconds),
+            )
+
+    def load(self, session_id: str) -> Optional[dict]:
+        """만료되지 않은 세션 조회 (없으면 None)"""
+        row = self._connection().execute(
+            "SELECT data FROM sessions WHERE id = ? AND expires_at > ?", (session_id, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, session_id: str) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def purge_expired(self) -> int:
+        """만료된 세션 삭제 후 삭제 개수 반환"""
+        conn = self._connection()
+        with conn:
+            return conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (time.time(),)).rowcount
+
+
+# 전역 싱글톤 인스턴스
+_session_store: Optional[SessionStore] = None
+_session_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """
+    세션 저장소 인스턴스 반환 (싱글톤 패턴)
+
+    Example:
+        >>> store = get_session_store()
+        >>> session_id = store.create({"access_token": "..."})
+        >>> store.load(store.unsign(store.sign(session_id)))
+    """
+    global _session_store
+
+    if _session_store is None:
+        with _session_store_lock:
+            if _session_store is None:
+                _session_store = SessionStore(os.getenv("SESSION_STORE_PATH") or DEFAULT_SESSION_STORE_PATH)
+
+    return _session_store
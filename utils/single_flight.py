@@ -0,0 +1,109 @@
+"""
+동일 조회 요청 병합 (single-flight)
+같은 쿼리가 동시에 여러 세션에서 실행되면 먼저 시작한 요청 1개만 DB로 보내고 나머지는 그 결과를 공유
+"""
+
+import threading
+from typing import Any, Callable, Hashable
+
+from utils.instrumentation import request_signature
+
+# 응답 내용에 영향을 주는 요청 헤더 (count, 단건 조회 등)
+_RESPONSE_HEADERS = ("accept", "prefer", "range")
+
+
+class _Call:
+    """진행 중인 요청 1건"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    키별 진행 중 요청 병합
+
+    - 같은 키로 동시에 들어온 호출은 첫 호출(리더)의 결과나 예외를 그대로 받음
+    - 리더가 끝나면 키를 바로 제거하므로 결과를 보관하지 않음 (캐시가 아님)
+
+    공유된 결과는 여러 세션이 함께 사용하므로 읽기 전용으로 다뤄야 합니다.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+
+def query_fingerprint(builder: Any) -> tuple:
+    """
+    요청 빌더의 정규화된 지문
+
+    쿼리 파라미터는 순서와 관계없이 같은 요청이 같은 지문이 되도록 정렬하고,
+    응답 형태를 바꾸는 헤더(count/단건 조회)와 로컬 백엔드의 count 옵션을 포함합니다.
+    인증 헤더는 포함하지 않으므로 공개 데이터 조회에만 사용해야 합니다.
+    """
+    method, path, params = request_signature(builder)
+    request = getattr(builder, "request", None)
+    headers = getattr(request, "headers", None) or {}
+    return (
+        method.upper(),
+        path,
+        tuple(sorted(params)),
+        tuple((name, headers.get(name)) for name in _RESPONSE_HEADERS if headers.get(name)),
+        getattr(builder, "count", None) if request is None else None,
+    )
+
+
+# 전역 싱글톤 인스턴스
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """단일 비행 인스턴스 반환 (병합 통계 확인용)"""
+    return _single_flight
+
+
+def execute_shared(builder: Any) -> Any:
+    """
+    공개 데이터 조회 실행 - 동시에 실행 중인 동일 쿼리가 있으면 그 결과를 공유
+
+    GET/HEAD 이외의 요청은 병합하지 않고 그대로 실행합니다.
+
+    Example:
+        >>> query = supabase.table("posts").select("*").eq("school_id", school_id)
+        >>> response = execute_shared(query.limit(16))
+    """
+    fingerprint = query_fingerprint(builder)
+    if fingerprint[0] not in ("GET", "HEAD"):
+        return builder.execute()
+    return _single_flight.do(fingerprint, builder.execute)
@@ -0,0 +1,88 @@
+"""
+서버 시작 워밍업
+첫 사용자가 기다리지 않도록 Supabase 클라이언트 생성, HTTP 연결(TLS 핸드셰이크), 배너 변환본 생성을 미리 수행
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger("campuslink.startup")
+
+_warm_up_thread: Optional[threading.Thread] = None
+_warm_up_lock = threading.Lock()
+_warm_up_timings: dict[str, Optional[float]] = {}
+
+
+def _warm_client() -> None:
+    """supabase 패키지 임포트와 공용 클라이언트 생성"""
+    from utils.supabase_client import get_service_client
+    get_service_client()
+
+
+def _warm_connection() -> None:
+    """가벼운 조회 1회로 공유 HTTP 연결 풀에 연결을 열어 둠"""
+    from utils.supabase_client import get_service_client
+    get_service_client().table("schools").select("id").limit(1).execute()
+
+
+def _warm_banner() -> None:
+    """배너 크기별/WebP 변환본 생성"""
+    from utils.assets import ensure_banner_variants
+    ensure_banner_variants()
+
+
+# (단계 이름, 함수) - 순서대로 실행
+WARM_UP_STEPS: list[tuple[str, Callable[[], None]]] = [
+    ("client", _warm_client),
+    ("connection", _warm_connection),
+    ("banner", _warm_banner),
+]
+
+
+def warm_up() -> dict[str, Optional[float]]:
+    """
+    워밍업 단계를 순서대로 실행
+
+    한 단계가 실패해도(환경 변수 미설정, 네트워크 오류 등) 다음 단계를 계속 진행하고,
+    실패한 단계는 첫 요청에서 평소처럼 다시 시도됩니다.
+
+    Returns:
+        dict: 단계별 소요 시간(ms), 실패한 단계는 None
+    """
+    timings = {}
+    for name, step in WARM_UP_STEPS:
+        start = time.perf_counter()
+        try:
+            step()
+            timings[name] = round((time.perf_counter() - start) * 1000, 1)
+        except Exception as e:
+            timings[name] = None
+            logger.warning("워밍업 단계 실패 (%s): %s", name, e)
+
+    _warm_up_timings.update(timings)
+    return timings
+
+
+def start_warm_up() -> threading.Thread:
+    """
+    백그라운드 스레드에서 워밍업 시작 (프로세스당 한 번만 실행)
+
+    서버 시작 시(scripts.serve) 호출하고, streamlit run app.py로 실행한 경우를 위해
+    app.py에서도 호출합니다. 이미 시작된 경우 기존 스레드를 반환합니다.
+    """
+    global _warm_up_thread
+
+    if _warm_up_thread is None:
+        with _warm_up_lock:
+            if _warm_up_thread is None:
+                _warm_up_thread = threading.Thread(target=warm_up, name="warm-up", daemon=True)
+                _warm_up_thread.start()
+
+    return _warm_up_thread
+
+
+def get_warm_up_timings() -> dict[str, Optional[float]]:
+    """마지막 워밍업의 단계별 소요 시간 (아직 끝나지 않았으면 빈 dict)"""
+    return dict(_warm_up_timings)
@@ -1,38 +1,82 @@
 """
 Supabase 클라이언트 초기화 및 관리
-싱글톤 패턴 - 전역 단일 인스턴스
+세션별 클라이언트 풀 - 세션마다 인증 상태 분리, HTTP 연결 풀은 공유
 """
 
 import os
-from typing import Optional
-from supabase import create_client, Client
-from dotenv import load_dotenv
+import threading
+from typing import TYPE_CHECKING, Optional
+from utils.instrumentation import instrument_client, instrumentation_enabled
+from utils.resilience import resilient_client
+from utils.client_pool import SessionClientPool, create_shared_http_client
+from utils.script_context import current_session_id
+from utils.identity import restore_auth_session
 
-# 환경 변수 로드
-load_dotenv()
+# supabase 패키지는 임포트에 수백 ms가 걸리므로 클라이언트를 처음 만들 때 불러옴
+if TYPE_CHECKING:
+    from supabase import Client
 
-# 전역 싱글톤 인스턴스
-_supabase_client: Optional[Client] = None
+# 세션 밖(스크립트, 백그라운드 스레드)에서 사용하는 공용 클라이언트
+_supabase_client: Optional["Client"] = None
 
+# service_role 키 클라이언트 (anon/authenticated에서 실행 권한을 회수한 DB 함수 호출용)
+_admin_client: Optional["Client"] = None
 
-def get_supabase_client() -> Client:
+# 세션별 클라이언트 풀 / 공유 HTTP 클라이언트
+_client_pool: Optional[SessionClientPool] = None
+_http_client = None
+_client_lock = threading.RLock()
+_env_loaded = False
+
+
+def _load_env():
+    """.env 파일의 환경 변수 로드 (프로세스당 한 번)"""
+    global _env_loaded
+    
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+def _get_http_client():
+    """모든 클라이언트가 공유하는 httpx 클라이언트 (keep-alive 연결 풀)"""
+    global _http_client
+    
+    if _http_client is None:
+        with _client_lock:
+            if _http_client is None:
+                _http_client = create_shared_http_client()
+    
+    return _http_client
+
+
+def create_supabase_client(service_role: bool = False) -> "Client":
     """
-    Supabase 클라이언트 인스턴스 반환 (싱글톤 패턴)
+    새 Supabase 클라이언트 생성
     
-    첫 호출 시에만 클라이언트를 생성하고, 이후에는 동일한 인스턴스를 반환합니다.
+    SUPABASE_BACKEND=sqlite 이면 Supabase 대신 로컬 SQLite 백엔드를 사용하고,
+    SUPABASE_INSTRUMENTATION=1 이면 쿼리 계측 프록시로 감쌉니다.
+    재시도/서킷 브레이커 정책은 계측 바깥에 적용되어 재시도한 요청도 각각 기록됩니다.
     
-    Returns:
-        Client: Supabase 클라이언트 객체
-        
-    Example:
-        >>> client = get_supabase_client()
-        >>> response = client.table('users').select("*").execute()
+    Args:
+        service_role: True면 SUPABASE_KEY 대신 SUPABASE_SERVICE_ROLE_KEY 사용
     """
-    global _supabase_client
+    _load_env()
     
-    if _supabase_client is None:
+    if os.getenv("SUPABASE_BACKEND", "").lower() == "sqlite":
+        # 오프라인 벤치마크/부하 테스트용 로컬 SQLite 백엔드
+        from utils.local_backend import create_local_client
+        client = create_local_client()
+    else:
         url = os.getenv("SUPABASE_URL")
-        key = os.getenv("SUPABASE_KEY")
+        key = os.getenv("SUPABASE_SERVICE_ROLE_KEY" if service_role else "SUPABASE_KEY")
+        
+        if service_role and url and not key:
+            raise ValueError(
+                "SUPABASE_SERVICE_ROLE_KEY가 설정되지 않았습니다.\n"
+                "관리용 DB 함수(조회수 반영, 댓글 수 보정)와 학교 목록 적재는 service_role 키로만 실행할 수 있습니다."
+            )
         
         if not url or not key:
             raise ValueError(
@@ -42,17 +86,157 @@ def get_supabase_client() -> Client:
                 "  SUPABASE_KEY=your_supabase_key"
             )
         
-        _supabase_client = create_client(url, key)
+        from supabase import create_client, ClientOptions
+        # 토큰 갱신은 utils.token_refresher가 세션 단위로 수행 (클라이언트별 자동 갱신 타이머 사용 안 함)
+        client = create_client(url, key, options=ClientOptions(
+            httpx_client=_get_http_client(),
+            auto_refresh_token=False,
+        ))
+    
+    if instrumentation_enabled():
+        client = instrument_client(client)
+    
+    return resilient_client(client)
+
+
+def _get_client_pool() -> SessionClientPool:
+    global _client_pool
+    
+    if _client_pool is None:
+        with _client_lock:
+            if _client_pool is None:
+                _client_pool = SessionClientPool(create_supabase_client)
+    
+    return _client_pool
+
+
+def _restore_session_auth(client: "Client"):
+    """
+    새로 만든 세션 클라이언트에 로그인 세션 복원
+    
+    유휴 시간 초과로 풀에서 제거된 뒤 다시 만들어진 경우에도 로그인 상태가 유지되도록
+    session_state의 토큰으로 인증 상태를 되살립니다. 토큰을 로컬에서 검증할 수 있으면
+    사용자 확인을 위한 Auth 서버 호출 없이 복원합니다.
+    
+    유휴 중에 액세스 토큰이 만료되어 복원 과정에서 갱신된 경우, 이전 리프레시 토큰은 폐기되므로
+    새 토큰을 session_state에 반영합니다 (세션 저장소 기록은 utils.auth가 이어서 갱신).
+    """
+    import streamlit as st
+    
+    access_token = st.session_state.get("access_token")
+    refresh_token = st.session_state.get("refresh_token")
+    
+    if access_token and refresh_token:
+        try:
+            session = restore_auth_session(client.auth, access_token, refresh_token, st.session_state.get("user"))
+        except Exception:
+            return
+        
+        if session is not None and session.refresh_token != refresh_token:
+            st.session_state.access_token = session.access_token
+            st.session_state.refresh_token = session.refresh_token
+            st.session_state.token_expires_at = session.expires_at
+
+
+def get_service_client() -> "Client":
+    """
+    세션과 무관한 공용 클라이언트 반환 (싱글톤 패턴)
+    
+    로그인하지 않으므로 백그라운드 스레드나 명령줄 스크립트에서 사용합니다.
+    
+    Example:
+        >>> get_service_client().table("schools").select("id").limit(1).execute()
+    """
+    global _supabase_client
+    
+    if _supabase_client is None:
+        with _client_lock:
+            if _supabase_client is None:
+                _supabase_client = create_supabase_client()
     
     return _supabase_client
 
 
+def get_admin_client() -> "Client":
+    """
+    service_role 키 클라이언트 반환 (싱글톤 패턴)
+    
+    RLS를 우회하므로 사용자 입력으로 만든 쿼리에는 사용하지 않고, 실행 권한을 service_role로
+    제한한 DB 함수를 백그라운드 스레드나 명령줄 스크립트에서 호출할 때만 사용합니다.
+    
+    Example:
+        >>> get_admin_client().rpc("reconcile_post_comment_counts").execute()
+    """
+    global _admin_client
+    
+    if _admin_client is None:
+        with _client_lock:
+            if _admin_client is None:
+                _admin_client = create_supabase_client(service_role=True)
+    
+    return _admin_client
+
+
+def get_supabase_client() -> "Client":
+    """
+    현재 세션의 Supabase 클라이언트 반환
+    
+    Streamlit 세션마다 별도 클라이언트를 사용하므로 한 사용자의 로그인/로그아웃이
+    다른 사용자의 인증 헤더를 바꾸지 않습니다. 세션 밖에서 호출하면 공용 클라이언트를 반환합니다.
+    
+    Returns:
+        Client: Supabase 클라이언트 객체
+        
+    Example:
+        >>> client = get_supabase_client()
+        >>> response = client.table('users').select("*").execute()
+    """
+    session_id = current_session_id()
+    if session_id is None:
+        return get_service_client()
+    
+    client, created = _get_client_pool().get(session_id)
+    if created:
+        _restore_session_auth(client)
+    
+    return client
+
+
+def peek_supabase_client() -> Optional["Client"]:
+    """
+    현재 세션에 이미 만들어진 클라이언트 반환 (없으면 새로 만들지 않고 None)
+    
+    새 클라이언트에는 복원할 로그인 세션이 없으므로, 세션 복원처럼
+    기존 클라이언트가 있을 때만 의미 있는 작업에서 사용합니다.
+    """
+    session_id = current_session_id()
+    if session_id is None or _client_pool is None:
+        return None
+    
+    return _client_pool.peek(session_id)
+
+
+def release_supabase_client():
+    """
+    현재 세션의 클라이언트를 풀에서 제거
+    
+    로그아웃 후 다음 요청에서 인증 상태가 없는 새 클라이언트를 사용하도록 할 때 호출합니다.
+    """
+    session_id = current_session_id()
+    if session_id is not None and _client_pool is not None:
+        _client_pool.discard(session_id)
+
+
 def reset_supabase_client():
     """
     Supabase 클라이언트 인스턴스 초기화
     
     테스트나 재연결이 필요한 경우 사용합니다.
     """
-    global _supabase_client
-    _supabase_client = None
-
+    global _supabase_client, _admin_client
+    
+    with _client_lock:
+        _supabase_client = None
+        _admin_client = None
+        if _client_pool is not None:
+            _client_pool.clear()
@@ -0,0 +1,228 @@
+"""
+액세스 토큰 백그라운드 갱신
+로그인한 세션의 토큰 만료 시각을 추적하여 만료 전에 작업 스레드에서 미리 갱신 - 페이지 렌더링 중에는 갱신을 기다리지 않음
+"""
+
+import heapq
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from config.settings import (
+    SUPABASE_CLIENT_IDLE_SECONDS,
+    TOKEN_REFRESH_AHEAD_SECONDS,
+    TOKEN_REFRESH_JITTER_SECONDS,
+    TOKEN_REFRESH_RETRY_SECONDS,
+)
+from utils.resilience import is_transient_error
+
+logger = logging.getLogger("campuslink.auth")
+
+
+@dataclass
+class RefreshedTokens:
+    """갱신된 토큰 (다음 재실행 때 session_state에 반영)"""
+    access_token: str
+    refresh_token: str
+    expires_at: int
+
+
+@dataclass
+class _TrackedSession:
+    client: Any
+    refresh_token: str
+    expires_at: int
+    due_at: float
+    last_seen: float
+    refreshed: Optional[RefreshedTokens] = None
+    on_refresh: Optional[Callable[[RefreshedTokens], None]] = None
+
+
+class TokenRefresher:
+    """
+    세션별 토큰 갱신 스케줄러
+
+    - track(): 로그인/재실행 시 세션의 토큰과 만료 시각 등록 (갱신 예정 시각 = 만료 - ahead - 지터)
+    - 세션 ID 하나에는 갱신 담당 항목 하나 - 같은 세션 ID로 더 오래된 토큰을 등록해도 추적 중인 새 토큰을 유지
+    - 작업 스레드 1개가 예정 시각이 된 세션의 클라이언트로 refresh_session() 호출
+    - 갱신 결과는 보관했다가 해당 세션의 다음 재실행에서 take_refreshed()로 가져감 (on_refresh가 있으면 작업 스레드에서 바로 전달)
+    - idle_seconds 동안 재실행이 없던 세션은 갱신하지 않고 추적 중단
+    - 일시 오류는 retry_seconds 후 재시도, 그 외 오류(폐기된 리프레시 토큰 등)는 추적 중단
+    """
+
+    def __init__(
+        self,
+        ahead_seconds: float = TOKEN_REFRESH_AHEAD_SECONDS,
+        jitter_seconds: float = TOKEN_REFRESH_JITTER_SECONDS,
+        retry_seconds: float = TOKEN_REFRESH_RETRY_SECONDS,
+        idle_seconds: float = SUPABASE_CLIENT_IDLE_SECONDS,
+    ):
+        self.ahead_seconds = ahead_seconds
+        self.jitter_seconds = jitter_seconds
+        self.retry_seconds = retry_seconds
+        self.idle_seconds = idle_seconds
+        self._sessions: dict[str, _TrackedSession] = {}
+        self._schedule: list[tuple[float, str]] = []
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def _due_at(self, expires_at: int) -> float:
+        return expires_at - self.ahead_seconds - random.uniform(0, self.jitter_seconds)
+
+    def track(
+        self,
+        session_id: str,
+        client: Any,
+        refresh_token: str,
+        expires_at: int,
+        on_refresh: Optional[Callable[[RefreshedTokens], None]] = None,
+    ) -> None:
+        """
+        세션 토큰 등록 또는 갱신 (같은 토큰이거나 추적 중인 토큰보다 오래된 토큰이면 마지막 사용 시각만 갱신)
+
+        같은 저장소 세션을 여러 Streamlit 세션이 함께 쓰면 아직 새 토큰을 반영하지 않은 세션이
+        이전 토큰을 등록할 수 있는데, 이를 받아들이면 이미 사용한 리프레시 토큰을 다시 갱신하게 됩니다.
+
+        Args:
+            on_refresh: 갱신 직후 작업 스레드에서 호출할 함수 (예: 세션 저장소에 새 토큰 기록)
+        """
+        now = time.time()
+        with self._condition:
+            tracked = self._sessions.get(session_id)
+            if tracked is not None and (tracked.refresh_token == refresh_token or expires_at < tracked.expires_at):
+                tracked.client = client
+                tracked.last_seen = now
+                tracked.on_refresh = on_refresh
+                return
+
+            tracked = _TrackedSession(
+                client=client,
+                refresh_token=refresh_token,
+                expires_at=expires_at,
+                due_at=self._due_at(expires_at),
+                last_seen=now,
+                on_refresh=on_refresh,
+            )
+            self._sessions[session_id] = tracked
+            heapq.heappush(self._schedule, (tracked.due_at, session_id))
+            self._condition.notify()
+
+        self._ensure_worker()
+
+    def take_refreshed(self, session_id: str, refresh_token: Optional[str]) -> Optional[RefreshedTokens]:
+        """
+        현재 토큰 이후에 갱신된 토큰 반환 (없으면 None, 네트워크 호출 없음)
+
+        Args:
+            refresh_token: session_state에 있는 현재 리프레시 토큰
+        """
+        with self._condition:
+            tracked = self._sessions.get(session_id)
+            if tracked is None or tracked.refreshed is None or tracked.refreshed.refresh_token == refresh_token:
+                return None
+            tracked.last_seen = time.time()
+            return tracked.refreshed
+
+    def untrack(self, session_id: str) -> None:
+        with self._condition:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._sessions)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._condition:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="token-refresher", daemon=True)
+                self._worker.start()
+
+    def _next_due(self) -> tuple[str, _TrackedSession]:
+        """예정 시각이 된 세션이 나올 때까지 대기 (잠금 안에서 호출)"""
+        while True:
+            while self._schedule:
+                due_at, session_id = self._schedule[0]
+                tracked = self._sessions.get(session_id)
+                # 토큰이 바뀌었거나 추적이 중단된 세션의 예전 예약은 버림
+                if tracked is None or tracked.due_at != due_at:
+                    heapq.heappop(self._schedule)
+                    continue
+                wait = due_at - time.time()
+                if wait <= 0:
+                    heapq.heappop(self._schedule)
+                    return session_id, tracked
+                break
+            else:
+                wait = None
+            self._condition.wait(timeout=wait)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                session_id, tracked = self._next_due()
+                if time.time() - tracked.last_seen > self.idle_seconds:
+                    del self._sessions[session_id]
+                    continue
+                client, refresh_token = tracked.client, tracked.refresh_token
+
+            try:
+                session = client.auth.refresh_session(refresh_token).session
+            except Exception as e:
+                self._on_failure(session_id, tracked, e)
+                continue
+
+            with self._condition:
+                if self._sessions.get(session_id) is not tracked:
+                    continue
+                tracked.refreshed = RefreshedTokens(session.access_token, session.refresh_token, int(session.expires_at))
+                tracked.refresh_token = session.refresh_token
+                tracked.expires_at = int(session.expires_at)
+                tracked.due_at = self._due_at(tracked.expires_at)
+                heapq.heappush(self._schedule, (tracked.due_at, session_id))
+                refreshed, on_refresh = tracked.refreshed, tracked.on_refresh
+
+            if on_refresh is not None:
+                try:
+                    on_refresh(refreshed)
+                except Exception as e:
+                    logger.warning("갱신된 토큰 전달 실패: %s", e)
+
+    def _on_failure(self, session_id: str, tracked: _TrackedSession, error: Exception) -> None:
+        with self._condition:
+            if self._sessions.get(session_id) is not tracked:
+                return
+            if is_transient_error(error) and time.time() < tracked.expires_at:
+                tracked.due_at = time.time() + self.retry_seconds * random.uniform(0.5, 1.5)
+                heapq.heappush(self._schedule, (tracked.due_at, session_id))
+                return
+            del self._sessions[session_id]
+
+        logger.warning("토큰 갱신 실패, 추적 중단: %s", error)
+
+
+# 전역 싱글톤 인스턴스
+_token_refresher: Optional[TokenRefresher] = None
+_token_refresher_lock = threading.Lock()
+
+
+def get_token_refresher() -> TokenRefresher:
+    """
+    토큰 갱신 스케줄러 인스턴스 반환 (싱글톤 패턴)
+
+    Example:
+        >>> refresher = get_token_refresher()
+        >>> refresher.track(session_id, client, refresh_token, expires_at)
+    """
+    global _token_refresher
+
+    if _token_refresher is None:
+        with _token_refresher_lock:
+            if _token_refresher is None:
+                _token_refresher = TokenRefresher()
+
+    return _token_refresher
@@ -0,0 +1,176 @@
+"""
+게시글 조회수 쓰기 지연(write-behind) 버퍼
+조회수 증가분을 게시글별로 모아 일정 주기마다 한 번에 DB에 반영
+"""
+
+import atexit
+import logging
+import threading
+import time
+from typing import Optional
+
+from config.settings import VIEW_COUNT_FLUSH_SECONDS, VIEW_COUNT_MAX_BACKOFF_SECONDS, VIEW_COUNT_MAX_PENDING
+from utils.supabase_client import get_admin_client
+
+logger = logging.getLogger("campuslink.view_counter")
+
+
+def _post_key(post_id) -> Optional[int]:
+    """게시글 ID를 버퍼 키(양의 정수)로 변환 (유효하지 않으면 None)"""
+    try:
+        key = int(post_id)
+    except (TypeError, ValueError):
+        return None
+    return key if key > 0 else None
+
+
+def _increment_view_counts(deltas: dict[int, int]) -> int:
+    """
+    increment_post_view_counts RPC로 여러 게시글의 조회수를 원자적으로 증가
+
+    유효하지 않은 게시글 ID나 양수가 아닌 증가분은 재시도해도 실패하므로 보내지 않고 버립니다.
+
+    Returns:
+        int: 반영한 게시글 수
+    """
+    deltas = {post_id: delta for post_id, delta in deltas.items() if _post_key(post_id) and delta > 0}
+    if not deltas:
+        return 0
+    # 실행 권한이 service_role로 제한된 함수이므로 관리용 클라이언트 사용 (백그라운드 스레드에서도 호출)
+    supabase = get_admin_client()
+    supabase.rpc("increment_post_view_counts", {
+        "p_post_ids": [int(post_id) for post_id in deltas],
+        "p_deltas": list(deltas.values())
+    }).execute()
+    return len(deltas)
+
+
+class ViewCountBuffer:
+    """
+    조회수 증가분 버퍼
+
+    - add(): 메모리에서 게시글별 증가분만 합산 (DB 호출 없음)
+    - 백그라운드 스레드가 flush_interval마다 모아 둔 증가분을 RPC 1회로 반영
+    - 대기 중인 게시글이 max_pending개를 넘으면 주기를 기다리지 않고 바로 반영
+    - 반영에 실패한 증가분은 버퍼에 되돌리고, 재시도 간격을 max_backoff까지 2배씩 늘림
+      (재시도 시각 전에는 max_pending을 넘어도 바로 반영하지 않으므로 조회마다 실패한 백엔드를 호출하지 않음)
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = VIEW_COUNT_FLUSH_SECONDS,
+        max_pending: int = VIEW_COUNT_MAX_PENDING,
+        max_backoff: float = VIEW_COUNT_MAX_BACKOFF_SECONDS,
+    ):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_backoff = max_backoff
+        self._backoff = 0.0
+        self._retry_at = 0.0
+        self._pending: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def add(self, post_id, delta: int = 1) -> None:
+        """
+        조회수 증가분 추가 (flush_interval이 0이면 버퍼 없이 즉시 반영)
+
+        Raises:
+            ValueError: post_id가 게시글 ID 형식(양의 정수)이 아닌 경우
+        """
+        key = _post_key(post_id)
+        if key is None:
+            raise ValueError(f"유효하지 않은 게시글 ID입니다: {post_id!r}")
+
+        if self.flush_interval <= 0:
+            _increment_view_counts({key: delta})
+            return
+
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + delta
+            should_wakeup = len(self._pending) >= self.max_pending and time.monotonic() >= self._retry_at
+
+        self._ensure_worker()
+        if should_wakeup:
+            self._wakeup.set()
+
+    def pending(self, post_id) -> int:
+        """아직 DB에 반영되지 않은 증가분 (화면 표시용)"""
+        key = _post_key(post_id)
+        if key is None:
+            return 0
+        with self._lock:
+            return self._pending.get(key, 0)
+
+    def flush(self) -> int:
+        """
+        모아 둔 증가분을 DB에 반영
+
+        Returns:
+            int: 반영된 게시글 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                deltas, self._pending = self._pending, {}
+
+            if not deltas:
+                return 0
+
+            try:
+                applied = _increment_view_counts(deltas)
+            except Exception as e:
+                # 실패한 증가분은 되돌려 재시도 (add()가 키를 검증하므로 일시 오류만 해당)
+                with self._lock:
+                    for post_id, delta in deltas.items():
+                        self._pending[post_id] = self._pending.get(post_id, 0) + delta
+                    self._backoff = min(self.max_backoff, max(self.flush_interval, self._backoff * 2))
+                    self._retry_at = time.monotonic() + self._backoff
+                logger.warning("조회수 반영 실패, %.1f초 후 재시도: %s", self._backoff, e)
+                return 0
+
+            with self._lock:
+                self._backoff = 0.0
+                self._retry_at = 0.0
+            return applied
+
+    def _ensure_worker(self) -> None:
+        """백그라운드 반영 스레드 시작 (최초 1회)"""
+        if self._worker is not None:
+            return
+
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="view-count-flusher", daemon=True)
+                self._worker.start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            # 실패 후에는 재시도 시각까지 기다림 (그 전에는 add()도 깨우지 않음)
+            self._wakeup.wait(max(self.flush_interval, self._retry_at - time.monotonic()))
+            self._wakeup.clear()
+            self.flush()
+
+
+# 전역 싱글톤 인스턴스
+_view_count_buffer: Optional[ViewCountBuffer] = None
+_view_count_buffer_lock = threading.Lock()
+
+
+def get_view_count_buffer() -> ViewCountBuffer:
+    """
+    조회수 버퍼 인스턴스 반환 (싱글톤 패턴)
+
+    Example:
+        >>> get_view_count_buffer().add(post_id)
+    """
+    global _view_count_buffer
+
+    if _view_count_buffer is None:
+        with _view_count_buffer_lock:
+            if _view_count_buffer is None:
+                _view_count_buffer = ViewCountBuffer()
+
+    return _view_count_buffer